@@ -0,0 +1,81 @@
+"""This module measures the cold-start time of Workload-Runner.
+
+Each measurement starts a fresh interpreter, so it includes interpreter start-up
+and every import made by main.py.
+
+Typical usage example:
+
+  python3 ./benchmarks/cold_start.py --repeat 20
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+
+
+def time_command(argv: List[str], repeat: int) -> List[float]:
+    """Runs a command repeatedly and times each run.
+
+    Args:
+        argv: The command-line to run.
+        repeat: The number of runs.
+
+    Returns:
+        The wall-clock time of each run (in seconds).
+    """
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run(argv, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start_time)
+    return timings
+
+
+def report(name: str, timings: List[float]):
+    """Prints the minimum and median of a set of timings.
+
+    Args:
+        name: The name of the measurement.
+        timings: The timings (in seconds).
+    """
+    print(
+        f"{name:<24} min {min(timings) * 1000:8.1f} ms"
+        f"   median {statistics.median(timings) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir, "results.db"))
+        benchmarks = {
+            "interpreter": [sys.executable, "-c", "pass"],
+            "import main": [sys.executable, "-c", "import main"],
+            "main.py -h": [sys.executable, "main.py", "-h"],
+            "one-iteration smoke run": [
+                sys.executable,
+                "main.py",
+                "-wl",
+                "Workload_1",
+                "-iter",
+                "1",
+                "-quiet",
+                "-db",
+                db_path,
+            ],
+        }
+        for name, argv in benchmarks.items():
+            report(name=name, timings=time_command(argv=argv, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
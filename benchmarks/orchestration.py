@@ -0,0 +1,426 @@
+"""This module measures the orchestration overhead of Workload-Runner.
+
+Each benchmark case runs in a fresh interpreter, so its peak memory can be read
+from the child's rusage. Cases cover the parallel executor with no-op and
+process tasks, workload launches, log file creation, seed planning, output
+checking and whole runs of main.py (with and without a warm pool), across task counts, concurrency levels and log sizes.
+
+Typical usage example:
+
+  python3 ./benchmarks/orchestration.py --save-baseline
+  python3 ./benchmarks/orchestration.py --compare --threshold 0.1
+  python3 ./benchmarks/orchestration.py --case parallel_noop_4 --case main_iter_depth_8
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+BASELINE_PATH = Path(__file__).parent.joinpath("baseline.json")
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.logger import Logger  # noqa: E402
+from utils.parallel import Parallel  # noqa: E402
+from utils.randomizer import Randomizer  # noqa: E402
+from utils.spawn import spawn_process  # noqa: E402
+from utils.usage import wait_with_usage  # noqa: E402
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Gets a percentile of a list of values by the nearest-rank method.
+
+    Args:
+        values: The values.
+        fraction: The percentile as a fraction (e.g. 0.99).
+
+    Returns:
+        The percentile.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def summarize(
+    tasks: int, elapsed: float, latencies: Optional[List[float]] = None
+) -> Dict[str, Optional[float]]:
+    """Builds the metrics of a benchmark case.
+
+    Args:
+        tasks: The number of tasks run.
+        elapsed: The wall-clock time of the case (in seconds).
+        latencies: The scheduling latency of each task (in seconds), if measured.
+
+    Returns:
+        The tasks per second, per-task overhead and p50/p99 scheduling latency
+        (in microseconds).
+    """
+    return {
+        "tasks": tasks,
+        "tasks_per_sec": tasks / elapsed,
+        "per_task_us": elapsed / tasks * 1e6,
+        "p50_latency_us": percentile(latencies, 0.5) * 1e6 if latencies else None,
+        "p99_latency_us": percentile(latencies, 0.99) * 1e6 if latencies else None,
+    }
+
+
+def bench_parallel(tasks: int, workers: int, argv: Optional[List[str]] = None) -> Dict:
+    """Runs tasks through Parallel and measures the delay before each one starts.
+
+    Args:
+        tasks: The number of tasks.
+        workers: The maximum number of tasks running at the same time.
+        argv: A command each task runs as a child process. Tasks do nothing when not set.
+
+    Returns:
+        The metrics of the case.
+    """
+    parallel = Parallel(max_workers=workers)
+
+    def task(submit_time: float) -> float:
+        latency = time.perf_counter() - submit_time
+        if argv is not None:
+            subprocess.run(argv, stdout=subprocess.DEVNULL)
+        return latency
+
+    start_time = time.perf_counter()
+    for _ in range(tasks):
+        parallel.start_process(task, time.perf_counter())
+    latencies = parallel.wait()
+    elapsed = time.perf_counter() - start_time
+    parallel.shutdown()
+    return summarize(tasks=tasks, elapsed=elapsed, latencies=latencies)
+
+
+def bench_run_exec(tasks: int) -> Dict:
+    """Creates the log files of many tasks with Logger.run_exec.
+
+    Args:
+        tasks: The number of tasks.
+
+    Returns:
+        The metrics of the case.
+    """
+    logger = Logger(quiet=True)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        logger.spool_path = tmp_dir
+        start_time = time.perf_counter()
+        for index in range(tasks):
+            logger.run_exec(seed=index // 2, workload="Workload_1", current_iter=index)
+        elapsed = time.perf_counter() - start_time
+    return summarize(tasks=tasks, elapsed=elapsed)
+
+
+def bench_plan(iterations: int) -> Dict:
+    """Precomputes the seeds and attribute picks of many iterations.
+
+    Args:
+        iterations: The number of iterations.
+
+    Returns:
+        The metrics of the case.
+    """
+    randomizer = Randomizer()
+    start_time = time.perf_counter()
+    randomizer.generate_plan(
+        seed=123,
+        count=iterations,
+        attribute_counts={"Workload_1": 1, "Workload_2": 3},
+        attribute_weights={"Workload_2": [1.0, 2.0, 3.0]},
+    )
+    elapsed = time.perf_counter() - start_time
+    return summarize(tasks=iterations, elapsed=elapsed)
+
+
+def bench_process_output(size: int, tasks: int) -> Dict:
+    """Checks synthetic output logs with a workload's process_output.
+
+    Args:
+        size: The size of each log (in bytes), with the pass marker at the end.
+        tasks: The number of logs checked.
+
+    Returns:
+        The metrics of the case, plus the scanning throughput.
+    """
+    from workloads.workload_1.workload_1 import Workload
+
+    wl = Workload()
+    line = b"Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stdout_path = os.path.join(tmp_dir, "task.out")
+        with open(stdout_path, "wb") as stdout_file:
+            stdout_file.write(line * (size // len(line)))
+            stdout_file.write(b"The number picked is : 42\n")
+        start_time = time.perf_counter()
+        for _ in range(tasks):
+            assert wl.process_output(stdout_path=stdout_path)
+        elapsed = time.perf_counter() - start_time
+    metrics = summarize(tasks=tasks, elapsed=elapsed)
+    metrics["mb_per_sec"] = size * tasks / elapsed / 1e6
+    return metrics
+
+
+def bench_launch(tasks: int, method: str) -> Dict:
+    """Launches Workload_1 tasks one after another and measures how long each launch call takes.
+
+    Args:
+        tasks: The number of tasks.
+        method: "popen" for subprocess.Popen through "sh" found on PATH, as
+            workloads launched before, or "spawn" for the launch spec's
+            os.posix_spawn path.
+
+    Returns:
+        The metrics of the case, with the launch call's latency as the scheduling latency.
+    """
+    from workloads.workload_1 import run_config
+    from workloads.workload_1.workload_1 import Workload
+
+    wl = Workload()
+    bin_path = run_config.bin_path["wl_1"]
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stdout_path = os.path.join(tmp_dir, "task.out")
+        stderr_path = os.path.join(tmp_dir, "task.err")
+        start_time = time.perf_counter()
+        for seed in range(tasks):
+            argv = wl.get_command(seed=seed, bin_path=bin_path)
+            launch_time = time.perf_counter()
+            if method == "popen":
+                with open(stdout_path, "a") as stdout_file, open(
+                    stderr_path, "a"
+                ) as stderr_file:
+                    process = subprocess.Popen(
+                        ["sh"] + argv[1:],
+                        stdout=stdout_file,
+                        stderr=stderr_file,
+                        start_new_session=True,
+                    )
+            else:
+                process = spawn_process(
+                    argv=argv,
+                    stdout_path=stdout_path,
+                    stderr_path=stderr_path,
+                    env=wl.spec.env,
+                )
+            latencies.append(time.perf_counter() - launch_time)
+            wait_with_usage(process=process)
+        elapsed = time.perf_counter() - start_time
+    return summarize(tasks=tasks, elapsed=elapsed, latencies=latencies)
+
+
+def bench_main(
+    iterations: int,
+    workers: int,
+    depth: int,
+    workloads: List[str] = ("Workload_1", "Workload_2"),
+    options: List[str] = (),
+) -> Dict:
+    """Runs main.py end to end.
+
+    Args:
+        iterations: The number of iterations.
+        workers: The maximum number of tasks running at the same time.
+        depth: The number of iterations kept in flight.
+        workloads: The workloads selected.
+        options: Extra command-line options.
+
+    Returns:
+        The metrics of the case.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        argv = [
+            sys.executable,
+            str(PROJECT_ROOT.joinpath("main.py")),
+            "-wl",
+            *workloads,
+            "-iter",
+            str(iterations),
+            "-seed",
+            "123",
+            "-workers",
+            str(workers),
+            "-depth",
+            str(depth),
+            "-quiet",
+            "-retention",
+            "failures",
+            "-db",
+            os.path.join(tmp_dir, "results.db"),
+            *options,
+        ]
+        start_time = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start_time
+    return summarize(tasks=iterations * len(workloads), elapsed=elapsed)
+
+
+CASES: Dict[str, Callable[[], Dict]] = {
+    "parallel_noop_1": lambda: bench_parallel(tasks=20000, workers=1),
+    "parallel_noop_4": lambda: bench_parallel(tasks=20000, workers=4),
+    "parallel_noop_32": lambda: bench_parallel(tasks=20000, workers=32),
+    "parallel_true_4": lambda: bench_parallel(tasks=500, workers=4, argv=["true"]),
+    "parallel_true_32": lambda: bench_parallel(tasks=500, workers=32, argv=["true"]),
+    "run_exec_1000": lambda: bench_run_exec(tasks=1000),
+    "plan_10000": lambda: bench_plan(iterations=10000),
+    "process_output_4k": lambda: bench_process_output(size=1 << 12, tasks=2000),
+    "process_output_1m": lambda: bench_process_output(size=1 << 20, tasks=200),
+    "process_output_64m": lambda: bench_process_output(size=1 << 26, tasks=3),
+    "launch_popen_500": lambda: bench_launch(tasks=500, method="popen"),
+    "launch_spawn_500": lambda: bench_launch(tasks=500, method="spawn"),
+    "main_iter_200": lambda: bench_main(iterations=200, workers=4, depth=1),
+    "main_iter_depth_8": lambda: bench_main(iterations=200, workers=16, depth=8),
+    "main_in_process_cold": lambda: bench_main(
+        iterations=200, workers=4, depth=4, workloads=["Workload_3"]
+    ),
+    "main_in_process_warm": lambda: bench_main(
+        iterations=200,
+        workers=4,
+        depth=4,
+        workloads=["Workload_3"],
+        options=["-warm-pool", "4"],
+    ),
+}
+
+
+def run_case(name: str, repeat: int) -> Dict:
+    """Runs a benchmark case in fresh interpreters and keeps the fastest run.
+
+    Args:
+        name: The name of the case.
+        repeat: The number of runs.
+
+    Returns:
+        The metrics of the fastest run, with the peak RSS over all runs (in kilobytes).
+    """
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.Popen(
+            [sys.executable, __file__, "--child", name],
+            stdout=subprocess.PIPE,
+            cwd=PROJECT_ROOT,
+        )
+        output = process.stdout.read()
+        process.stdout.close()
+        exit_code, usage = wait_with_usage(process=process)
+        if exit_code != 0:
+            raise RuntimeError(f"Benchmark case {name} exited with {exit_code}")
+        metrics = json.loads(output)
+        metrics["peak_rss_kb"] = usage.max_rss
+        runs.append(metrics)
+    best = max(runs, key=lambda m: m["tasks_per_sec"])
+    best["peak_rss_kb"] = max(m["peak_rss_kb"] for m in runs)
+    return best
+
+
+def compare(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    threshold: float,
+    latency_threshold: float,
+) -> bool:
+    """Prints how each case changed against the baseline.
+
+    Args:
+        results: The metrics of each case.
+        baseline: The stored metrics of each case.
+        threshold: The relative change counted as a regression (e.g. 0.1 for 10%).
+        latency_threshold: The relative change in p99 latency counted as a regression.
+            Tail latency is noisier than throughput, so it gets its own threshold.
+
+    Returns:
+        Whether any case regressed.
+    """
+    # Lower is better for every metric except the throughputs.
+    higher_is_better = {"tasks_per_sec", "mb_per_sec"}
+    thresholds = {
+        "tasks_per_sec": threshold,
+        "p99_latency_us": latency_threshold,
+        "peak_rss_kb": threshold,
+        "mb_per_sec": threshold,
+    }
+    is_regressed = False
+    print(f"\n{'case':<22}{'metric':<18}{'baseline':>14}{'current':>14}{'change':>10}")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        for metric, limit in thresholds.items():
+            old, new = baseline[name].get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if metric in higher_is_better else change
+            flag = ""
+            if worse > limit:
+                flag = "  REGRESSED"
+                is_regressed = True
+            print(
+                f"{name:<22}{metric:<18}{old:>14.1f}{new:>14.1f}{change:>+10.1%}{flag}"
+            )
+    return is_regressed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--case", action="append", choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=str, default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--latency-threshold", type=float, default=0.5)
+    parser.add_argument("--child", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(CASES[args.child]()))
+        return
+    # Checked before the cases run, which takes minutes.
+    if args.compare and not args.save_baseline and not os.path.exists(args.baseline):
+        sys.exit(
+            f"No baseline at {args.baseline}; run with --save-baseline first "
+            "(baselines are per machine and are not committed)."
+        )
+    results = {}
+    print(
+        f"{'case':<22}{'tasks/s':>12}{'per task us':>14}{'p50 us':>10}"
+        f"{'p99 us':>10}{'peak MB':>10}"
+    )
+    for name in args.case or CASES:
+        metrics = run_case(name=name, repeat=args.repeat)
+        results[name] = metrics
+        latencies = [
+            f"{metrics[k]:>10.1f}" if metrics[k] is not None else f"{'-':>10}"
+            for k in ("p50_latency_us", "p99_latency_us")
+        ]
+        print(
+            f"{name:<22}{metrics['tasks_per_sec']:>12.1f}"
+            f"{metrics['per_task_us']:>14.1f}{''.join(latencies)}"
+            f"{metrics['peak_rss_kb'] / 1024:>10.1f}"
+        )
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(
+            results=results,
+            baseline=baseline,
+            threshold=args.threshold,
+            latency_threshold=args.latency_threshold,
+        ):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,36 +3,86 @@
 Please see the README.md file for example command-lines.
 """
 
-import importlib
-from typing import Tuple
+import argparse
+from pathlib import Path
+import time
 
+from utils.admission import Admission
 from utils.args import Args
 from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.mix import Mix
 from utils.parallel import Parallel
 from utils.paths import Paths
+from utils.pipeline import Pipeline
+from utils.placement import Placement
+from utils.profiler import Profiler
 from utils.randomizer import Randomizer
+from utils.registry import Registry
+from utils.results import Results
+from utils.retention import Retention
+from utils.scheduler import Scheduler
 from utils.timer import Timer
 
 
+def get_backend(
+    args: argparse.Namespace,
+    args_parser: Args,
+    parser: argparse.ArgumentParser,
+    logger: Logger,
+):
+    """Creates the backend that runs the tasks, as selected by -backend.
+
+    Args:
+        args: The parsed input arguments.
+        args_parser: The input argument helper.
+        parser: The parser, used to report invalid arguments.
+        logger: The logger.
+
+    Returns:
+        The Parallel, AsyncParallel or Coordinator instance.
+    """
+    if args.backend == "asyncio":
+        # asyncio is slow to import, so only runs that use it pay for it.
+        from utils.async_parallel import AsyncParallel
+
+        return AsyncParallel(max_workers=args.workers)
+    if args.backend == "distributed":
+        from utils.distributed import Coordinator, is_loopback
+
+        host, port = args_parser.split_address(address=args.listen)
+        if args.token is None and not is_loopback(host=host):
+            parser.error("-listen on a non-loopback address needs -token")
+        coordinator = Coordinator(host=host, port=port, token=args.token)
+        logger.print_to_terminal(
+            f"Waiting for workers on {host}:{coordinator.address[1]}", color="green"
+        )
+        return coordinator
+    return Parallel(max_workers=args.workers)
+
+
 def main():
     args_parser = Args()
-    logger = Logger()
-    parallel = Parallel()
     paths = Paths()
+    registry = Registry()
     randomizer = Randomizer()
     timer = Timer()
-    parser = args_parser.get_parser()
+    parser = args_parser.get_parser(workloads=registry.get_names())
     args = parser.parse_args()
+    if args.placement != "none" and args.backend == "asyncio":
+        parser.error("-placement needs the thread or distributed backend")
+    profiler = Profiler(is_enabled=args.profile)
+    placement = Placement(policy=args.placement)
+    logger = Logger(pace=args.pace, quiet=args.quiet)
+    parallel = get_backend(args=args, args_parser=args_parser, parser=parser, logger=logger)
     bool_args = args_parser.get_bool_args(args)
     bins_path = paths.bins_path
     wl_module = {}
     wl_config = {}
-    args.workload = set(args.workload)
+    args.workload = list(dict.fromkeys(args.workload))
     for wl in args.workload:
-        wl_module_str = paths.get_wl_module(workload=wl)
-        wl_module[wl] = importlib.import_module(wl_module_str).Workload()
-        wl_config_str = paths.get_wl_config(workload=wl)
-        wl_config[wl] = importlib.import_module(wl_config_str)
+        wl_module[wl] = registry.load_workload(workload=wl)
+        wl_config[wl] = registry.load_config(workload=wl)
     logger.run_pre_exec(
         wl_list=args.workload,
         is_iter=bool_args["is_iter"],
@@ -42,109 +92,114 @@ def main():
         start_seed = randomizer.generate_seed()
     else:
         start_seed = args.seed
-    current_seed = start_seed
-    pass_count = 0
-    task_count = 0
-    start_time = timer.press_timer()
-
-    def loop_execution(
-        current_seed: int, iter_id: int, task_count: int, pass_count: int
-    ) -> Tuple[int, int, int, int]:
-        """Execute steps for running a regression test for the given input iterations/runtime.
-
-        Args:
-            current_seed: The current iteration seed.
-            iter_id: The current iteration ID.
-            task_count: Counter for recording the number of tasks run.
-            pass_count: Counter for recording the number of tasks that passed.
-
-        Returns:
-            The updated input arguments.
-
-        Raises:
-            FileNotFoundError: If output log file is not found.
-        """
-        log_dict = {}
-        attributes_dict = {}
-        for wl in args.workload:
-            attributes_dict[wl] = wl_config[wl].attributes[
-                randomizer.pick_random_int(
-                    low=0, high=len(wl_config[wl].attributes), seed=current_seed
-                )
-            ]
-            subdir_path, log_paths = logger.run_exec(
-                seed=current_seed, workload=wl, current_iter=iter_id
-            )
-            log_dict[wl] = log_paths[0]
-            parallel.start_process(
-                func=wl_module[wl].run(
-                    seed=current_seed,
-                    bin_path=wl_config[wl].bin_path[attributes_dict[wl]],
-                    stdout_path=log_paths[0],
-                    stderr_path=log_paths[1],
-                )
-            )
-        parallel.wait()
-        for wl, log_path in log_dict.items():
-            try:
-                is_pass = wl_module[wl].process_output(stdout_path=log_path)
-            except FileNotFoundError:
-                logger.print_error("Couldn't read output file!")
-            pass_count += logger.run_post_exec(
-                is_pass=is_pass,
-                log_paths=log_paths,
-                attribute=attributes_dict[wl],
-                iter_id=iter_id,
-            )
-            task_count += 1
-        current_seed = randomizer.generate_seed_from_seed(seed=current_seed)
-        return current_seed, iter_id, task_count, pass_count
+    results = Results(db_path=args.results_db or paths.db_path)
+    run_id = results.start_run(start_seed=start_seed, workloads=args.workload)
+    scheduler = Scheduler(estimates=results.get_mean_durations(workloads=args.workload))
+    mix = Mix(
+        workload_weights={
+            wl: getattr(wl_config[wl], "weight", 1.0) for wl in args.workload
+        },
+        attribute_weights={
+            wl: getattr(wl_config[wl], "attribute_weights", {}) for wl in args.workload
+        },
+        is_adaptive=args.mix == "adaptive",
+        stats=(
+            results.get_attribute_stats(workloads=args.workload)
+            if args.mix == "adaptive"
+            else None
+        ),
+    )
+    metrics = Metrics(
+        port=args.metrics_port,
+        file_path=args.metrics_file,
+        interval=args.metrics_interval,
+    )
+    admission = Admission(
+        max_tasks=max(1, args.pipeline_depth) * len(args.workload),
+        high=args.admission_high,
+        low=args.admission_low,
+        is_enabled=args.admission,
+    )
+    # Everything left behind by the run is cleaned up even if it is
+    # interrupted: the workloads still running, the retention spool, the warm
+    # workers and the exporters. Workloads run in their own sessions, so a
+    # Ctrl-C in the terminal does not reach them.
+    retention = Retention(
+        policy=args.retention,
+        logger=logger,
+        archive_path=str(Path(paths.dir_path, f"run_{run_id}_passed.zip")),
+    )
+    logger.spool_path = retention.spool_path
+    pool = None
+    is_finished = False
+    try:
+        in_process = [wl for wl in args.workload if wl_module[wl].is_in_process]
+        if args.warm_pool and in_process and args.backend != "distributed":
+            from utils.warm_pool import WarmPool
 
-    if bool_args["is_iter"]:
-        for iter_id in range(1, args.iteration + 1):
-            logger.print_iter(
-                current_iter=iter_id, total_iter=args.iteration, seed=current_seed
+            pool = WarmPool(
+                modules=[type(wl_module[wl]).__module__ for wl in in_process],
+                size=args.warm_pool,
             )
-            current_seed, iter_id, task_count, pass_count = loop_execution(
-                current_seed=current_seed,
-                iter_id=iter_id,
-                task_count=task_count,
-                pass_count=pass_count,
-            )
-    else:
-        iter_id = 0
-        iter_time = 0
-        while (
-            timer.is_time_remaining
-            and timer.time_remaining(start_time=start_time, end_time=args.time)
-            > iter_time
-        ):
-            iter_id += 1
-            iter_start_time = timer.press_timer()
-            logger.print_time(
-                time_left=timer.time_remaining(
-                    start_time=start_time, end_time=args.time
-                ),
-                total_time=args.time,
-                seed=current_seed,
+        pipeline = Pipeline(
+            args=args,
+            is_iter=bool_args["is_iter"],
+            wl_module=wl_module,
+            wl_config=wl_config,
+            parallel=parallel,
+            logger=logger,
+            profiler=profiler,
+            metrics=metrics,
+            results=results,
+            run_id=run_id,
+            retention=retention,
+            scheduler=scheduler,
+            mix=mix,
+            placement=placement,
+            admission=admission,
+            randomizer=randomizer,
+            pool=pool,
+        )
+        metrics.start()
+        profiler.add_span(
+            name="pre_exec", start_ns=profiler.origin_ns, end_ns=time.perf_counter_ns()
+        )
+        start_time = timer.press_timer()
+        if bool_args["is_iter"]:
+            total_iter = pipeline.run_iterations(
+                seed=start_seed, iterations=args.iteration
             )
-            current_seed, iter_id, task_count, pass_count = loop_execution(
-                current_seed=current_seed,
-                iter_id=iter_id,
-                task_count=task_count,
-                pass_count=pass_count,
+        else:
+            total_iter = pipeline.run_until(
+                seed=start_seed, timer=timer, start_time=start_time
             )
-            iter_end_time = timer.press_timer()
-            iter_time = iter_end_time - iter_start_time
+        parallel.shutdown()
+        results.finish_run(run_id=run_id)
+        is_finished = True
+    finally:
+        if not is_finished:
+            parallel.shutdown(wait=False)
+        if pool is not None:
+            pool.shutdown(wait=is_finished)
+        results.close()
+        retention.close()
+        metrics.close()
     end_time = timer.press_timer()
     total_time = end_time - start_time
-    total_iter = iter_id
+    totals = pipeline.totals
     logger.print_summary(
-        pass_count=pass_count,
-        task_count=task_count,
+        pass_count=totals["passes"],
+        task_count=totals["tasks"],
         total_iter=total_iter,
         total_time=total_time,
+        total_usage=totals["usage"],
+        timeout_count=totals["timeouts"],
+        cutoff_count=totals["cutoffs"],
     )
+    if args.profile:
+        trace_path = str(Path(paths.dir_path, f"run_{run_id}_trace.json"))
+        profiler.write_trace(trace_path=trace_path)
+        logger.print_profile(phases=profiler.get_phases(), trace_path=trace_path)
 
 
 if __name__ == "__main__":
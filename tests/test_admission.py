@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from utils.admission import Admission
+
+
+def write_proc(proc_path, available_kb, cpu_avg10):
+    (proc_path / "meminfo").write_text(
+        f"MemTotal:        1000000 kB\nMemAvailable:    {available_kb} kB\n"
+    )
+    (proc_path / "pressure" / "cpu").write_text(
+        f"some avg10={cpu_avg10:.2f} avg60=0.00 avg300=0.00 total=0\n"
+        "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+    )
+
+
+@pytest.fixture
+def arguments(tmp_path, monkeypatch):
+    (tmp_path / "pressure").mkdir()
+    write_proc(tmp_path, available_kb=900000, cpu_avg10=0.0)
+    monkeypatch.setattr(os, "getloadavg", lambda: (0.0, 0.0, 0.0))
+    admission = Admission(max_tasks=8, high=0.9, low=0.7, interval=0.0)
+    admission.proc_path = str(tmp_path)
+    return admission, tmp_path
+
+
+def test_read_signals(arguments):
+    admission, proc_path = arguments
+    write_proc(proc_path, available_kb=250000, cpu_avg10=42.5)
+    signals = admission.read_signals()
+
+    assert signals["load"] == 0.0
+    assert signals["memory"] == pytest.approx(0.75)
+    assert signals["psi_cpu"] == pytest.approx(0.425)
+    assert "psi_io" not in signals
+
+
+def test_throttle_and_ramp(arguments):
+    admission, proc_path = arguments
+    assert admission.get_limit() == 8
+
+    write_proc(proc_path, available_kb=50000, cpu_avg10=0.0)
+    assert [admission.get_limit() for _ in range(4)] == [4, 2, 1, 1]
+
+    # Between the watermarks the limit is held.
+    write_proc(proc_path, available_kb=200000, cpu_avg10=0.0)
+    assert admission.get_limit() == 1
+
+    write_proc(proc_path, available_kb=900000, cpu_avg10=0.0)
+    assert [admission.get_limit() for _ in range(9)] == [2, 3, 4, 5, 6, 7, 8, 8, 8]
+
+
+def test_psi_and_interval(arguments):
+    admission, proc_path = arguments
+    admission.interval = 3600.0
+    write_proc(proc_path, available_kb=900000, cpu_avg10=95.0)
+
+    assert admission.get_limit() == 4
+    assert admission.get_limit() == 4
+
+
+def test_disabled():
+    admission = Admission(max_tasks=3, high=0.0, low=0.0, is_enabled=False)
+
+    assert admission.get_limit() == 3
+
+
+def test_hold_until_low(arguments):
+    admission, proc_path = arguments
+    assert not admission.is_full(task_count=8)
+    assert admission.is_full(task_count=9)
+
+    write_proc(proc_path, available_kb=50000, cpu_avg10=0.0)
+    assert admission.is_full(task_count=1)
+
+    # Below the high watermark, launches are still held until the low one.
+    write_proc(proc_path, available_kb=200000, cpu_avg10=0.0)
+    assert admission.is_full(task_count=1)
+
+    write_proc(proc_path, available_kb=900000, cpu_avg10=0.0)
+    assert not admission.is_full(task_count=5)
+    admission.interval = 3600.0
+    assert admission.is_full(task_count=6)
+
+    admission.is_enabled = False
+    assert not admission.is_full(task_count=100)
+
+
+def test_idle_admits_iteration(arguments):
+    admission, proc_path = arguments
+    write_proc(proc_path, available_kb=50000, cpu_avg10=0.0)
+    assert admission.is_full(task_count=8, is_idle=True)
+
+    # Held between the watermarks at a limit of 5, below the 8 tasks of an iteration.
+    write_proc(proc_path, available_kb=400000, cpu_avg10=0.0)
+    assert not admission.is_full(task_count=5)
+    write_proc(proc_path, available_kb=200000, cpu_avg10=0.0)
+    assert admission.is_full(task_count=8)
+    assert not admission.is_full(task_count=8, is_idle=True)
+    assert admission.limit == 5
@@ -0,0 +1,151 @@
+import asyncio
+import os
+
+import pytest
+import signal
+import time
+
+from utils import async_parallel as async_parallel_module
+from utils.async_parallel import AsyncParallel
+from utils.spawn import resolve_executable
+from utils.verdict import Verdict
+from utils.workload import LaunchSpec
+
+SH = resolve_executable(name="sh")
+SLEEP = resolve_executable(name="sleep")
+TRUE = resolve_executable(name="true")
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    async_parallel = AsyncParallel()
+    stdout_path = str(tmp_path / "task.out")
+    stderr_path = str(tmp_path / "task.err")
+    yield async_parallel, stdout_path, stderr_path
+    async_parallel.shutdown()
+
+
+def test_start_process(arguments):
+    async_parallel, stdout_path, stderr_path = arguments
+    async_parallel.start_process(
+        argv=[SH, "-c", "echo hello; exit 3"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+    )
+
+    assert async_parallel.wait() == [3]
+    with open(stdout_path) as stdout_file:
+        assert stdout_file.read() == "hello\n"
+
+
+def test_callback(arguments):
+    async_parallel, stdout_path, stderr_path = arguments
+    future = async_parallel.start_process(
+        argv=[TRUE],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        callback=lambda exit_code, usage, is_timeout: exit_code == 0,
+    )
+
+    assert future.result()
+
+
+def test_timeout(arguments):
+    async_parallel, stdout_path, stderr_path = arguments
+    start_time = time.perf_counter()
+    async_parallel.start_process(
+        argv=[SLEEP, "5"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        timeout=0.2,
+    )
+
+    assert async_parallel.wait()[0] < 0
+    assert time.perf_counter() - start_time < 2
+
+
+def test_concurrent(arguments):
+    async_parallel, stdout_path, stderr_path = arguments
+    start_time = time.perf_counter()
+    for _ in range(100):
+        async_parallel.start_process(
+            argv=[SLEEP, "0.5"], stdout_path=stdout_path, stderr_path=stderr_path
+        )
+
+    assert async_parallel.wait() == [0] * 100
+    assert time.perf_counter() - start_time < 3
+
+
+def test_shutdown_without_wait(tmp_path):
+    async_parallel = AsyncParallel()
+    async_parallel.start_process(
+        argv=[SLEEP, "30"],
+        stdout_path=str(tmp_path / "task.out"),
+        stderr_path=str(tmp_path / "task.err"),
+    )
+    while not async_parallel.groups.processes:
+        time.sleep(0.01)
+    (process,) = async_parallel.groups.processes
+    async_parallel.shutdown(wait=False)
+    try:
+        exit_code = os.waitstatus_to_exitcode(os.waitpid(process.pid, 0)[1])
+    except ChildProcessError:
+        # The loop reaped it before it stopped.
+        exit_code = process.returncode
+
+    assert exit_code == -signal.SIGKILL
+
+
+def test_scanner(arguments):
+    async_parallel, stdout_path, stderr_path = arguments
+    scanner = Verdict(pass_patterns=["PASS"]).new_scanner()
+    async_parallel.start_process(
+        argv=[SH, "-c", "echo PASS"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        scanner=scanner,
+    )
+
+    assert async_parallel.wait() == [0]
+    assert scanner.result()
+    with open(stdout_path) as stdout_file:
+        assert stdout_file.read() == "PASS\n"
+
+
+def test_spawn_off_loop(arguments, monkeypatch):
+    async_parallel, stdout_path, stderr_path = arguments
+    spawn_process = async_parallel_module.spawn_process
+
+    def slow_spawn_process(**kwargs):
+        time.sleep(0.5)
+        return spawn_process(**kwargs)
+
+    monkeypatch.setattr(async_parallel_module, "spawn_process", slow_spawn_process)
+    async_parallel.start_process(
+        argv=[TRUE], stdout_path=stdout_path, stderr_path=stderr_path
+    )
+    time.sleep(0.1)
+    ping = asyncio.run_coroutine_threadsafe(asyncio.sleep(0), async_parallel.loop)
+
+    assert ping.result(timeout=0.3) is None
+    assert async_parallel.wait() == [0]
+
+
+@pytest.mark.parametrize("is_tee", [False, True])
+def test_env(arguments, is_tee):
+    async_parallel, stdout_path, stderr_path = arguments
+    spec = LaunchSpec(
+        command=["sh", "-c", "echo $WR_MODE"], environment={"WR_MODE": "soak"}
+    )
+    scanner = Verdict(pass_patterns=["soak"]).new_scanner() if is_tee else None
+    async_parallel.start_process(
+        argv=spec.fill(seed=1, bin_path=""),
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        scanner=scanner,
+        env=spec.env,
+    )
+
+    assert async_parallel.wait() == [0]
+    with open(stdout_path) as stdout_file:
+        assert stdout_file.read() == "soak\n"
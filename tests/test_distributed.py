@@ -0,0 +1,146 @@
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from utils.distributed import Coordinator, Worker, send_message
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    coordinator = Coordinator(host="127.0.0.1", port=0)
+    host, port = coordinator.address
+    workers = [
+        Worker(host=host, port=port, slots=2, log_path=str(tmp_path)) for _ in range(3)
+    ]
+    return coordinator, workers
+
+
+def start_workers(workers):
+    threads = [threading.Thread(target=w.serve, daemon=True) for w in workers]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_run_tasks(arguments):
+    coordinator, workers = arguments
+    threads = start_workers(workers)
+    futures = [
+        coordinator.start_task(
+            workload="Workload_1", seed=seed, attribute="wl_1", iter_id=seed
+        )
+        for seed in range(12)
+    ]
+    task_results = coordinator.wait(futures=futures)
+    coordinator.shutdown()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert all(result.is_pass for result in task_results)
+    assert all(result.verdict == "PASS" for result in task_results)
+    for result in task_results:
+        hostname, _, stdout_path = result.log_paths[0].partition(":")
+        assert hostname == socket.gethostname()
+        assert os.path.exists(stdout_path)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_requeue(arguments):
+    coordinator, workers = arguments
+    host, port = coordinator.address
+    future = coordinator.start_task(
+        workload="Workload_1", seed=7, attribute="wl_1", iter_id=1
+    )
+    # A worker that takes the task and disconnects without a result.
+    conn = socket.create_connection((host, port))
+    send_message(conn=conn, message={"type": "hello", "hostname": "lost", "slots": 1})
+    task = json.loads(conn.makefile("r").readline())
+    conn.close()
+    start_workers(workers[:1])
+    result = future.result(timeout=10)
+    coordinator.shutdown()
+
+    assert task["seed"] == 7
+    assert result.is_pass
+
+
+def test_token():
+    coordinator = Coordinator(host="127.0.0.1", port=0, token="secret")
+    host, port = coordinator.address
+    conn = socket.create_connection((host, port))
+    send_message(conn=conn, message={"type": "hello", "slots": 1, "token": "wrong"})
+
+    assert conn.recv(1) == b""
+    conn.close()
+    coordinator.shutdown()
+
+
+def test_task_error(arguments, tmp_path):
+    coordinator, workers = arguments
+    start_workers(workers[:1])
+    futures = [
+        coordinator.start_task(
+            workload="Workload_9", seed=7, attribute="wl_9", iter_id=1
+        ),
+        coordinator.start_task(
+            workload="Workload_1", seed=7, attribute="wl_9", iter_id=2
+        ),
+        coordinator.start_task(
+            workload="Workload_1", seed=7, attribute="wl_1", iter_id=3
+        ),
+    ]
+    unknown_workload, unknown_attribute, ok = [f.result(timeout=10) for f in futures]
+    coordinator.shutdown()
+
+    assert unknown_workload.verdict == "FAIL"
+    assert "Workload_9" in unknown_workload.error
+    assert unknown_attribute.verdict == "FAIL"
+    assert "KeyError" in unknown_attribute.error
+    assert ok.is_pass and ok.error is None
+    assert ok.log_paths[0].partition(":")[2].startswith(str(tmp_path))
+
+
+def test_malformed_result():
+    coordinator = Coordinator(host="127.0.0.1", port=0)
+    host, port = coordinator.address
+    future = coordinator.start_task(
+        workload="Workload_1", seed=7, attribute="wl_1", iter_id=1
+    )
+    # A worker that answers with a result from another version of the runner.
+    conn = socket.create_connection((host, port))
+    send_message(conn=conn, message={"type": "hello", "hostname": "old", "slots": 1})
+    task = json.loads(conn.makefile("r").readline())
+    send_message(
+        conn=conn,
+        message={
+            "type": "result",
+            "task_id": task["task_id"],
+            "is_pass": True,
+            "exit_code": 0,
+            "is_timeout": False,
+            "usage": {"wall_time": 1.0, "peak_memory": 2048},
+            "log_paths": ["old:/tmp/out.log", "old:/tmp/err.log"],
+        },
+    )
+    result = future.result(timeout=10)
+    conn.close()
+    coordinator.shutdown()
+
+    assert result.verdict == "FAIL"
+    assert "Malformed result from old" in result.error
+    assert "peak_memory" in result.error
+
+
+def test_listen_needs_token():
+    with pytest.raises(ValueError):
+        Coordinator(host="0.0.0.0", port=0)
+
+    coordinator = Coordinator(host="0.0.0.0", port=0, token="secret")
+    assert coordinator.is_authorized(token="secret")
+    assert not coordinator.is_authorized(token="secrets")
+    assert not coordinator.is_authorized(token=None)
+    assert not coordinator.is_authorized(token=7)
+    coordinator.shutdown()
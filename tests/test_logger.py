@@ -1,6 +1,7 @@
 import os
 import pytest
 import shutil
+import time
 
 from utils.logger import Logger
 
@@ -75,3 +76,36 @@ def test_std_err(arguments, tmp_path):
     std_err.write_text("Test output error message!")
 
     assert std_err.read_text() == "Test output error message!"
+
+
+def test_no_pacing(capsys):
+    logger = Logger()
+    start_time = time.perf_counter()
+    logger.print_summary(pass_count=1, task_count=2, total_iter=1, total_time=1.0)
+
+    assert time.perf_counter() - start_time < 1
+
+
+def test_quiet(capsys):
+    logger = Logger(quiet=True)
+    logger.print_iter(current_iter=1, total_iter=2, seed=123)
+    logger.run_post_exec(is_pass=True, log_paths=("", ""), attribute="wl_1", iter_id=1)
+    logger.print_repeat(seed=123, is_skip=False)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_subdir_large_seed():
+    logger = Logger()
+    seeds = [0, 65535, 65536, (1 << 64) - 1]
+    subdirs = [logger.get_subdir(seed=s) for s in seeds]
+
+    assert len(set(subdirs)) == len(seeds)
+    assert all(len(subdir) == logger.hash_length for subdir in subdirs)
+
+
+def test_print_debug(capsys):
+    Logger().print_debug("checkpoint")
+    line_number = test_print_debug.__code__.co_firstlineno + 1
+
+    assert f"File: {__file__}    Line: {line_number}" in capsys.readouterr().out
@@ -0,0 +1,108 @@
+import sqlite3
+import sys
+
+import pytest
+
+import main
+from utils.admission import Admission
+from utils.logger import Logger
+
+
+@pytest.fixture
+def arguments(tmp_path, monkeypatch):
+    events = []
+    # Saturated for the first three samples, then clear. The last sample repeats.
+    signals = [{"load": 1.0}] * 3 + [{"load": 0.0}]
+
+    class ScriptedAdmission(Admission):
+        def __init__(self, **kwargs):
+            super().__init__(interval=0.0, **kwargs)
+
+        def read_signals(self):
+            sample = signals.pop(0) if len(signals) > 1 else signals[0]
+            events.append(("sample", sample["load"]))
+            return sample
+
+    run_exec = Logger.run_exec
+
+    def record_launch(self, **kwargs):
+        events.append(("launch", kwargs["current_iter"]))
+        return run_exec(self, **kwargs)
+
+    monkeypatch.setattr(main, "Admission", ScriptedAdmission)
+    monkeypatch.setattr(Logger, "run_exec", record_launch)
+
+    def record_sleep(seconds):
+        events.append("sleep")
+        if events.count("sleep") > 20:
+            raise RuntimeError("Launches stalled")
+
+    monkeypatch.setattr(main.time, "sleep", record_sleep)
+    argv = ["main.py", "-wl", "Workload_1", "-iter", "2", "-seed", "5", "-quiet"]
+    argv += ["-retention", "failures", "-db", str(tmp_path / "results.db")]
+    return argv, events, signals, monkeypatch
+
+
+def test_admission_holds_launch(arguments):
+    argv, events, _, monkeypatch = arguments
+    monkeypatch.setattr(sys, "argv", argv + ["-admission"])
+    main.main()
+
+    first_launch = events.index(("launch", 1))
+    assert events[:first_launch] == [
+        ("sample", 1.0),
+        "sleep",
+        ("sample", 1.0),
+        "sleep",
+        ("sample", 1.0),
+        "sleep",
+        ("sample", 0.0),
+    ]
+    assert ("launch", 2) in events
+
+
+def test_admission_disabled(arguments):
+    argv, events, _, monkeypatch = arguments
+    monkeypatch.setattr(sys, "argv", argv)
+    main.main()
+
+    assert events == [("launch", 1), ("launch", 2)]
+
+
+def test_admission_limit_below_iteration(arguments):
+    argv, events, signals, monkeypatch = arguments
+    # The limit is halved to 1, grows to 2, then is held below the 3 workloads.
+    signals[:] = [{"load": 0.95}, {"load": 0.6}, {"load": 0.8}]
+    argv += ["-wl", "Workload_2", "-wl", "Workload_3", "-admission"]
+    monkeypatch.setattr(sys, "argv", argv)
+    main.main()
+
+    assert events == [
+        ("sample", 0.95),
+        "sleep",
+        ("sample", 0.6),
+        *[("launch", 1)] * 3,
+        ("sample", 0.8),
+        *[("launch", 2)] * 3,
+    ]
+
+
+def test_pipeline_depth(tmp_path, monkeypatch):
+    rows = {}
+    for depth in (1, 8):
+        db_path = str(tmp_path / f"results_{depth}.db")
+        argv = ["main.py", "-wl", "Workload_1", "-wl", "Workload_2", "-iter", "20"]
+        argv += ["-seed", "5", "-quiet", "-retention", "failures", "-db", db_path]
+        monkeypatch.setattr(sys, "argv", argv + ["-depth", str(depth)])
+        main.main()
+        connection = sqlite3.connect(db_path)
+        rows[depth] = connection.execute(
+            "SELECT iter_id, seed, workload, attribute, exit_code, verdict "
+            "FROM tasks ORDER BY rowid"
+        ).fetchall()
+        connection.close()
+
+    # Iterations are reported in launch order, with the same tasks at any depth.
+    assert len(rows[1]) == 40
+    assert [row[0] for row in rows[8]] == sorted(row[0] for row in rows[8])
+    assert rows[8] == rows[1]
@@ -0,0 +1,65 @@
+import pytest
+import urllib.request
+
+from utils.metrics import Metrics
+
+
+@pytest.fixture
+def arguments():
+    metrics = Metrics()
+    metrics.task_started(workload="Workload_1")
+    metrics.task_started(workload="Workload_1")
+    metrics.task_finished(workload="Workload_1", verdict="FAIL", duration=0.3)
+    metrics.iteration_finished()
+    return metrics
+
+
+def test_render(arguments):
+    metrics = arguments
+    text = metrics.render()
+
+    assert "workload_runner_tasks_in_flight 1\n" in text
+    assert 'workload_runner_tasks_started_total{workload="Workload_1"} 2\n' in text
+    assert (
+        'workload_runner_tasks_finished_total{workload="Workload_1",verdict="FAIL"} 1\n'
+        in text
+    )
+    assert (
+        'workload_runner_task_duration_seconds_bucket{workload="Workload_1",le="0.25"} 0\n'
+        in text
+    )
+    assert (
+        'workload_runner_task_duration_seconds_bucket{workload="Workload_1",le="0.5"} 1\n'
+        in text
+    )
+    assert "workload_runner_iterations_total 1\n" in text
+
+
+def test_file(arguments, tmp_path):
+    metrics = arguments
+    metrics.file_path = str(tmp_path / "metrics.prom")
+    metrics.start()
+    metrics.close()
+
+    with open(metrics.file_path) as metrics_file:
+        assert metrics_file.read() == metrics.render()
+
+
+def test_server(arguments):
+    metrics = arguments
+    metrics.port = 0
+    metrics.start()
+    port = metrics.server.server_address[1]
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+        body = response.read().decode()
+    metrics.close()
+
+    assert body == metrics.render()
+
+
+def test_admission_limit(arguments):
+    metrics = arguments
+
+    assert "workload_runner_admission_limit" not in metrics.render()
+    metrics.admission_limit = 3
+    assert "workload_runner_admission_limit 3\n" in metrics.render()
@@ -0,0 +1,46 @@
+import pytest
+
+from utils.mix import Mix
+
+
+@pytest.fixture
+def arguments():
+    workload_weights = {"Workload_1": 1.0, "Workload_2": 4.0}
+    attribute_weights = {"Workload_2": {"wl_2": 2.0}}
+    return workload_weights, attribute_weights
+
+
+def test_get_workload_chances(arguments):
+    workload_weights, attribute_weights = arguments
+
+    assert Mix(workload_weights=workload_weights).get_workload_chances() == {
+        "Workload_1": 0.25,
+        "Workload_2": 1.0,
+    }
+    assert Mix(workload_weights={"Workload_1": 2.0}).get_workload_chances() is None
+
+
+def test_get_attribute_weights(arguments):
+    workload_weights, attribute_weights = arguments
+    mix = Mix(workload_weights=workload_weights, attribute_weights=attribute_weights)
+
+    assert mix.get_attribute_weights(
+        workload="Workload_2", attributes=["wl_2", "wl_3"]
+    ) == [2.0, 1.0]
+    assert mix.get_attribute_weights(workload="Workload_1", attributes=["wl_1"]) is None
+
+
+def test_adaptive(arguments):
+    workload_weights, attribute_weights = arguments
+    mix = Mix(
+        workload_weights=workload_weights,
+        is_adaptive=True,
+        boost=4.0,
+        stats={("Workload_2", "wl_2"): (98, 0)},
+    )
+    for _ in range(98):
+        mix.record(workload="Workload_2", attribute="wl_3", is_pass=False)
+
+    assert mix.get_attribute_weights(
+        workload="Workload_2", attributes=["wl_2", "wl_3", "wl_4"]
+    ) == [1.04, 4.96, 3.0]
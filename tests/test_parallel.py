@@ -1,6 +1,9 @@
 import pytest
+import subprocess
+import time
 
-from utils.parallel import Parallel
+from utils.parallel import Parallel, TaskResult
+from utils.usage import wait_with_usage
 
 
 @pytest.fixture
@@ -8,10 +11,10 @@ def arguments():
     parallel = Parallel()
 
     def function_1(x):
-        print(x + 2)
+        return x + 2
 
     def function_2(y):
-        print(y * 3)
+        return y * 3
 
     return parallel, function_1, function_2
 
@@ -20,13 +23,64 @@ def test_start_process(arguments):
     parallel, function_1, function_2 = arguments
     functions = [function_1, function_2]
     for func in functions:
-        parallel.start_process(func=func(2))
+        parallel.start_process(func, 2)
 
-    assert not parallel.process_list == False
+    assert len(parallel.process_list) == 2
 
 
 def test_wait(arguments):
-    parallel, funciton_1, function_2 = arguments
+    parallel, function_1, function_2 = arguments
+    parallel.start_process(function_1, 2)
+    parallel.start_process(function_2, 2)
+
+    assert parallel.wait() == [4, 6]
+    assert parallel.process_list == []
+
+
+def test_wait_subset(arguments):
+    parallel, function_1, function_2 = arguments
+    future_1 = parallel.start_process(function_1, 2)
+    future_2 = parallel.start_process(function_2, 2)
+
+    assert parallel.wait(futures=[future_2]) == [6]
+    assert parallel.process_list == [future_1]
+
+
+def test_concurrent():
+    parallel = Parallel(max_workers=2)
+    start_time = time.perf_counter()
+    for _ in range(2):
+        parallel.start_process(time.sleep, 0.3)
     parallel.wait()
 
-    assert not parallel.process_list == False
+    assert time.perf_counter() - start_time < 0.55
+
+
+def test_shutdown_without_wait():
+    parallel = Parallel(max_workers=1)
+
+    def run_sleep():
+        process = subprocess.Popen(["sleep", "30"], start_new_session=True)
+        return wait_with_usage(process=process, groups=parallel.groups)
+
+    running = parallel.start_process(run_sleep)
+    queued = parallel.start_process(run_sleep)
+    while not parallel.groups.processes:
+        time.sleep(0.01)
+    start_time = time.perf_counter()
+    parallel.shutdown(wait=False)
+    exit_code, _ = running.result(timeout=5)
+
+    assert exit_code < 0
+    assert queued.cancelled()
+    assert time.perf_counter() - start_time < 2
+
+
+def test_verdict():
+    assert TaskResult(is_pass=True, exit_code=0).verdict == "PASS"
+    assert TaskResult(is_pass=False, exit_code=1).verdict == "FAIL"
+    assert TaskResult(is_pass=False, exit_code=-9, is_timeout=True).verdict == "TIMEOUT"
+    assert (
+        TaskResult(is_pass=False, exit_code=-9, is_timeout=True, is_cutoff=True).verdict
+        == "CUTOFF"
+    )
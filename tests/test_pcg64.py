@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from utils.pcg64 import PCG64
+
+
+@pytest.fixture
+def arguments():
+    seeds = [0, 1, 123, (1 << 32) + 5, (1 << 64) - 1, 1 << 70]
+    ranges = [
+        (0, 1),
+        (0, 25),
+        (-3, 100),
+        (0, 1 << 32),
+        (5, (1 << 40) + 5),
+        (0, 1 << 63),
+    ]
+    return seeds, ranges
+
+
+def test_integers(arguments):
+    seeds, ranges = arguments
+    for seed in seeds:
+        for low, high in ranges:
+            expected = np.random.default_rng(seed=seed).integers(low, high, size=1)
+
+            assert PCG64(seed=seed).integers(low=low, high=high) == int(expected[0])
+
+
+def test_uint64(arguments):
+    seeds, ranges = arguments
+    for seed in seeds:
+        rng = np.random.default_rng(seed=seed)
+        expected = rng.integers(0, 1 << 64, size=1, dtype=np.uint64)
+
+        assert PCG64(seed=seed).integers(low=0, high=1 << 64) == int(expected[0])
+
+
+def test_random(arguments):
+    seeds, ranges = arguments
+    for seed in seeds:
+
+        assert (
+            PCG64(seed=[seed, 7]).random() == np.random.default_rng([seed, 7]).random()
+        )
+
+
+def test_sequence():
+    rng = PCG64(seed=42)
+    expected = np.random.default_rng(seed=42).integers(0, 10, size=50)
+
+    assert [rng.integers(low=0, high=10) for _ in range(50)] == expected.tolist()
+
+
+def test_invalid_range():
+    with pytest.raises(ValueError):
+        PCG64(seed=1).integers(low=5, high=5)
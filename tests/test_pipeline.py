@@ -0,0 +1,168 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from utils.admission import Admission
+from utils.args import Args
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.mix import Mix
+from utils.parallel import Parallel
+from utils.pipeline import Pipeline
+from utils.placement import Placement
+from utils.profiler import Profiler
+from utils.randomizer import Randomizer
+from utils.registry import Registry
+from utils.results import Results
+from utils.retention import Retention
+from utils.scheduler import Scheduler
+from utils.timer import Timer
+
+
+class ScriptedTimer(Timer):
+    """A timer reporting a scripted sequence of remaining times, then none."""
+
+    def __init__(self, times_left):
+        super().__init__()
+        self.times_left = list(times_left)
+
+    def time_remaining(self, start_time, end_time):
+        time_left = self.times_left.pop(0) if self.times_left else 0.0
+        if time_left <= 0:
+            self.is_time_remaining = False
+        return time_left
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    registry = Registry()
+    cleanups = []
+
+    def make_pipeline(workloads, argv):
+        argv = [arg for wl in workloads for arg in ("-wl", wl)] + argv + ["-quiet"]
+        args = Args().get_parser(workloads=registry.get_names()).parse_args(argv)
+        wl_config = {wl: registry.load_config(workload=wl) for wl in workloads}
+        # A Workload_1 attribute that sleeps until it is killed.
+        hang_path = tmp_path / "hang.sh"
+        hang_path.write_text("sleep 30\n")
+        config = wl_config["Workload_1"]
+        wl_config["Workload_1"] = SimpleNamespace(
+            **{name: getattr(config, name) for name in dir(config) if not name.startswith("_")}
+        )
+        wl_config["Workload_1"].bin_path = dict(config.bin_path, hang=str(hang_path))
+        results = Results(db_path=str(tmp_path / "results.db"))
+        run_id = results.start_run(start_seed=5, workloads=workloads)
+        logger = Logger(quiet=True)
+        parallel = Parallel(max_workers=4)
+        cleanups.extend([parallel.shutdown, results.close])
+        return Pipeline(
+            args=args,
+            is_iter=args.time is None,
+            wl_module={wl: registry.load_workload(workload=wl) for wl in workloads},
+            wl_config=wl_config,
+            parallel=parallel,
+            logger=logger,
+            profiler=Profiler(),
+            metrics=Metrics(),
+            results=results,
+            run_id=run_id,
+            retention=Retention(
+                policy="all", logger=logger, archive_path=str(tmp_path / "passed.zip")
+            ),
+            scheduler=Scheduler(),
+            mix=Mix(
+                workload_weights={wl: 1.0 for wl in workloads},
+                is_adaptive=True,
+            ),
+            placement=Placement(policy="none"),
+            admission=Admission(max_tasks=2, is_enabled=False),
+            randomizer=Randomizer(),
+        )
+
+    yield make_pipeline
+    for cleanup in cleanups:
+        cleanup()
+
+
+def get_rows(pipeline):
+    connection = sqlite3.connect(pipeline.results.db_path)
+    rows = connection.execute(
+        "SELECT iter_id, workload, attribute, verdict FROM tasks ORDER BY rowid"
+    ).fetchall()
+    connection.close()
+    return rows
+
+
+def test_fit_estimates(arguments):
+    pipeline = arguments(workloads=["Workload_1", "Workload_2"], argv=["-time", "10"])
+    pipeline.scheduler.estimates = {"Workload_1": 0.5, "Workload_2": 5.0}
+    total_iter = pipeline.run_until(
+        seed=5, timer=ScriptedTimer(times_left=[2.0]), start_time=0.0
+    )
+
+    # Only Workload_1 is expected to finish in the 2 seconds left.
+    assert total_iter == 1
+    assert get_rows(pipeline) == [(1, "Workload_1", "wl_1", "PASS")]
+    assert pipeline.scheduler.estimates["Workload_1"] != 0.5
+    assert pipeline.scheduler.estimates["Workload_2"] == 5.0
+    assert pipeline.mix.stats == {("Workload_1", "wl_1"): (1, 0)}
+
+
+def test_nothing_fits(arguments):
+    pipeline = arguments(workloads=["Workload_1", "Workload_2"], argv=["-time", "10"])
+    pipeline.scheduler.estimates = {"Workload_1": 3.0, "Workload_2": 5.0}
+    total_iter = pipeline.run_until(
+        seed=5, timer=ScriptedTimer(times_left=[2.0, 2.0]), start_time=0.0
+    )
+
+    assert total_iter == 0
+    assert get_rows(pipeline) == []
+    assert pipeline.totals["tasks"] == 0
+
+
+def test_cutoff_at_deadline(arguments):
+    pipeline = arguments(workloads=["Workload_1"], argv=["-time", "10"])
+    pipeline.wl_config["Workload_1"].attributes = ["hang"]
+    pipeline.wl_config["Workload_1"].attribute_weights = {"hang": 1.0}
+    total_iter = pipeline.run_until(
+        seed=5, timer=ScriptedTimer(times_left=[0.3]), start_time=0.0
+    )
+
+    # The task is killed when the run's time is up, which says nothing about
+    # the workload, so it is left out of the estimates and the adaptive mix.
+    assert total_iter == 1
+    assert get_rows(pipeline) == [(1, "Workload_1", "hang", "CUTOFF")]
+    assert pipeline.totals["cutoffs"] == 1
+    assert pipeline.totals["timeouts"] == 0
+    assert pipeline.scheduler.estimates == {}
+    assert pipeline.mix.stats == {}
+
+
+def test_skip_repeats(arguments, monkeypatch):
+    # A seed chain entering a 10-seed cycle after 3 seeds.
+    monkeypatch.setattr(
+        Randomizer, "generate_seed_from_seed", lambda self, seed: seed + 1 if seed < 12 else 3
+    )
+    pipeline = arguments(workloads=["Workload_1"], argv=["-iter", "100", "-skip-repeats"])
+    total_iter = pipeline.run_iterations(seed=0, iterations=100)
+    connection = sqlite3.connect(pipeline.results.db_path)
+    seeds = [int(row[0]) for row in connection.execute("SELECT seed FROM tasks ORDER BY rowid")]
+    connection.close()
+
+    # The run ends at the first repeated seed, so no seed runs twice.
+    assert total_iter == 13
+    assert seeds == list(range(13))
+
+
+def test_repeat_notice(arguments, monkeypatch, capsys):
+    monkeypatch.setattr(
+        Randomizer, "generate_seed_from_seed", lambda self, seed: seed + 1 if seed < 12 else 3
+    )
+    pipeline = arguments(workloads=["Workload_1"], argv=["-iter", "30"])
+    pipeline.logger.quiet = False
+    total_iter = pipeline.run_iterations(seed=0, iterations=30)
+
+    # Without -skip-repeats the run goes on, with the cycle reported once.
+    assert total_iter == 30
+    assert capsys.readouterr().out.count("Seed 3 already ran") == 1
@@ -0,0 +1,91 @@
+import os
+import threading
+
+import pytest
+
+from utils.placement import Placement, parse_cpu_list, read_topology
+
+
+@pytest.fixture
+def arguments():
+    return {0: ([0, 1, 2, 3], 1000), 1: ([4, 5, 6, 7], 1000)}
+
+
+def test_parse_cpu_list():
+    assert parse_cpu_list("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpu_list("") == []
+
+
+def test_read_topology(tmp_path):
+    node_dir = tmp_path / "node1"
+    node_dir.mkdir()
+    cpu = min(os.sched_getaffinity(0))
+    (node_dir / "cpulist").write_text(f"{cpu}\n")
+    (node_dir / "meminfo").write_text("Node 1 MemTotal:        2097152 kB\n")
+
+    assert read_topology(node_path=str(tmp_path)) == {1: ([cpu], 2048)}
+    assert read_topology(node_path=str(tmp_path / "missing"))[0][0] == sorted(
+        os.sched_getaffinity(0)
+    )
+
+
+def test_spread(arguments):
+    placement = Placement(policy="spread", topology=arguments)
+    first = placement.acquire(resources={"cpus": 1})
+    second = placement.acquire(resources={"cpus": 2})
+
+    assert (first.node, first.cpus) == (0, {0})
+    assert (second.node, second.cpus) == (1, {4, 5})
+
+
+def test_pack(arguments):
+    placement = Placement(policy="pack", topology=arguments)
+    first = placement.acquire(resources={"cpus": 1})
+    second = placement.acquire(resources={"cpus": 2})
+    third = placement.acquire(resources={"cpus": 2})
+
+    assert (first.node, second.node, third.node) == (0, 0, 1)
+    assert second.cpus == {1, 2}
+
+
+def test_no_oversubscription(arguments):
+    placement = Placement(policy="spread", topology=arguments)
+    leases = [placement.acquire(resources={"cpus": 4}) for _ in range(2)]
+    waiting = []
+    thread = threading.Thread(
+        target=lambda: waiting.append(placement.acquire(resources={"cpus": 1}))
+    )
+    thread.start()
+    thread.join(timeout=0.2)
+
+    assert not waiting
+    placement.release(lease=leases[1])
+    thread.join(timeout=5)
+    assert waiting[0].node == 1
+
+
+def test_memory_and_io(arguments):
+    placement = Placement(policy="spread", topology=arguments, io_slots=1)
+    big = placement.acquire(resources={"memory_mb": 800, "io_heavy": True})
+    other = placement.acquire(resources={"memory_mb": 800})
+
+    assert big.node != other.node
+    assert placement.find_node(cpus=1, memory_mb=300) is None
+    assert placement.get_needs(resources={"cpus": 16, "memory_mb": 9999}) == (
+        4,
+        1000,
+        False,
+    )
+    assert placement.io_in_use == 1
+
+
+def test_place():
+    cpu = min(os.sched_getaffinity(0))
+    mask = os.sched_getaffinity(0)
+    placement = Placement(policy="spread", topology={0: ([cpu], 0)})
+    with placement.place(resources={"cpus": 1}) as lease:
+        assert os.sched_getaffinity(0) == {cpu} == lease.cpus
+
+    assert os.sched_getaffinity(0) == mask
+    assert placement.free_cpus[0] == {cpu}
+    assert Placement().place(resources={}).__enter__() is None
@@ -0,0 +1,50 @@
+import json
+import pytest
+import time
+
+from utils.profiler import Profiler
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    profiler = Profiler(is_enabled=True)
+    trace_path = str(tmp_path / "trace.json")
+    return profiler, trace_path
+
+
+def test_span(arguments):
+    profiler, trace_path = arguments
+    with profiler.span("launch", iter_id=1):
+        time.sleep(0.01)
+    profiler.add_span(name="launch", start_ns=0, end_ns=2_000_000)
+    phases = profiler.get_phases()
+
+    assert phases["launch"]["count"] == 2
+    assert phases["launch"]["max"] >= 10
+    assert phases["launch"]["mean"] == phases["launch"]["total"] / 2
+
+
+def test_write_trace(arguments):
+    profiler, trace_path = arguments
+    with profiler.span("wait", iter_id=3):
+        pass
+    profiler.write_trace(trace_path=trace_path)
+    with open(trace_path) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+
+    assert len(events) == 1
+    assert (events[0]["name"], events[0]["ph"], events[0]["args"]) == (
+        "wait",
+        "X",
+        {"iter_id": 3},
+    )
+    assert events[0]["ts"] >= 0 and events[0]["dur"] >= 0
+
+
+def test_disabled():
+    profiler = Profiler()
+    with profiler.span("launch"):
+        pass
+    profiler.add_span(name="launch", start_ns=0, end_ns=1)
+
+    assert profiler.spans == []
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from utils.randomizer import Randomizer
+from utils.randomizer import CycleDetector, Randomizer
 
 
 @pytest.fixture
@@ -26,3 +27,95 @@ def test_pick_random_int(arguments):
     low, high, seed = arguments
 
     assert Randomizer().pick_random_int(low=low, high=high, seed=seed)
+
+
+def test_generate_seed_chain(arguments):
+    low, high, seed = arguments
+    randomizer = Randomizer()
+    chain = [seed]
+    for _ in range(9):
+        rng = np.random.default_rng(seed=chain[-1])
+        chain.append(
+            int(
+                rng.integers(
+                    low=randomizer.low, high=randomizer.high, size=1, dtype=np.uint64
+                )[0]
+            )
+        )
+
+    assert randomizer.generate_seed_chain(seed=seed, count=10) == chain
+
+
+def test_seed_space(arguments):
+    low, high, seed = arguments
+    seeds = Randomizer().generate_seed_chain(seed=seed, count=100)
+
+    assert len(set(seeds)) == 100
+    assert max(seeds) >= 1 << 32
+
+
+def test_generate_plan(arguments):
+    low, high, seed = arguments
+    randomizer = Randomizer()
+    seeds, picks = randomizer.generate_plan(
+        seed=seed, count=50, attribute_counts={"Workload_1": 7}
+    )
+    expected = [randomizer.pick_random_int(low=0, high=7, seed=s) for s in seeds]
+
+    assert picks["Workload_1"] == expected
+
+
+def test_generate_weighted_plan(arguments):
+    low, high, seed = arguments
+    randomizer = Randomizer()
+    seeds, picks = randomizer.generate_plan(
+        seed=seed,
+        count=2000,
+        attribute_counts={"Workload_1": 2, "Workload_2": 3},
+        attribute_weights={"Workload_2": [0.0, 1.0, 3.0]},
+        workload_chances={"Workload_1": 0.25},
+    )
+    ran = [pick for pick in picks["Workload_1"] if pick >= 0]
+    counts = np.bincount(picks["Workload_2"], minlength=3)
+
+    assert 0.2 < len(ran) / 2000 < 0.3
+    assert set(ran) == {0, 1}
+    assert counts[0] == 0
+    assert 2.5 < counts[2] / counts[1] < 3.5
+
+
+def test_numpy_sequences(arguments):
+    low, high, seed = arguments
+    randomizer = Randomizer()
+    for s in randomizer.generate_seed_chain(seed=seed, count=200):
+        rng = np.random.default_rng(seed=s)
+
+        assert randomizer.pick_random_int(low=low, high=high, seed=s) == int(
+            rng.integers(low=low, high=high, size=1)[0]
+        )
+
+
+def test_cycle_detector(arguments):
+    low, high, seed = arguments
+    # A chain entering a 5-seed cycle after 7 seeds.
+    chain = list(range(7)) + [7, 8, 9, 10, 11] * 20
+    detector = CycleDetector()
+    repeats = [detector.is_repeat(seed=s) for s in chain]
+    first = repeats.index(True)
+
+    assert not any(repeats[:12])
+    assert first < 2 * 12
+    assert all(repeats[first:])
+    assert detector.cycle_length == 5
+
+
+def test_cycle_detector_bounded():
+    # A chain entering a 10-seed cycle after 3 seeds, which Brent's algorithm
+    # alone only confirms at the 26th seed.
+    chain = [0, 1, 2] + list(range(3, 13)) * 10
+    detector = CycleDetector(max_seeds=len(chain))
+    repeats = [detector.is_repeat(seed=s) for s in chain]
+
+    assert repeats.index(True) == 13
+    assert all(repeats[13:])
+    assert detector.cycle_length == 10
@@ -0,0 +1,99 @@
+import json
+import os
+import pytest
+import shutil
+
+from utils.registry import Registry
+
+
+def make_workload(wl_path, name):
+    wl_dir = wl_path / name
+    wl_dir.mkdir()
+    (wl_dir / "__init__.py").touch()
+    (wl_dir / "run_config.py").touch()
+    (wl_dir / f"{name}.py").touch()
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    wl_path = tmp_path / "workloads"
+    wl_path.mkdir()
+    make_workload(wl_path, "workload_1")
+    (wl_path / "__pycache__").mkdir()
+    index_path = str(tmp_path / "workload_index.json")
+    return wl_path, index_path
+
+
+def test_get_names(arguments):
+    wl_path, index_path = arguments
+
+    assert Registry(wl_path=str(wl_path), index_path=index_path).get_names() == [
+        "Workload_1"
+    ]
+    with open(index_path) as index_file:
+        assert json.load(index_file)["workloads"]["Workload_1"] == {
+            "module": "workloads.workload_1.workload_1",
+            "config": "workloads.workload_1.run_config",
+        }
+
+
+def test_cached_index(arguments):
+    wl_path, index_path = arguments
+    Registry(wl_path=str(wl_path), index_path=index_path).get_names()
+    with open(index_path) as index_file:
+        index = json.load(index_file)
+    index["workloads"]["Workload_9"] = index["workloads"]["Workload_1"]
+    with open(index_path, "w") as index_file:
+        json.dump(index, index_file)
+
+    assert (
+        "Workload_9"
+        in Registry(wl_path=str(wl_path), index_path=index_path).get_names()
+    )
+
+
+def test_stale_index(arguments):
+    wl_path, index_path = arguments
+    Registry(wl_path=str(wl_path), index_path=index_path).get_names()
+    mtime_ns = os.stat(wl_path).st_mtime_ns
+    make_workload(wl_path, "workload_2")
+    os.utime(wl_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    assert Registry(wl_path=str(wl_path), index_path=index_path).get_names() == [
+        "Workload_1",
+        "Workload_2",
+    ]
+
+
+def test_stale_package(arguments):
+    wl_path, index_path = arguments
+    wl_dir = wl_path / "workload_9"
+    wl_dir.mkdir()
+    assert Registry(wl_path=str(wl_path), index_path=index_path).get_names() == [
+        "Workload_1"
+    ]
+    mtime_ns = os.stat(wl_dir).st_mtime_ns
+    (wl_dir / "run_config.py").touch()
+    (wl_dir / "workload_9.py").touch()
+    os.utime(wl_dir, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    assert Registry(wl_path=str(wl_path), index_path=index_path).get_names() == [
+        "Workload_1",
+        "Workload_9",
+    ]
+
+    (wl_dir / "workload_9.py").unlink()
+    os.utime(wl_dir, ns=(mtime_ns + 2 * 10**9, mtime_ns + 2 * 10**9))
+
+    assert Registry(wl_path=str(wl_path), index_path=index_path).get_names() == [
+        "Workload_1"
+    ]
+
+
+def test_load_workload():
+    registry = Registry()
+
+    assert registry.load_config(workload="Workload_1").attributes == ["wl_1"]
+    assert registry.load_workload(workload="Workload_2").get_command(
+        seed=1, bin_path="wl_2.sh"
+    )[:2] == [shutil.which("sh"), "wl_2.sh"]
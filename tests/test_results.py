@@ -0,0 +1,88 @@
+import pytest
+
+from utils.results import Results
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    results = Results(db_path=str(tmp_path / "results.db"))
+    row = {
+        "iter_id": 1,
+        "seed": str((1 << 64) - 1),
+        "workload": "Workload_2",
+        "attribute": "wl_2",
+        "exit_code": 0,
+        "duration": 0.5,
+        "user_time": 0.1,
+        "system_time": 0.05,
+        "max_rss": 2048,
+        "block_in": 0,
+        "block_out": 8,
+        "verdict": "PASS",
+        "stdout_path": "workload_2_1.out",
+        "stderr_path": "workload_2_1.err",
+    }
+    yield results, row
+    results.close()
+
+
+def test_journal_mode(arguments):
+    results, row = arguments
+
+    assert results.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_record_iteration(arguments):
+    results, row = arguments
+    run_id = results.start_run(start_seed=123, workloads=["Workload_2"])
+    results.record_iteration(
+        run_id=run_id,
+        rows=[
+            row,
+            dict(row, iter_id=2, verdict="FAIL", exit_code=1),
+            dict(row, iter_id=3, verdict="CUTOFF", exit_code=-9),
+        ],
+    )
+    results.finish_run(run_id=run_id)
+    failures = results.get_failures(attribute="wl_2")
+
+    assert len(failures) == 1
+    assert (failures[0]["iter_id"], failures[0]["seed"]) == (2, str((1 << 64) - 1))
+    assert results.get_failures(workload="Workload_1") == []
+
+
+def test_get_mean_durations(arguments):
+    results, row = arguments
+    run_id = results.start_run(start_seed=123, workloads=["Workload_2"])
+    results.record_iteration(
+        run_id=run_id,
+        rows=[
+            row,
+            dict(row, iter_id=2, duration=1.5),
+            dict(row, iter_id=3, duration=30.0, verdict="TIMEOUT"),
+            dict(row, iter_id=4, duration=0.1, verdict="CUTOFF"),
+        ],
+    )
+
+    assert results.get_mean_durations(workloads=["Workload_1", "Workload_2"]) == {
+        "Workload_2": 1.0
+    }
+
+
+def test_get_attribute_stats(arguments):
+    results, row = arguments
+    run_id = results.start_run(start_seed=123, workloads=["Workload_2"])
+    results.record_iteration(
+        run_id=run_id,
+        rows=[
+            row,
+            dict(row, iter_id=2, verdict="FAIL"),
+            dict(row, iter_id=3, attribute="wl_3", verdict="TIMEOUT"),
+            dict(row, iter_id=4, verdict="CUTOFF"),
+        ],
+    )
+
+    assert results.get_attribute_stats(workloads=["Workload_2"]) == {
+        ("Workload_2", "wl_2"): (2, 1),
+        ("Workload_2", "wl_3"): (1, 1),
+    }
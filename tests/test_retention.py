@@ -0,0 +1,66 @@
+import os
+import pytest
+import zipfile
+
+from utils.logger import Logger
+from utils.retention import Retention
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    logger = Logger()
+    logger.dir_path = str(tmp_path / "logs")
+    archive_path = str(tmp_path / "passed.zip")
+    seed = 123
+    return logger, archive_path, seed
+
+
+def make_logs(logger, retention, seed):
+    logger.spool_path = retention.spool_path
+    subdir_path, log_paths = logger.run_exec(
+        seed=seed, workload="Workload_1", current_iter=1
+    )
+    with open(log_paths[0], "w") as stdout_file:
+        stdout_file.write("The number picked is : 42\n")
+    return log_paths
+
+
+def test_all(arguments):
+    logger, archive_path, seed = arguments
+    retention = Retention(policy="all", logger=logger, archive_path=archive_path)
+    log_paths = make_logs(logger, retention, seed)
+
+    assert retention.retain(is_pass=True, seed=seed, log_paths=log_paths) == log_paths
+    assert all(os.path.exists(path) for path in log_paths)
+
+
+def test_failures(arguments):
+    logger, archive_path, seed = arguments
+    retention = Retention(policy="failures", logger=logger, archive_path=archive_path)
+    passed_paths = make_logs(logger, retention, seed)
+    failed_paths = make_logs(logger, retention, seed + 1)
+
+    assert retention.retain(is_pass=True, seed=seed, log_paths=passed_paths) == (
+        None,
+        None,
+    )
+    kept_paths = retention.retain(is_pass=False, seed=seed + 1, log_paths=failed_paths)
+    retention.close()
+
+    assert not any(os.path.exists(path) for path in passed_paths + failed_paths)
+    assert all(path.startswith(logger.dir_path) for path in kept_paths)
+    assert all(os.path.exists(path) for path in kept_paths)
+    assert not os.path.exists(retention.spool_path)
+
+
+def test_archive(arguments):
+    logger, archive_path, seed = arguments
+    retention = Retention(policy="archive", logger=logger, archive_path=archive_path)
+    log_paths = make_logs(logger, retention, seed)
+    retention.retain(is_pass=True, seed=seed, log_paths=log_paths)
+    retention.close()
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert len(archive.namelist()) == 2
+        member = [name for name in archive.namelist() if name.endswith(".out")][0]
+        assert archive.read(member) == b"The number picked is : 42\n"
@@ -0,0 +1,26 @@
+import pytest
+
+from utils.scheduler import Scheduler
+
+
+@pytest.fixture
+def arguments():
+    scheduler = Scheduler(estimates={"Workload_1": 2.0}, alpha=0.5)
+    workloads = ["Workload_1", "Workload_2"]
+    return scheduler, workloads
+
+
+def test_record(arguments):
+    scheduler, workloads = arguments
+    scheduler.record(workload="Workload_1", duration=4.0)
+    scheduler.record(workload="Workload_2", duration=1.0)
+
+    assert scheduler.estimates == {"Workload_1": 3.0, "Workload_2": 1.0}
+
+
+def test_fit(arguments):
+    scheduler, workloads = arguments
+
+    assert scheduler.fit(workloads=workloads, time_left=5.0) == workloads
+    assert scheduler.fit(workloads=workloads, time_left=1.0) == ["Workload_2"]
+    assert scheduler.fit(workloads=workloads, time_left=0.0) == []
@@ -0,0 +1,69 @@
+import os
+import signal
+
+import pytest
+
+from utils import spawn
+
+from utils.spawn import SpawnedProcess, resolve_executable, spawn_process
+from utils.usage import TaskTimeout, wait_with_usage
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    return str(tmp_path / "task.out"), str(tmp_path / "task.err")
+
+
+def test_spawn_process(arguments):
+    stdout_path, stderr_path = arguments
+    process = spawn_process(
+        argv=[resolve_executable("sh"), "-c", "echo out; echo err >&2; exit 3"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        env={"PATH": os.environ["PATH"]},
+    )
+    exit_code, usage = wait_with_usage(process=process)
+
+    assert isinstance(process, SpawnedProcess)
+    assert exit_code == 3
+    assert open(stdout_path).read() == "out\n"
+    assert open(stderr_path).read() == "err\n"
+
+
+def test_new_session(arguments):
+    stdout_path, stderr_path = arguments
+    process = spawn_process(
+        argv=[resolve_executable("sh"), "-c", "sleep 5 & sleep 5"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+    )
+
+    assert os.getpgid(process.pid) == process.pid
+    with pytest.raises(TaskTimeout):
+        wait_with_usage(process=process, timeout=0.2)
+
+
+@pytest.mark.skipif(not spawn.use_posix_spawn, reason="os.posix_spawn is not available")
+def test_signal_dispositions(arguments):
+    stdout_path, stderr_path = arguments
+    process = spawn_process(
+        argv=[resolve_executable("cat"), "/proc/self/status"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+    )
+    exit_code, _ = wait_with_usage(process=process)
+    status = dict(line.split(":\t", 1) for line in open(stdout_path).read().splitlines())
+    ignored = int(status["SigIgn"], 16)
+
+    # The runner ignores SIGPIPE and SIGXFSZ, but its workloads must not.
+    assert signal.getsignal(signal.SIGPIPE) == signal.SIG_IGN
+    assert isinstance(process, SpawnedProcess)
+    assert exit_code == 0
+    assert not ignored & (1 << (signal.SIGPIPE - 1))
+    assert not ignored & (1 << (signal.SIGXFSZ - 1))
+
+
+def test_resolve_executable():
+    assert os.path.isabs(resolve_executable("sh"))
+    assert resolve_executable("./bins/wl.sh") == "./bins/wl.sh"
+    assert resolve_executable("no-such-executable") == "no-such-executable"
@@ -0,0 +1,41 @@
+import pytest
+import time
+
+from utils.tee import Tee
+from utils.verdict import Verdict
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    verdict = Verdict(pass_patterns=["PASS"], fail_patterns=["FATAL"])
+    stdout_path = str(tmp_path / "task.out")
+    stderr_path = str(tmp_path / "task.err")
+    return verdict, stdout_path, stderr_path
+
+
+def test_run(arguments):
+    verdict, stdout_path, stderr_path = arguments
+    scanner = verdict.new_scanner()
+    exit_code, usage = Tee(scanner=scanner).run(
+        argv=["sh", "-c", "echo PASS"], stdout_path=stdout_path, stderr_path=stderr_path
+    )
+
+    assert (exit_code, scanner.result()) == (0, True)
+    assert usage.wall_time > 0
+    with open(stdout_path) as stdout_file:
+        assert stdout_file.read() == "PASS\n"
+
+
+def test_abort_on_fail(arguments):
+    verdict, stdout_path, stderr_path = arguments
+    scanner = verdict.new_scanner()
+    start_time = time.perf_counter()
+    exit_code, usage = Tee(scanner=scanner).run(
+        argv=["sh", "-c", "echo FATAL; exec sleep 5"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+    )
+
+    assert exit_code < 0
+    assert not scanner.result()
+    assert time.perf_counter() - start_time < 2
@@ -0,0 +1,82 @@
+import os
+import pytest
+import resource
+import subprocess
+import sys
+import time
+
+from utils.usage import Deadline, ResourceUsage, TaskTimeout, wait_with_usage
+
+
+@pytest.fixture
+def arguments():
+    busy_loop = "import time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass"
+    return busy_loop
+
+
+def test_wait_with_usage(arguments):
+    busy_loop = arguments
+    process = subprocess.Popen([sys.executable, "-c", busy_loop])
+    exit_code, usage = wait_with_usage(process=process)
+
+    assert exit_code == 0
+    assert process.returncode == 0
+    assert usage.user_time + usage.system_time >= 0.15
+
+
+def test_max_rss():
+    # The child starts out with the runner's memory mapped, so its peak only
+    # tells the workload's apart once it goes above the runner's.
+    runner_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    small = subprocess.Popen(["true"])
+    _, small_usage = wait_with_usage(process=small)
+    large_kb = runner_kb + 64 * 1024
+    large = subprocess.Popen(
+        [sys.executable, "-c", f"block = b'x' * {large_kb * 1024}"]
+    )
+    _, large_usage = wait_with_usage(process=large)
+
+    assert small_usage.max_rss == 0
+    assert large_usage.max_rss >= large_kb
+
+
+def test_wait_with_usage_timeout():
+    process = subprocess.Popen(["sleep", "5"], start_new_session=True)
+    with pytest.raises(TaskTimeout) as error:
+        wait_with_usage(process=process, timeout=0.2)
+
+    assert error.value.exit_code < 0
+    assert error.value.usage.wall_time < 2
+
+
+def test_timeout_kills_group():
+    # The grandchild holds the pipe open, so reading to EOF only returns once it is killed too.
+    process = subprocess.Popen(
+        ["sh", "-c", "sleep 5 & wait"], stdout=subprocess.PIPE, start_new_session=True
+    )
+    start_time = time.perf_counter()
+    with pytest.raises(TaskTimeout):
+        wait_with_usage(process=process, timeout=0.2)
+
+    assert process.stdout.read() == b""
+    assert time.perf_counter() - start_time < 2
+    process.stdout.close()
+
+
+def test_expire_after_exit():
+    process = subprocess.Popen(["true"], start_new_session=True)
+    deadline = Deadline(process=process, timeout=None)
+    # Waits for the exit without reaping the child, as if the timer fired just after it.
+    os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+    deadline.expire()
+    exit_code, _ = wait_with_usage(process=process, deadline=deadline)
+
+    assert not deadline.is_expired
+    assert exit_code == 0
+
+
+def test_merge():
+    usage = ResourceUsage(wall_time=1.0, user_time=0.5, max_rss=10, block_out=2)
+    total = usage.merge(ResourceUsage(wall_time=2.0, max_rss=30, block_out=3))
+
+    assert total == ResourceUsage(wall_time=3.0, user_time=0.5, max_rss=30, block_out=5)
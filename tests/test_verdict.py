@@ -0,0 +1,63 @@
+import pytest
+
+from utils.verdict import Verdict
+
+
+@pytest.fixture
+def arguments():
+    pass_patterns = ["The number picked is :"]
+    fail_patterns = ["Segmentation fault"]
+    chunk_size = 8
+    return pass_patterns, fail_patterns, chunk_size
+
+
+def test_scan_file_pass(arguments, tmp_path):
+    pass_patterns, fail_patterns, chunk_size = arguments
+    stdout_path = tmp_path / "task.out"
+    stdout_path.write_text("noise\nThe number picked is : 42\n")
+    verdict = Verdict(pass_patterns=pass_patterns, chunk_size=chunk_size)
+
+    assert verdict.scan_file(stdout_path=str(stdout_path))
+
+
+def test_scan_file_missing_marker(arguments, tmp_path):
+    pass_patterns, fail_patterns, chunk_size = arguments
+    stdout_path = tmp_path / "task.out"
+    stdout_path.write_text("The number picked is 42\n")
+    verdict = Verdict(pass_patterns=pass_patterns, chunk_size=chunk_size)
+
+    assert not verdict.scan_file(stdout_path=str(stdout_path))
+
+
+def test_scan_file_fail_after_pass(arguments, tmp_path):
+    pass_patterns, fail_patterns, chunk_size = arguments
+    stdout_path = tmp_path / "task.out"
+    stdout_path.write_text("The number picked is : 42\n" * 10 + "Segmentation fault\n")
+    verdict = Verdict(
+        pass_patterns=pass_patterns,
+        fail_patterns=fail_patterns,
+        chunk_size=chunk_size,
+    )
+
+    assert not verdict.scan_file(stdout_path=str(stdout_path))
+
+
+def test_feed_early_exit(arguments):
+    pass_patterns, fail_patterns, chunk_size = arguments
+    scanner = Verdict(pass_patterns=pass_patterns).new_scanner()
+
+    assert not scanner.feed(b"The number pi")
+    assert scanner.feed(b"cked is : 42\n")
+    assert scanner.result()
+
+
+def test_no_patterns(tmp_path):
+    stdout_path = tmp_path / "task.out"
+    stdout_path.write_text("anything\n")
+    verdict = Verdict(pass_patterns=[], fail_patterns=[])
+    scanner = verdict.new_scanner()
+
+    assert verdict.is_empty
+    assert verdict.scan_file(stdout_path=str(stdout_path))
+    assert scanner.feed(b"anything\n")
+    assert scanner.result()
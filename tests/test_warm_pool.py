@@ -0,0 +1,125 @@
+import os
+import time
+import types
+
+import pytest
+
+from utils.warm_pool import WarmPool
+from utils.workload import InProcessWorkload
+
+
+class Workload(InProcessWorkload):
+    run_config = types.SimpleNamespace(pass_patterns=["pid :"], fail_patterns=[])
+
+    def execute(self, seed, bin_path):
+        if bin_path == "hang":
+            time.sleep(60)
+        if bin_path == "raise":
+            raise RuntimeError("routine failed")
+        print(f"pid : {os.getpid()}")
+        return seed
+
+
+@pytest.fixture
+def arguments(tmp_path):
+    pool = WarmPool(modules=[__name__], size=2)
+    log_paths = [
+        (str(tmp_path / f"task_{i}.out"), str(tmp_path / f"task_{i}.err"))
+        for i in range(8)
+    ]
+    yield pool, log_paths
+    pool.shutdown()
+
+
+def start(pool, log_paths, seed, bin_path="ok", timeout=None):
+    return pool.start_task(
+        module=__name__,
+        seed=seed,
+        bin_path=bin_path,
+        stdout_path=log_paths[0],
+        stderr_path=log_paths[1],
+        timeout=timeout,
+        callback=lambda exit_code, usage, is_timeout: (exit_code, usage, is_timeout),
+    )
+
+
+def test_warm_workers(arguments):
+    pool, log_paths = arguments
+    futures = [start(pool, paths, seed=i) for i, paths in enumerate(log_paths)]
+    task_results = pool.wait(futures=futures)
+
+    assert [exit_code for exit_code, _, _ in task_results] == list(range(8))
+    assert all(usage.wall_time > 0 for _, usage, _ in task_results)
+    pids = {open(stdout_path).read() for stdout_path, _ in log_paths}
+    assert len(pids) <= 2
+
+
+def test_finished_tasks_released(arguments):
+    pool, log_paths = arguments
+    futures = [start(pool, paths, seed=i) for i, paths in enumerate(log_paths)]
+
+    assert [future.result(timeout=30)[0] for future in futures] == list(range(8))
+    assert pool.unfinished == {}
+    assert pool.wait() == []
+
+
+def test_timeout(arguments):
+    pool, log_paths = arguments
+    hung = start(pool, log_paths[0], seed=0, bin_path="hang", timeout=0.5)
+    exit_code, usage, is_timeout = hung.result(timeout=30)
+    after = start(pool, log_paths[1], seed=3)
+
+    assert is_timeout
+    assert exit_code != 0
+    assert usage.wall_time >= 0.5
+    assert after.result(timeout=30) == (3, after.result()[1], False)
+
+
+def test_exception(arguments):
+    pool, log_paths = arguments
+    exit_code, _, _ = start(pool, log_paths[0], seed=0, bin_path="raise").result()
+
+    assert exit_code == 1
+    assert "RuntimeError: routine failed" in open(log_paths[0][1]).read()
+
+
+def test_cold_run(tmp_path):
+    from workloads.workload_3.workload_3 import Workload as ColdWorkload
+
+    stdout_path, stderr_path = str(tmp_path / "wl.out"), str(tmp_path / "wl.err")
+    wl = ColdWorkload()
+    exit_code, _ = wl.run(
+        seed=5, bin_path="sort", stdout_path=stdout_path, stderr_path=stderr_path
+    )
+
+    assert exit_code == 0
+    assert wl.process_output(stdout_path=stdout_path)
+
+
+def test_shutdown_without_wait(tmp_path):
+    pool = WarmPool(modules=[__name__], size=2)
+    hung = start(pool, (str(tmp_path / "wl.out"), str(tmp_path / "wl.err")), 0, "hang")
+    time.sleep(0.5)
+    workers = list(pool.workers)
+    pool.shutdown(wait=False)
+
+    assert not any(worker["process"].is_alive() for worker in workers)
+    assert hung.result(timeout=30)[0] != 0
+
+
+def test_expire_after_result(tmp_path):
+    class UnreadPool(WarmPool):
+        # Leaves results unread, as when the reader has not taken the lock yet.
+        def read_results(self, worker):
+            pass
+
+    pool = UnreadPool(modules=[__name__], size=1)
+    start(pool, (str(tmp_path / "wl.out"), str(tmp_path / "wl.err")), 0, timeout=60)
+    worker = pool.workers[0]
+    task = worker["task"]
+    assert worker["conn"].poll(30)
+    pool.expire(worker, task)
+
+    assert not task["is_expired"]
+    assert worker["process"].is_alive()
+    pool.shutdown(wait=False)
@@ -0,0 +1,80 @@
+import os
+import shutil
+import types
+
+import pytest
+
+from utils.workload import Choice, InProcessWorkload, Integer, LaunchSpec, Workload
+
+
+@pytest.fixture
+def arguments():
+    run_config = types.SimpleNamespace(
+        command=["sh", "{bin_path}", "-n", "{num}", "--tag={letter}-{seed}"],
+        parameters={"num": Integer(low=0, high=100), "letter": Choice("abc")},
+        pass_patterns=["The number picked is :"],
+        fail_patterns=[],
+        resources={"cpus": 2},
+    )
+
+    class TestWorkload(Workload):
+        spec = LaunchSpec.compile(run_config)
+
+    TestWorkload.run_config = run_config
+    return TestWorkload()
+
+
+def test_get_command(arguments):
+    wl = arguments
+    argv = wl.get_command(seed=123, bin_path="/bins/wl.sh")
+
+    assert argv[:3] == [shutil.which("sh"), "/bins/wl.sh", "-n"]
+    assert argv[3] == str(wl.generate_random(low=0, high=100, seed=123))
+    assert argv[4] == f"--tag={Choice('abc').draw(seed=123, index=1)}-123"
+    assert argv == wl.get_command(seed=123, bin_path="/bins/wl.sh")
+    assert wl.resources == {"cpus": 2}
+
+
+def test_unknown_parameter():
+    with pytest.raises(ValueError):
+        LaunchSpec(command=["sh", "{bin_path}", "{missing}"])
+
+
+def test_run(arguments, tmp_path):
+    wl = arguments
+    wl.spec = LaunchSpec(command=["echo", "The number picked is : {seed}"])
+    stdout_path, stderr_path = str(tmp_path / "wl.out"), str(tmp_path / "wl.err")
+    exit_code, usage = wl.run(
+        seed=5, bin_path="", stdout_path=stdout_path, stderr_path=stderr_path
+    )
+
+    assert exit_code == 0
+    assert wl.process_output(stdout_path=stdout_path)
+
+
+def test_environment():
+    spec = LaunchSpec(command=["env"], environment={"WL_MODE": "fast"})
+
+    assert spec.argv == [shutil.which("env")]
+    assert spec.env["WL_MODE"] == "fast"
+    assert spec.env["PATH"] == os.environ["PATH"]
+
+
+def test_in_process_needs_execute():
+    class Incomplete(InProcessWorkload):
+        run_config = types.SimpleNamespace(pass_patterns=["ok"], fail_patterns=[])
+
+    with pytest.raises(TypeError, match="execute"):
+        Incomplete()
+
+
+def test_exit_code_only(arguments, tmp_path):
+    arguments.run_config.pass_patterns = []
+    wl = type(arguments)()
+    stdout_path = str(tmp_path / "task.out")
+    open(stdout_path, "w").close()
+
+    # Without markers, the exit code decides the verdict.
+    assert wl.check_task(stdout_path=stdout_path, exit_code=0)
+    assert not wl.check_task(stdout_path=stdout_path, exit_code=3)
+    assert not wl.check_task(stdout_path=stdout_path, exit_code=0, is_timeout=True)
@@ -0,0 +1,143 @@
+"""This module contains functions for throttling task launches when the host is saturated.
+
+Typical usage example:
+
+  admission = Admission(max_tasks=16, high=0.9, low=0.7)
+  while admission.is_full(task_count=in_flight_tasks + 2, is_idle=not in_flight):
+      if in_flight:
+          report_iteration(iteration=in_flight.popleft())
+      else:
+          time.sleep(admission.interval)
+"""
+
+import os
+from pathlib import Path
+import time
+from typing import Dict
+
+
+class Admission:
+    """Class definition for handling Workload-Runner's admission control.
+
+    The host's load is sampled at most once per interval as a set of signals,
+    each scaled so that 1.0 means saturated. Load is the 1-minute load
+    average per usable CPU. Memory is the fraction of memory not available.
+    The PSI signals are the share of the last 10 seconds in which some tasks
+    stalled on CPU, memory or IO, from /proc/pressure. When any signal reaches
+    the high watermark, the number of tasks allowed in flight is halved and no
+    task is admitted at all until every signal is back at or below the low
+    watermark. From then on, the limit grows by one task per sample up to the
+    maximum. In between the watermarks, it is held. An iteration with more
+    tasks than the limit is still admitted on its own once nothing else is in
+    flight, as long as launches are not held, so a limit held below the size
+    of an iteration cannot stall the run.
+
+    Attributes:
+        max_tasks: The number of tasks allowed in flight when the host is not loaded.
+        high: The signal level at which launches are throttled.
+        low: The signal level every signal must fall to before launches ramp back up.
+        interval: The minimum number of seconds between samples.
+        is_enabled: Whether launches are throttled at all.
+        proc_path: The procfs mount the signals are read from.
+        limit: The number of tasks currently allowed in flight.
+        is_holding: Whether launches are held until every signal falls to the low watermark.
+        signals: The last sampled signals.
+        sample_time: The time.monotonic() value of the last sample.
+    """
+
+    def __init__(
+        self,
+        max_tasks: int,
+        high: float = 0.9,
+        low: float = 0.7,
+        interval: float = 1.0,
+        is_enabled: bool = True,
+        proc_path: str = "/proc",
+    ):
+        """Initializes an instance from the Admission class.
+
+        Args:
+            max_tasks: The number of tasks allowed in flight when the host is not loaded.
+            high: The signal level at which launches are throttled.
+            low: The signal level every signal must fall to before launches ramp back up.
+            interval: The minimum number of seconds between samples.
+            is_enabled: Whether launches are throttled at all.
+            proc_path: The procfs mount the signals are read from.
+        """
+        self.max_tasks = max(1, max_tasks)
+        self.high = high
+        self.low = min(low, high)
+        self.interval = interval
+        self.is_enabled = is_enabled
+        self.proc_path = proc_path
+        self.cpu_count = len(os.sched_getaffinity(0))
+        self.limit = self.max_tasks
+        self.is_holding = False
+        self.signals = {}
+        self.sample_time = None
+
+    def read_signals(self) -> Dict[str, float]:
+        """Reads the host's load signals. Signals that cannot be read are left out.
+
+        Returns:
+            Each signal, scaled so that 1.0 means saturated.
+        """
+        signals = {"load": os.getloadavg()[0] / self.cpu_count}
+        try:
+            meminfo = {}
+            for line in Path(self.proc_path, "meminfo").read_text().splitlines():
+                key, _, value = line.partition(":")
+                meminfo[key] = int(value.split()[0])
+            signals["memory"] = 1.0 - meminfo["MemAvailable"] / meminfo["MemTotal"]
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            pass
+        for resource in ("cpu", "memory", "io"):
+            try:
+                line = Path(self.proc_path, "pressure", resource).read_text()
+            except OSError:
+                continue
+            # The first line is "some avg10=<percent> avg60=... avg300=... total=...".
+            avg10 = line.split()[1]
+            signals[f"psi_{resource}"] = float(avg10.partition("=")[2]) / 100
+        return signals
+
+    def get_limit(self) -> int:
+        """Gets the number of tasks allowed in flight, sampling the host if the interval has passed.
+
+        Returns:
+            The number of tasks allowed in flight, at least 1.
+        """
+        if not self.is_enabled:
+            return self.max_tasks
+        now = time.monotonic()
+        if self.sample_time is not None and now - self.sample_time < self.interval:
+            return self.limit
+        self.sample_time = now
+        self.signals = self.read_signals()
+        pressure = max(self.signals.values())
+        if pressure >= self.high:
+            self.limit = max(1, self.limit // 2)
+            self.is_holding = True
+        elif pressure <= self.low:
+            self.limit = min(self.max_tasks, self.limit + 1)
+            self.is_holding = False
+        return self.limit
+
+    def is_full(self, task_count: int, is_idle: bool = False) -> bool:
+        """Checks whether a number of tasks in flight would be more than the host can take now.
+
+        Args:
+            task_count: The number of tasks in flight, including those about to be launched.
+            is_idle: Whether nothing else is in flight, in which case the tasks about to be
+                launched are admitted even if there are more of them than the limit.
+
+        Returns:
+            Whether launches must wait, either because the limit would be exceeded or
+            because the host has not yet recovered from saturation.
+        """
+        if not self.is_enabled:
+            return False
+        limit = self.get_limit()
+        if self.is_holding:
+            return True
+        return not is_idle and task_count > limit
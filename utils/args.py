@@ -8,7 +8,10 @@ Typical usage example:
 """
 
 import argparse
-from typing import Dict
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .registry import Registry
 
 
 class Args:
@@ -18,12 +21,17 @@ class Args:
         """Initializes an instance from the Args class."""
         pass
 
-    def get_parser(self):
+    def get_parser(self, workloads: Optional[List[str]] = None):
         """Get the parser for storing input arguments.
 
+        Args:
+            workloads: The workloads that can be selected. Defaults to those in the workload registry.
+
         Returns:
             The parser object.
         """
+        if workloads is None:
+            workloads = Registry().get_names()
         parser = argparse.ArgumentParser()
         parser.add_argument(
             "-wl",
@@ -31,7 +39,7 @@ class Args:
             type=str,
             action="extend",
             nargs="+",
-            choices=["Workload_1", "Workload_2"],
+            choices=workloads,
             help="The workload(s) selected for the regression test",
             required=True,
         )
@@ -47,8 +55,218 @@ class Args:
             "-time", "--time", type=float, help="The regression runtime (in seconds)"
         )
         parser.add_argument("-seed", "--seed", type=int, help="The input seed")
+        parser.add_argument(
+            "-workers",
+            "--workers",
+            type=int,
+            help="The maximum number of tasks run at the same time",
+        )
+        parser.add_argument(
+            "-depth",
+            "--pipeline-depth",
+            type=int,
+            default=1,
+            help="The number of iterations kept in flight at the same time",
+        )
+        parser.add_argument(
+            "-backend",
+            "--backend",
+            type=str,
+            default="thread",
+            choices=["thread", "asyncio", "distributed"],
+            help="The execution backend used to launch the workloads",
+        )
+        parser.add_argument(
+            "-warm-pool",
+            "--warm-pool",
+            type=int,
+            default=0,
+            help="The number of warm worker processes running in-process Python workloads",
+        )
+        parser.add_argument(
+            "-placement",
+            "--placement",
+            type=str,
+            default="none",
+            choices=["none", "spread", "pack"],
+            help="Pin tasks to CPUs, spreading them over or packing them onto NUMA nodes",
+        )
+        parser.add_argument(
+            "-admission",
+            "--admission",
+            action="store_true",
+            help="Throttle launches while host load, memory or pressure stall information is high",
+        )
+        parser.add_argument(
+            "-admission-high",
+            "--admission-high",
+            type=float,
+            default=0.9,
+            help="The load level (1.0 = saturated) at which launches are throttled",
+        )
+        parser.add_argument(
+            "-admission-low",
+            "--admission-low",
+            type=float,
+            default=0.7,
+            help="The load level below which throttled launches ramp back up",
+        )
+        parser.add_argument(
+            "-timeout",
+            "--timeout",
+            type=float,
+            help="The maximum runtime of each task (in seconds), overriding the workload run configuration",
+        )
+        parser.add_argument(
+            "-pace",
+            "--pace",
+            type=float,
+            default=0.0,
+            help="The pause between banner and summary lines (in seconds)",
+        )
+        parser.add_argument(
+            "-quiet",
+            "--quiet",
+            action="store_true",
+            help="Print only failures, errors and the final summary",
+        )
+        parser.add_argument(
+            "-tee",
+            "--tee",
+            action="store_true",
+            help="Check workload output for pass/fail markers while it is written",
+        )
+        parser.add_argument(
+            "-skip-repeats",
+            "--skip-repeats",
+            action="store_true",
+            help="End the run once the seed chain is found to cycle back to seeds it has already run",
+        )
+        parser.add_argument(
+            "-db",
+            "--results-db",
+            type=str,
+            help="The SQLite database in which task results are recorded",
+        )
+        parser.add_argument(
+            "-retention",
+            "--retention",
+            type=str,
+            default="all",
+            choices=["all", "failures", "archive"],
+            help="Which logs to keep: all of them, only failures, or failures plus an archive of passes",
+        )
+        parser.add_argument(
+            "-mix",
+            "--mix",
+            type=str,
+            default="fixed",
+            choices=["fixed", "adaptive"],
+            help="Whether attribute weights are fixed or follow recent failure rates",
+        )
+        parser.add_argument(
+            "-profile",
+            "--profile",
+            action="store_true",
+            help="Record how long each phase of the run takes and write a Chrome trace",
+        )
+        parser.add_argument(
+            "-metrics-port",
+            "--metrics-port",
+            type=int,
+            help="Serve live metrics in the Prometheus text format on this local port",
+        )
+        parser.add_argument(
+            "-metrics-file",
+            "--metrics-file",
+            type=str,
+            help="Rewrite live metrics in the Prometheus text format to this file",
+        )
+        parser.add_argument(
+            "-metrics-interval",
+            "--metrics-interval",
+            type=float,
+            default=10.0,
+            help="The number of seconds between rewrites of the metrics file",
+        )
+        parser.add_argument(
+            "-listen",
+            "--listen",
+            type=str,
+            default="127.0.0.1:7878",
+            help="The HOST:PORT the distributed backend listens on for workers (-token is needed off loopback)",
+        )
+        parser.add_argument(
+            "-token",
+            "--token",
+            type=str,
+            help="The token workers must present to join a distributed run",
+        )
+        return parser
+
+    def get_worker_parser(self):
+        """Get the parser for storing a worker's input arguments.
+
+        Returns:
+            The parser object.
+        """
+        parser = argparse.ArgumentParser()
+        parser.add_argument(
+            "-connect",
+            "--connect",
+            type=str,
+            required=True,
+            help="The HOST:PORT of the coordinator run",
+        )
+        parser.add_argument(
+            "-slots",
+            "--slots",
+            type=int,
+            default=os.cpu_count(),
+            help="The maximum number of tasks running at the same time on this host",
+        )
+        parser.add_argument(
+            "-token",
+            "--token",
+            type=str,
+            help="The token presented to the coordinator",
+        )
+        parser.add_argument(
+            "-retention",
+            "--retention",
+            type=str,
+            default="all",
+            choices=["all", "failures", "archive"],
+            help="Which logs to keep on this host: all of them, only failures, or failures plus an archive of passes",
+        )
+        parser.add_argument(
+            "-placement",
+            "--placement",
+            type=str,
+            default="none",
+            choices=["none", "spread", "pack"],
+            help="Pin tasks to CPUs, spreading them over or packing them onto NUMA nodes",
+        )
+        parser.add_argument(
+            "-log-dir",
+            "--log-dir",
+            type=str,
+            help="The directory the task logs are written to on this host",
+        )
         return parser
 
+    def split_address(self, address: str) -> Tuple[str, int]:
+        """Splits a HOST:PORT address.
+
+        Args:
+            address: The address.
+
+        Returns:
+            The host and the port.
+        """
+        host, _, port = address.rpartition(":")
+        return host or "127.0.0.1", int(port)
+
     def get_bool_args(self, args: argparse.Namespace) -> Dict[str:bool, str:bool]:
         """Processes a set of boolean variables based on input arguments.
 
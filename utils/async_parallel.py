@@ -0,0 +1,289 @@
+"""This module contains functions for launching workload executables from a single asyncio event loop.
+
+Typical usage example:
+
+  async_parallel = AsyncParallel(max_workers=256)
+  future = async_parallel.start_process(
+      argv=["/usr/bin/sh", ".../bins/workload_1/wl_1.sh", "-n", "42"],
+      stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.out",
+      stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.err",
+      timeout=30,
+      env=environment,
+  )
+  exit_codes = async_parallel.wait()
+  async_parallel.shutdown()
+"""
+
+import asyncio
+from concurrent.futures import Future
+import contextlib
+import functools
+import os
+import subprocess
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+from .spawn import spawn_process
+from .usage import ProcessGroups, ResourceUsage, kill_group, wait_with_usage
+from .verdict import VerdictScanner
+
+
+class AsyncParallel:
+    """Class definition for handling Workload-Runner's asyncio tasks.
+
+    The event loop runs in a background thread, so tasks can be started from
+    regular code and are handed back as the same futures returned by Parallel.
+    Executables are started with spawn_process, as on the thread backend.
+    Spawning blocks the calling thread, so it runs in the loop's default
+    executor. Exits are awaited through a pidfd, so one loop can watch
+    hundreds of executables without a thread each.
+
+    Attributes:
+        max_workers: The maximum number of executables running at the same time.
+        process_list: A list of futures for the tasks that have not been waited on yet.
+        groups: The process groups of the running executables.
+        loop: The event loop running the executables.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initializes an instance from the AsyncParallel class.
+
+        Args:
+            max_workers: The maximum number of executables running at the same time.
+                No limit is applied when not set.
+        """
+        self.max_workers = max_workers
+        self.process_list = []
+        self.groups = ProcessGroups()
+        self.loop = asyncio.new_event_loop()
+        self.semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    async def run_process(
+        self,
+        argv: List[str],
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float],
+        callback: Optional[Callable[[int, ResourceUsage, bool], Any]],
+        scanner: Optional[VerdictScanner],
+        env: Optional[Dict[str, str]],
+    ) -> Any:
+        """Runs an executable and waits for it to exit.
+
+        Args:
+            argv: The command-line of the executable. argv[0] must be a path, as PATH is not searched.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the executable's process group is killed.
+            callback: A function called with the exit code, the resource usage and whether
+                the timeout expired once the executable exits.
+            scanner: If set, stdout is piped through this scanner on its way to the log.
+            env: The environment of the executable. Defaults to the runner's environment.
+
+        Returns:
+            The return value of the callback, or the exit code if there is no callback.
+        """
+        limit = self.semaphore if self.semaphore else contextlib.nullcontext()
+        async with limit:
+            with contextlib.ExitStack() as log_files:
+                start_time = time.perf_counter()
+                stdout_file = None
+                if scanner is None:
+                    launch = functools.partial(
+                        spawn_process,
+                        argv=argv,
+                        stdout_path=stdout_path,
+                        stderr_path=stderr_path,
+                        env=env,
+                    )
+                else:
+                    # stdout is piped through the scanner, which spawn_process
+                    # does not do, so the executable is started like Tee does.
+                    stdout_file = log_files.enter_context(open(stdout_path, "ab"))
+                    launch = functools.partial(
+                        subprocess.Popen,
+                        argv,
+                        stdout=subprocess.PIPE,
+                        stderr=log_files.enter_context(open(stderr_path, "a")),
+                        env=env,
+                        start_new_session=True,
+                    )
+                process = await self.loop.run_in_executor(None, self.spawn, launch)
+                is_timeout = False
+                try:
+                    await asyncio.wait_for(
+                        self.wait_process(
+                            process=process, stdout_file=stdout_file, scanner=scanner
+                        ),
+                        timeout,
+                    )
+                except asyncio.TimeoutError:
+                    is_timeout = True
+                    kill_group(process)
+                    await self.wait_exit(process=process)
+                finally:
+                    if scanner is not None:
+                        process.stdout.close()
+                # The executable has exited, so reaping it here does not block.
+                exit_code, usage = wait_with_usage(
+                    process=process, start_time=start_time, groups=self.groups
+                )
+        if callback is None:
+            return exit_code
+        # The callback usually reads log files, so keep it off the event loop.
+        return await self.loop.run_in_executor(
+            None, callback, exit_code, usage, is_timeout
+        )
+
+    def spawn(self, launch: Callable[[], subprocess.Popen]) -> subprocess.Popen:
+        """Starts an executable and tracks its process group until it is reaped.
+
+        It runs in the loop's default executor, so an executable started while
+        the backend is shut down without waiting is still killed.
+
+        Args:
+            launch: The function starting the executable.
+
+        Returns:
+            The running executable.
+        """
+        process = launch()
+        self.groups.add(process)
+        return process
+
+    async def wait_process(
+        self,
+        process: subprocess.Popen,
+        stdout_file: Optional[BinaryIO],
+        scanner: Optional[VerdictScanner],
+    ) -> None:
+        """Waits for an executable to exit, copying and checking its stdout if piped.
+
+        Args:
+            process: The running executable.
+            stdout_file: The open stdout log file, if stdout is piped.
+            scanner: The scanner checking the executable's stdout, if piped.
+        """
+        if scanner is not None:
+            reader = asyncio.StreamReader()
+            transport, _ = await self.loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), process.stdout
+            )
+            try:
+                while True:
+                    chunk = await reader.read(scanner.verdict.chunk_size)
+                    if not chunk:
+                        break
+                    stdout_file.write(chunk)
+                    if scanner.feed(chunk) and scanner.is_fail_seen:
+                        kill_group(process)
+            finally:
+                transport.close()
+        await self.wait_exit(process=process)
+
+    async def wait_exit(self, process: subprocess.Popen) -> None:
+        """Waits for an executable to exit without reaping it.
+
+        The executable is left for os.wait4, which is the only way to get its
+        resource usage, so asyncio's own child watcher is not used.
+
+        Args:
+            process: The running executable.
+        """
+        if not hasattr(os, "pidfd_open"):
+            while not os.waitid(
+                os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT
+            ):
+                await asyncio.sleep(0.005)
+            return
+        pidfd = os.pidfd_open(process.pid)
+        exited = self.loop.create_future()
+        self.loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            self.loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+    def start_process(
+        self,
+        argv: List[str],
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[int, ResourceUsage, bool], Any]] = None,
+        scanner: Optional[VerdictScanner] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Future:
+        """Adds an executable to run on the event loop.
+
+        Args:
+            argv: The command-line of the executable. argv[0] must be a path, as PATH is not searched.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the executable's process group is killed.
+            callback: A function called with the exit code, the resource usage and whether
+                the timeout expired once the executable exits.
+            scanner: If set, stdout is piped through this scanner on its way to the log.
+            env: The environment of the executable. Defaults to the runner's environment.
+
+        Returns:
+            The future holding the return value of the callback, or the exit code.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.run_process(
+                argv=argv,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+                timeout=timeout,
+                callback=callback,
+                scanner=scanner,
+                env=env,
+            ),
+            self.loop,
+        )
+        self.process_list.append(future)
+        return future
+
+    def wait(self, futures: Optional[List[Future]] = None) -> List[Any]:
+        """Waits for tasks to finish running.
+
+        Args:
+            futures: The futures to wait on. Defaults to every pending task.
+
+        Returns:
+            The return values of the tasks, in the order they were started.
+        """
+        if futures is None:
+            futures = self.process_list
+        results = [future.result() for future in futures]
+        waited = set(futures)
+        self.process_list = [f for f in self.process_list if f not in waited]
+        return results
+
+    async def cancel_tasks(self) -> None:
+        """Cancels every task on the event loop and waits for them to unwind."""
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self, wait: bool = True):
+        """Stops the event loop.
+
+        Args:
+            wait: Whether to wait for every pending task first. Otherwise the
+                running executables are killed and pending tasks are dropped,
+                as when the run is interrupted.
+        """
+        if wait:
+            self.wait()
+        else:
+            self.groups.kill_all()
+            asyncio.run_coroutine_threadsafe(self.cancel_tasks(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
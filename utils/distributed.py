@@ -0,0 +1,541 @@
+"""This module contains functions for spreading a regression run over several hosts.
+
+The coordinator is the main.py run: it owns the seed chain and hands out tasks.
+Workers connect to it, run each task's workload on their own host and send the
+verdict back, along with where the task's logs were kept. Messages are single
+lines of JSON sent over TCP.
+
+Typical usage example:
+
+  coordinator = Coordinator(host="0.0.0.0", port=7878, token="rack7")
+  future = coordinator.start_task(
+      workload="Workload_1", seed=123, attribute="wl_1", iter_id=1
+  )
+  task_results = coordinator.wait()
+  coordinator.shutdown()
+
+  worker = Worker(host="coordinator.lab", port=7878, slots=8)
+  worker.serve()
+"""
+
+from collections import deque
+from concurrent.futures import Future
+import hmac
+import ipaddress
+import json
+from pathlib import Path
+import socket
+import threading
+from typing import Any, Dict, List, Optional
+
+from .logger import Logger
+from .parallel import Parallel, TaskResult
+from .paths import Paths
+from .placement import Placement
+from .registry import Registry
+from .retention import Retention
+from .usage import ResourceUsage
+
+
+def is_loopback(host: str) -> bool:
+    """Checks whether an address only accepts connections from the host itself.
+
+    Args:
+        host: The address.
+
+    Returns:
+        Whether the address is a loopback address or "localhost".
+    """
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def send_message(conn: socket.socket, message: Dict):
+    """Sends a message as a single line of JSON.
+
+    Args:
+        conn: The connection to send the message on.
+        message: The message.
+    """
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def parse_result(message: Dict) -> TaskResult:
+    """Builds the outcome of a task from the result message sent by a worker.
+
+    Args:
+        message: The result message.
+
+    Returns:
+        The outcome of the task.
+
+    Raises:
+        KeyError: If a field is missing.
+        TypeError: If a field has the wrong type or the usage has unknown fields.
+        ValueError: If a field has the wrong value.
+    """
+    usage = ResourceUsage(**message["usage"])
+    log_paths = tuple(message["log_paths"])
+    if len(log_paths) != 2:
+        raise ValueError(f"Expected 2 log paths, got {len(log_paths)}")
+    error = message.get("error")
+    if error is not None and not isinstance(error, str):
+        raise TypeError(f"Expected the error to be a string, got {error!r}")
+    return TaskResult(
+        is_pass=bool(message["is_pass"]),
+        exit_code=int(message["exit_code"]),
+        duration=float(usage.wall_time),
+        usage=usage,
+        is_timeout=bool(message["is_timeout"]),
+        log_paths=log_paths,
+        error=error,
+    )
+
+
+class Coordinator:
+    """Class definition for handing out Workload-Runner's tasks to remote workers.
+
+    Coordinator has the same wait() and shutdown() methods as Parallel, and
+    start_task() returns a future in the same way as start_process(), so the
+    regression loop is the same on every backend. Tasks are queued until a
+    worker has a free slot and are sent to the worker with the most free slots.
+    Each task is fully determined by its seed, workload and attribute, so the
+    tasks of a worker that disconnects are queued again and rerun elsewhere.
+
+    Attributes:
+        token: The token workers must present when they connect, if any.
+        address: The host and port the coordinator listens on.
+        server: The listening socket.
+        lock: The lock guarding the task queue and the worker table.
+        pending: The IDs of the tasks waiting for a free worker slot.
+        tasks: The message and future of each task that has not finished.
+        workers: The hostname, slots and assigned task IDs of each connected worker.
+        next_id: The ID given to the next task.
+        process_list: A list of futures for the tasks that have not been waited on yet.
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0, token: Optional[str] = None
+    ):
+        """Initializes an instance from the Coordinator class.
+
+        Args:
+            host: The address to listen on.
+            port: The port to listen on. A free port is picked when set to 0.
+            token: The token workers must present when they connect, if any.
+
+        Raises:
+            ValueError: If a non-loopback address is given without a token, as any
+                host that can reach it could then join the run and send results.
+        """
+        if token is None and not is_loopback(host=host):
+            raise ValueError(f"Listening on {host} needs a token")
+        self.token = token
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()[:2]
+        self.lock = threading.Lock()
+        self.pending = deque()
+        self.tasks = {}
+        self.workers = {}
+        self.next_id = 0
+        self.process_list = []
+        threading.Thread(target=self.accept_workers, daemon=True).start()
+
+    def start_task(
+        self,
+        workload: str,
+        seed: int,
+        attribute: str,
+        iter_id: int,
+        timeout: Optional[float] = None,
+        is_tee: bool = False,
+    ) -> Future:
+        """Queues a task to run on the next free worker.
+
+        Args:
+            workload: The workload to be run.
+            seed: The current iteration seed.
+            attribute: The workload attribute selected for this task.
+            iter_id: The current iteration ID, used in the names of the task's logs.
+            timeout: The number of seconds after which the task is killed.
+            is_tee: Whether the worker checks the output while it is written.
+
+        Returns:
+            The future holding the outcome of the task.
+        """
+        future = Future()
+        with self.lock:
+            task_id = self.next_id
+            self.next_id += 1
+            message = {
+                "type": "task",
+                "task_id": task_id,
+                "workload": workload,
+                "seed": int(seed),
+                "attribute": attribute,
+                "iter_id": iter_id,
+                "timeout": timeout,
+                "is_tee": is_tee,
+            }
+            self.tasks[task_id] = (message, future)
+            self.pending.append(task_id)
+            self.dispatch()
+        self.process_list.append(future)
+        return future
+
+    def dispatch(self):
+        """Sends queued tasks to workers with free slots. Must be called with the lock held."""
+        while self.pending:
+            conn, worker = max(
+                self.workers.items(),
+                key=lambda item: item[1]["slots"] - len(item[1]["task_ids"]),
+                default=(None, None),
+            )
+            if worker is None or len(worker["task_ids"]) >= worker["slots"]:
+                return
+            task_id = self.pending.popleft()
+            try:
+                send_message(conn=conn, message=self.tasks[task_id][0])
+            except OSError:
+                # The worker's reader queues its tasks again when it sees the
+                # connection drop.
+                self.pending.appendleft(task_id)
+                worker["slots"] = 0
+                continue
+            worker["task_ids"].add(task_id)
+
+    def accept_workers(self):
+        """Accepts worker connections until the coordinator shuts down."""
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=self.serve_worker, args=(conn,), daemon=True
+            ).start()
+
+    def serve_worker(self, conn: socket.socket):
+        """Reads the results sent by a worker until it disconnects.
+
+        Args:
+            conn: The connection to the worker.
+        """
+        reader = conn.makefile("r", encoding="utf-8")
+        try:
+            hello = json.loads(reader.readline() or "{}")
+        except (OSError, ValueError):
+            hello = {}
+        if hello.get("type") != "hello" or not self.is_authorized(token=hello.get("token")):
+            conn.close()
+            return
+        worker = {
+            "hostname": hello.get("hostname"),
+            "slots": max(1, int(hello.get("slots", 1))),
+            "task_ids": set(),
+        }
+        with self.lock:
+            self.workers[conn] = worker
+            self.dispatch()
+        try:
+            for line in reader:
+                message = json.loads(line)
+                if message.get("type") == "result":
+                    self.finish_task(worker=worker, message=message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self.lock:
+                del self.workers[conn]
+                # Tasks keep their place at the front of the queue, so they
+                # are rerun before any task queued after them.
+                self.pending.extendleft(sorted(worker["task_ids"], reverse=True))
+                self.dispatch()
+            conn.close()
+
+    def is_authorized(self, token: Any) -> bool:
+        """Checks the token a worker presented, in constant time.
+
+        Args:
+            token: The token the worker presented, if any.
+
+        Returns:
+            Whether the worker may join the run.
+        """
+        if self.token is None:
+            return True
+        if not isinstance(token, str):
+            return False
+        return hmac.compare_digest(token.encode(), self.token.encode())
+
+    def finish_task(self, worker: Dict, message: Dict):
+        """Resolves the future of a task with the result sent by a worker.
+
+        A result that cannot be parsed, e.g. one sent by a worker running another
+        version of the runner, fails the task with the parse error, so the future
+        is always resolved once the task has been taken off the worker.
+
+        Args:
+            worker: The worker that ran the task.
+            message: The result message.
+
+        Raises:
+            ValueError: If the message does not name a task, in which case the
+                worker is dropped and its tasks are requeued.
+        """
+        task_id = message.get("task_id")
+        if not isinstance(task_id, int):
+            raise ValueError(f"Result without a task ID: {message!r}")
+        try:
+            result = parse_result(message=message)
+        except (KeyError, TypeError, ValueError) as error:
+            result = TaskResult(
+                is_pass=False,
+                exit_code=1,
+                duration=0.0,
+                usage=ResourceUsage(),
+                error=f"Malformed result from {worker['hostname']}: {type(error).__name__}: {error}",
+            )
+        with self.lock:
+            worker["task_ids"].discard(task_id)
+            _, future = self.tasks.pop(task_id, (None, None))
+            self.dispatch()
+        if future is not None:
+            future.set_result(result)
+
+    def wait(self, futures: Optional[List[Future]] = None) -> List[Any]:
+        """Waits for remote tasks to finish running.
+
+        Args:
+            futures: The futures to wait on. Defaults to every pending task.
+
+        Returns:
+            The outcomes of the tasks, in the order they were started.
+        """
+        if futures is None:
+            futures = self.process_list
+        results = [future.result() for future in futures]
+        waited = set(futures)
+        self.process_list = [f for f in self.process_list if f not in waited]
+        return results
+
+    def shutdown(self, wait: bool = True):
+        """Tells the workers to exit and stops listening.
+
+        Args:
+            wait: Whether to wait for every pending task first. Otherwise
+                pending tasks are dropped, as when the run is interrupted.
+        """
+        if wait:
+            self.wait()
+        try:
+            # Wakes the thread blocked in accept(), which close() alone does not.
+            self.server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.server.close()
+        with self.lock:
+            for conn in list(self.workers):
+                try:
+                    send_message(conn=conn, message={"type": "shutdown"})
+                except OSError:
+                    pass
+
+
+class Worker:
+    """Class definition for running Workload-Runner's tasks on behalf of a coordinator.
+
+    Each task's logs are written to the worker's own log directory and kept
+    according to the worker's retention policy. Log locations are reported as
+    "<hostname>:<path>", since they are only readable on the worker's host.
+
+    Attributes:
+        host: The coordinator's address.
+        port: The coordinator's port.
+        slots: The maximum number of tasks running at the same time.
+        token: The token presented to the coordinator, if any.
+        hostname: The name the worker reports its log locations under.
+        registry: The registry the workloads are loaded from.
+        logger: The logger creating the task logs.
+        retention: The retention policy applied to the task logs.
+        placement: The placement of the tasks on this host's CPUs.
+        parallel: The executor running the tasks, once the worker is serving.
+        wl_module: The loaded workload modules.
+        wl_config: The loaded workload run configurations.
+        lock: The lock guarding the connection, the loaded workloads and the retention policy.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        slots: int = 1,
+        token: Optional[str] = None,
+        retention: str = "all",
+        placement: str = "none",
+        log_path: Optional[str] = None,
+    ):
+        """Initializes an instance from the Worker class.
+
+        Args:
+            host: The coordinator's address.
+            port: The coordinator's port.
+            slots: The maximum number of tasks running at the same time.
+            token: The token presented to the coordinator, if any.
+            retention: The retention policy applied to the task logs.
+            placement: The placement policy of the tasks on this host.
+            log_path: The directory the task logs are written to. Defaults to the log directory.
+        """
+        self.host = host
+        self.port = port
+        self.slots = slots
+        self.token = token
+        self.hostname = socket.gethostname()
+        self.registry = Registry()
+        self.logger = Logger(quiet=True)
+        self.logger.dir_path = log_path or Paths().dir_path
+        self.retention = Retention(
+            policy=retention,
+            logger=self.logger,
+            archive_path=str(
+                Path(self.logger.dir_path, f"worker_{self.hostname}_{port}_passed.zip")
+            ),
+        )
+        self.logger.spool_path = self.retention.spool_path
+        self.placement = Placement(policy=placement)
+        self.parallel = None
+        self.wl_module = {}
+        self.wl_config = {}
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def serve(self):
+        """Runs the tasks sent by the coordinator until it shuts down or disconnects."""
+        self.conn = socket.create_connection((self.host, self.port))
+        send_message(
+            conn=self.conn,
+            message={
+                "type": "hello",
+                "hostname": self.hostname,
+                "slots": self.slots,
+                "token": self.token,
+            },
+        )
+        self.parallel = Parallel(max_workers=self.slots)
+        is_finished = False
+        try:
+            for line in self.conn.makefile("r", encoding="utf-8"):
+                message = json.loads(line)
+                if message["type"] == "shutdown":
+                    break
+                if message["type"] == "task":
+                    self.parallel.start_process(self.run_task, message=message)
+            is_finished = True
+        except OSError:
+            is_finished = True
+        finally:
+            # Running tasks are only killed if the worker itself is interrupted.
+            self.parallel.shutdown(wait=is_finished)
+            self.conn.close()
+            self.retention.close()
+
+    def load(self, workload: str):
+        """Loads a workload and its run configuration on first use.
+
+        Args:
+            workload: The workload to be loaded.
+        """
+        with self.lock:
+            if workload not in self.wl_module:
+                self.wl_config[workload] = self.registry.load_config(workload=workload)
+                self.wl_module[workload] = self.registry.load_workload(
+                    workload=workload
+                )
+
+    def run_task(self, message: Dict):
+        """Runs a task and sends the result to the coordinator.
+
+        A task that cannot be run on this host, e.g. because the workload or
+        attribute is not installed here, is reported as failed with the error,
+        so the coordinator is never left waiting on it.
+
+        Args:
+            message: The task message.
+        """
+        try:
+            result = self.run_workload(message=message)
+        except Exception as error:
+            error_text = f"{type(error).__name__}: {error}"
+            self.logger.print_error(
+                f"Task {message['task_id']} ({message['workload']}) failed: {error_text}"
+            )
+            result = {
+                "is_pass": False,
+                "exit_code": 1,
+                "is_timeout": False,
+                "usage": ResourceUsage()._asdict(),
+                "log_paths": [None, None],
+                "error": error_text,
+            }
+        with self.lock:
+            try:
+                send_message(
+                    conn=self.conn,
+                    message=dict(result, type="result", task_id=message["task_id"]),
+                )
+            except OSError:
+                pass
+
+    def run_workload(self, message: Dict) -> Dict:
+        """Runs a task's workload, checks its output and applies the retention policy.
+
+        Args:
+            message: The task message.
+
+        Returns:
+            The fields of the result message.
+        """
+        wl, seed = message["workload"], message["seed"]
+        self.load(workload=wl)
+        _, log_paths = self.logger.run_exec(
+            seed=seed, workload=wl, current_iter=message["iter_id"]
+        )
+        scanner = (
+            self.wl_module[wl].verdict.new_scanner() if message["is_tee"] else None
+        )
+        with self.placement.place(resources=self.wl_module[wl].resources):
+            exit_code, usage, is_timeout = self.wl_module[wl].run_task(
+                seed=seed,
+                bin_path=self.wl_config[wl].bin_path[message["attribute"]],
+                stdout_path=log_paths[0],
+                stderr_path=log_paths[1],
+                timeout=message["timeout"],
+                scanner=scanner,
+                groups=self.parallel.groups,
+            )
+        try:
+            is_pass = self.wl_module[wl].check_task(
+                stdout_path=log_paths[0],
+                exit_code=exit_code,
+                is_timeout=is_timeout,
+                scanner=scanner,
+            )
+        except FileNotFoundError:
+            is_pass = False
+        with self.lock:
+            kept_paths = self.retention.retain(
+                is_pass=is_pass, seed=seed, log_paths=log_paths
+            )
+        return {
+            "is_pass": is_pass,
+            "exit_code": exit_code,
+            "is_timeout": is_timeout,
+            "usage": usage._asdict(),
+            "log_paths": [
+                f"{self.hostname}:{path}" if path else None for path in kept_paths
+            ],
+        }
@@ -11,16 +11,15 @@ Typical usage example:
 """
 
 from datetime import datetime
-import hashlib
-import inspect
 import os
 from pathlib import Path
 import shutil
-import struct
+import sys
 import time
-from typing import Tuple, List
+from typing import Dict, List, Optional, Tuple
 
 from .paths import Paths
+from .usage import ResourceUsage
 
 
 class Logger:
@@ -28,37 +27,59 @@ class Logger:
 
     Attributes:
         term_size: The horizontal width of user's terminal.
-        hash_length: The length of the hash to be used for creating subdirectory names.
+        hash_length: The number of hex digits in subdirectory names (16 covers every 64-bit seed).
         dir_path: The path to Workload-Runner's log directory.
+        pace: The number of seconds to pause between banner and summary lines.
+        quiet: Whether to print only failures, errors and the final summary.
+        spool_path: If set, log files are created here instead of the log directory
+            until a retention policy decides whether to keep them.
     """
 
-    def __init__(self):
-        """Initializes an instance from the Logger class."""
+    def __init__(self, pace: float = 0.0, quiet: bool = False):
+        """Initializes an instance from the Logger class.
+
+        Args:
+            pace: The number of seconds to pause between banner and summary lines.
+            quiet: Whether to print only failures, errors and the final summary.
+        """
         self.term_size = shutil.get_terminal_size().columns
         self.hash_length = 16
         self.dir_path = Paths().dir_path
+        self.pace = pace
+        self.quiet = quiet
+        self.spool_path = None
+
+    def pause(self):
+        """Pauses the terminal output when interactive pacing is enabled."""
+        if self.pace > 0:
+            time.sleep(self.pace)
 
     def make_log_dir(self):
         """Creates the regression log directory for the regression run."""
         if not os.path.exists(self.dir_path):
             os.makedirs(self.dir_path)
 
-    def make_log_subdir(self, seed: int) -> str:
+    def make_log_subdir(self, seed: int, dir_path: Optional[str] = None) -> str:
         """Creates the regression log subdirectory for the current iteration.
 
         Args:
             seed: The iteration seed.
+            dir_path: The directory in which to create it. Defaults to the log directory.
 
         Returns:
             The absolute path to the subdirectory.
         """
-        path = str(Path(self.dir_path, self.get_subdir(seed=seed)))
+        path = str(Path(dir_path or self.dir_path, self.get_subdir(seed=seed)))
         if not os.path.exists(path):
             os.makedirs(path)
         return path
 
     def touch_log_files(
-        self, seed: int, workload: str, current_iter: int
+        self,
+        seed: int,
+        workload: str,
+        current_iter: int,
+        dir_path: Optional[str] = None,
     ) -> Tuple[str, str]:
         """Creates the regression log files (standard output and standard error) for the current iteration.
 
@@ -66,11 +87,12 @@ class Logger:
             seed: The iteration seed.
             workload: The workload selected for regression test.
             current_iter: The current iteration ID.
+            dir_path: The directory holding the log subdirectory. Defaults to the log directory.
 
         Returns:
             The absolute paths to the log files.
         """
-        subdir_path = str(Path(self.dir_path, self.get_subdir(seed=seed)))
+        subdir_path = str(Path(dir_path or self.dir_path, self.get_subdir(seed=seed)))
         paths = self.get_filenames(workload=workload, current_iter=current_iter)
         for path in paths:
             open(str(Path(subdir_path, path)), "a", encoding="utf-8").close()
@@ -127,6 +149,8 @@ class Logger:
             is_random: Whether a random seed was used to start the regression test instead of a user-defined seed.
         """
         self.make_log_dir()
+        if self.quiet:
+            return
         self.print_banner()
         self.print_wl(wl_list)
         self.print_run_config(is_iter=is_iter, is_random=is_random)
@@ -144,61 +168,115 @@ class Logger:
         Returns:
             The absolute paths to the log subdirectory and the log files.
         """
-        subdir_path = self.make_log_subdir(seed=seed)
+        subdir_path = self.make_log_subdir(seed=seed, dir_path=self.spool_path)
         log_paths = self.touch_log_files(
-            seed=seed, workload=workload, current_iter=current_iter
+            seed=seed,
+            workload=workload,
+            current_iter=current_iter,
+            dir_path=self.spool_path,
         )
         return subdir_path, log_paths
 
     def run_post_exec(
-        self, is_pass: bool, log_paths: Tuple[str, str], attribute: str, iter_id: int
+        self,
+        is_pass: bool,
+        log_paths: Tuple[str, str],
+        attribute: str,
+        iter_id: int,
+        is_timeout: bool = False,
+        is_remote: bool = False,
+        is_cutoff: bool = False,
     ) -> int:
         """Runs the post-execution stage functions.
 
         Args:
             is_pass: Whether the test passed.
             log_paths: The absolute paths to the standard output and standard error log files.
+            is_timeout: Whether the test was killed for running past its timeout.
+            is_remote: Whether the log paths are on a remote worker's host, as "<hostname>:<path>".
+            is_cutoff: Whether the test was killed because the regression runtime was used up.
 
         Returns:
             The exit code.
         """
         if is_pass:
-            self.print_to_terminal(f"{iter_id} {attribute}: PASSED!", color="green")
+            if not self.quiet:
+                self.print_to_terminal(f"{iter_id} {attribute}: PASSED!", color="green")
             return 1
         else:
-            self.print_to_terminal(f"<{iter_id}> {attribute}: FAILED!", color="red")
-            if os.path.exists(log_paths[0]):
+            if is_cutoff:
+                verdict = "CUT OFF"
+            else:
+                verdict = "TIMEOUT" if is_timeout else "FAILED"
+            self.print_to_terminal(f"<{iter_id}> {attribute}: {verdict}!", color="red")
+            if log_paths[0] and (is_remote or os.path.exists(log_paths[0])):
                 self.print_to_terminal(
                     f"Path to output log: {log_paths[0]}", color="red"
                 )
-            if os.path.exists(log_paths[1]):
+            if log_paths[1] and (is_remote or os.path.exists(log_paths[1])):
                 self.print_to_terminal(
                     f"Path to error log: {log_paths[1]}", color="red"
                 )
             return 0
 
     def print_summary(
-        self, pass_count: int, task_count: int, total_iter: int, total_time: float
+        self,
+        pass_count: int,
+        task_count: int,
+        total_iter: int,
+        total_time: float,
+        total_usage: Optional[ResourceUsage] = None,
+        timeout_count: int = 0,
+        cutoff_count: int = 0,
     ):
         """Prints the final summary of the entire regression run.
 
         Args:
             pass_count: The number of tests that passed.
+            task_count: The number of tests run.
             total_iter: The total number of iterations run.
             total_time: The total duration of the run.
+            total_usage: The resources used by all the workload executables.
+            timeout_count: The number of failed tests that were killed for running past their timeout.
+            cutoff_count: The number of tests killed because the regression runtime was used up.
+                They count as neither passed nor failed.
         """
         self.print_separator()
         self.print_to_terminal("TEST ENDED", color="cyan")
-        time.sleep(2)
+        self.pause()
         self.print_to_terminal(f"Total runtime: {total_time:.2f} seconds")
-        time.sleep(2)
+        self.pause()
         self.print_to_terminal(f"Total iterations: {total_iter}")
-        time.sleep(2)
+        self.pause()
         self.print_to_terminal(f"Total tasks: {task_count}")
-        time.sleep(2)
+        self.pause()
         self.print_to_terminal(f"Passed: {pass_count}")
-        time.sleep(2)
-        self.print_to_terminal(f"Failed: {task_count-pass_count}")
+        self.pause()
+        self.print_to_terminal(f"Failed: {task_count-pass_count-cutoff_count}")
+        if timeout_count:
+            self.pause()
+            self.print_to_terminal(f"Timed out: {timeout_count}")
+        if cutoff_count:
+            self.pause()
+            self.print_to_terminal(f"Cut off at the end of the runtime: {cutoff_count}")
+        if total_usage is not None:
+            self.pause()
+            self.print_to_terminal(
+                f"Workload CPU time: {total_usage.user_time:.2f}s user, "
+                f"{total_usage.system_time:.2f}s system"
+            )
+            self.pause()
+            if total_usage.max_rss:
+                self.print_to_terminal(
+                    f"Workload peak RSS: {total_usage.max_rss / 1024:.1f} MB"
+                )
+            else:
+                self.print_to_terminal("Workload peak RSS: below the runner's own")
+            self.pause()
+            self.print_to_terminal(
+                f"Workload block I/O: {total_usage.block_in} in, "
+                f"{total_usage.block_out} out"
+            )
         self.print_separator()
 
     def print_banner(self):
@@ -212,9 +290,9 @@ class Logger:
         self.print_to_terminal("Copyright 2025", fancy=True)
         self.print_separator()
         self.print_to_terminal("TEST STARTED", color="cyan")
-        time.sleep(2)
+        self.pause()
         self.print_to_terminal("Now running...")
-        time.sleep(2)
+        self.pause()
 
     def print_wl(self, wl_list: List[str]):
         """Prints the list of workloads selected for the regression run.
@@ -224,7 +302,7 @@ class Logger:
         """
         for wl in wl_list:
             self.print_to_terminal("> " + wl + " <")
-            time.sleep(2)
+            self.pause()
 
     def print_run_config(self, is_iter: bool, is_random: bool):
         """Prints the run configuration selected for the regression run.
@@ -237,12 +315,12 @@ class Logger:
             self.print_to_terminal("Test started with a random seed")
         else:
             self.print_to_terminal("Test started with a user-defined seed")
-        time.sleep(2)
+        self.pause()
         if is_iter:
             self.print_to_terminal("Test will run based on input iterations")
         else:
             self.print_to_terminal("Test will run based on input runtime")
-        time.sleep(2)
+        self.pause()
 
     def print_iter(self, current_iter: int, total_iter: int, seed: int):
         """Prints the seed and iteration ID for each iteration.
@@ -252,6 +330,8 @@ class Logger:
             total_iter: The total number of iterations to be run.
             seed: The iteration seed.
         """
+        if self.quiet:
+            return
         self.print_separator()
         self.print_to_terminal(f"Seed: {seed}")
         self.print_to_terminal(f"Iteration {current_iter} of {total_iter}")
@@ -266,6 +346,8 @@ class Logger:
         """
         left_pad = "\x1b[31m"
         right_pad = "\x1b[0m"
+        if self.quiet:
+            return
         self.print_separator()
         self.print_to_terminal(f"Seed: {seed}")
         if time_left < 0:
@@ -277,14 +359,52 @@ class Logger:
                 f"Time remaining: {time_left:.2f} of {total_time} seconds"
             )
 
+    def print_repeat(self, seed: int, is_skip: bool):
+        """Prints a notice that the seed chain has cycled back to a seed that has already been run.
+
+        Args:
+            seed: The repeated iteration seed.
+            is_skip: Whether the remaining iterations are skipped.
+        """
+        if self.quiet:
+            return
+        if is_skip:
+            self.print_to_terminal(
+                f"Seed {seed} already ran, skipping the remaining iterations",
+                color="cyan",
+            )
+        else:
+            self.print_to_terminal(f"Seed {seed} already ran", color="cyan")
+
     def print_error(self, text: str):
         """Prints an error message on the terminal (i.e., standard output)."""
         self.print_to_terminal(text=text.upper(), color="red")
 
+    def print_profile(self, phases: Dict[str, Dict[str, float]], trace_path: str):
+        """Prints the time spent in each phase of the regression run.
+
+        Args:
+            phases: The span count and total, mean and longest duration (in milliseconds) of each phase.
+            trace_path: The absolute path to the trace file.
+        """
+        self.print_to_terminal("PROFILE", color="cyan")
+        self.print_to_terminal(
+            f"{'phase':<14}{'count':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}"
+        )
+        for name, phase in phases.items():
+            self.print_to_terminal(
+                f"{name:<14}{phase['count']:>8}{phase['total']:>12.1f}"
+                f"{phase['mean']:>10.3f}{phase['max']:>10.1f}"
+            )
+        self.print_to_terminal(f"Trace: {trace_path}")
+        self.print_separator()
+
     def print_debug(self, text: str):
         """Prints a debug message on the terminal (i.e., standard output)."""
-        module_name = inspect.stack()[1].filename
-        line_number = inspect.stack()[1].lineno
+        # Only the caller's frame is needed; inspect.stack() would build every frame's context.
+        caller = sys._getframe(1)
+        module_name = caller.f_code.co_filename
+        line_number = caller.f_lineno
         self.print_to_terminal(
             text=f"Debug: {text}    File: {module_name}    Line: {line_number}",
             color="red",
@@ -293,16 +413,21 @@ class Logger:
     def get_subdir(self, seed: int) -> str:
         """Gets the name of the log subdirectory for the current iteration.
 
+        The seed is scrambled with the SplitMix64 finalizer. Every step of it can
+        be undone, so different 64-bit seeds always get different directories.
+
         Args:
             seed: The iteration seed.
 
         Returns:
             The name of the log subdirectory.
         """
-        seed_in_bytes = struct.pack(">H", seed)
-        hash_object = hashlib.sha256(seed_in_bytes)
-        subdir_name = hash_object.hexdigest()[: self.hash_length]
-        return subdir_name
+        mask = (1 << 64) - 1
+        z = int(seed) & mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        z ^= z >> 31
+        return f"{z:016x}"[: self.hash_length]
 
     def get_filenames(self, workload: str, current_iter: int) -> Tuple[str, str]:
         """Gets the name of the log files (standard output and standard error) for the current iteration.
@@ -0,0 +1,233 @@
+"""This module contains functions for exporting live metrics of a regression run.
+
+Typical usage example:
+
+  metrics = Metrics(port=9464, file_path=".../var/log/workload_runner/metrics.prom")
+  metrics.start()
+  metrics.task_started(workload="Workload_1")
+  metrics.task_finished(workload="Workload_1", verdict="PASS", duration=0.8)
+  metrics.close()
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Optional
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    1800.0,
+)
+
+
+class Metrics:
+    """Class definition for handling Workload-Runner's live metrics.
+
+    Counters are only updated by the thread running the regression loop, with
+    plain integer and dictionary updates and no locks. Exports run on a
+    background thread, which snapshots the dictionaries (a single atomic
+    operation under the GIL) and renders the Prometheus text exposition from
+    the snapshot.
+
+    Attributes:
+        port: The local port serving /metrics, if any.
+        file_path: The metrics file rewritten every interval, if any.
+        interval: The number of seconds between rewrites of the metrics file.
+        start_time: The time the run started (in seconds since the epoch).
+        started: The number of tasks started, per workload.
+        finished: The number of tasks finished, per (workload, verdict).
+        durations: The task duration histogram buckets, sum and count, per workload.
+        iterations: The number of iterations reported.
+        admission_limit: The number of tasks admission control allows in flight, if enabled.
+    """
+
+    def __init__(
+        self,
+        port: Optional[int] = None,
+        file_path: Optional[str] = None,
+        interval: float = 10.0,
+    ):
+        """Initializes an instance from the Metrics class.
+
+        Args:
+            port: The local port serving /metrics. No server is started when not set.
+            file_path: The metrics file rewritten every interval. No file is written when not set.
+            interval: The number of seconds between rewrites of the metrics file.
+        """
+        self.port = port
+        self.file_path = file_path
+        self.interval = interval
+        self.start_time = time.time()
+        self.started = {}
+        self.finished = {}
+        self.durations = {}
+        self.iterations = 0
+        self.admission_limit = None
+        self.server = None
+        self.stop_event = threading.Event()
+        self.writer = None
+
+    def task_started(self, workload: str):
+        """Counts a launched task.
+
+        Args:
+            workload: The workload of the task.
+        """
+        self.started[workload] = self.started.get(workload, 0) + 1
+
+    def task_finished(self, workload: str, verdict: str, duration: float):
+        """Counts a finished task and records its duration.
+
+        Args:
+            workload: The workload of the task.
+            verdict: The verdict of the task ("PASS", "FAIL" or "TIMEOUT").
+            duration: The wall-clock runtime of the task (in seconds).
+        """
+        key = (workload, verdict)
+        self.finished[key] = self.finished.get(key, 0) + 1
+        histogram = self.durations.get(workload)
+        if histogram is None:
+            histogram = self.durations[workload] = [[0] * len(DURATION_BUCKETS), 0.0, 0]
+        index = bisect.bisect_left(DURATION_BUCKETS, duration)
+        if index < len(DURATION_BUCKETS):
+            histogram[0][index] += 1
+        histogram[1] += duration
+        histogram[2] += 1
+
+    def iteration_finished(self):
+        """Counts a reported iteration."""
+        self.iterations += 1
+
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text.
+        """
+        started = dict(self.started)
+        finished = dict(self.finished)
+        durations = {
+            wl: (list(h[0]), h[1], h[2]) for wl, h in dict(self.durations).items()
+        }
+        lines = [
+            "# HELP workload_runner_start_time_seconds When the run started.",
+            "# TYPE workload_runner_start_time_seconds gauge",
+            f"workload_runner_start_time_seconds {self.start_time}",
+            "# HELP workload_runner_iterations_total Iterations reported.",
+            "# TYPE workload_runner_iterations_total counter",
+            f"workload_runner_iterations_total {self.iterations}",
+            "# HELP workload_runner_tasks_in_flight Tasks launched but not yet reported.",
+            "# TYPE workload_runner_tasks_in_flight gauge",
+            f"workload_runner_tasks_in_flight "
+            f"{sum(started.values()) - sum(finished.values())}",
+        ]
+        if self.admission_limit is not None:
+            lines += [
+                "# HELP workload_runner_admission_limit Tasks allowed in flight by admission control.",
+                "# TYPE workload_runner_admission_limit gauge",
+                f"workload_runner_admission_limit {self.admission_limit}",
+            ]
+        lines += [
+            "# HELP workload_runner_tasks_started_total Tasks launched.",
+            "# TYPE workload_runner_tasks_started_total counter",
+        ]
+        for workload, count in sorted(started.items()):
+            lines.append(
+                f'workload_runner_tasks_started_total{{workload="{workload}"}} {count}'
+            )
+        lines += [
+            "# HELP workload_runner_tasks_finished_total Tasks reported, by verdict.",
+            "# TYPE workload_runner_tasks_finished_total counter",
+        ]
+        for (workload, verdict), count in sorted(finished.items()):
+            lines.append(
+                f"workload_runner_tasks_finished_total"
+                f'{{workload="{workload}",verdict="{verdict}"}} {count}'
+            )
+        lines += [
+            "# HELP workload_runner_task_duration_seconds Wall-clock runtime of tasks.",
+            "# TYPE workload_runner_task_duration_seconds histogram",
+        ]
+        for workload, (buckets, total, count) in sorted(durations.items()):
+            cumulative = 0
+            for bound, bucket in zip(DURATION_BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(
+                    f"workload_runner_task_duration_seconds_bucket"
+                    f'{{workload="{workload}",le="{bound}"}} {cumulative}'
+                )
+            lines += [
+                f"workload_runner_task_duration_seconds_bucket"
+                f'{{workload="{workload}",le="+Inf"}} {max(count, cumulative)}',
+                f"workload_runner_task_duration_seconds_sum"
+                f'{{workload="{workload}"}} {total}',
+                f"workload_runner_task_duration_seconds_count"
+                f'{{workload="{workload}"}} {count}',
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write_file(self):
+        """Rewrites the metrics file, replacing it atomically."""
+        temp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(temp_path, self.file_path)
+
+    def start(self):
+        """Starts the metrics server and file writer, if configured."""
+        if self.port is not None:
+            # Only runs that serve metrics pay for importing http.server.
+            from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+            metrics = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = metrics.render().encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+            self.server.daemon_threads = True
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        if self.file_path is not None:
+            self.writer = threading.Thread(target=self.write_periodically, daemon=True)
+            self.writer.start()
+
+    def write_periodically(self):
+        """Rewrites the metrics file every interval until the run ends."""
+        while not self.stop_event.wait(self.interval):
+            self.write_file()
+
+    def close(self):
+        """Writes the final metrics file and stops the server and file writer."""
+        self.stop_event.set()
+        if self.writer is not None:
+            self.writer.join()
+            self.write_file()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
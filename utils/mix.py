@@ -0,0 +1,105 @@
+"""This module contains functions for weighting the workload mix of a regression run.
+
+Typical usage example:
+
+  mix = Mix(
+      workload_weights={"Workload_1": 1.0, "Workload_2": 3.0},
+      attribute_weights={"Workload_2": {"wl_2": 1.0}},
+      is_adaptive=True,
+      stats=results.get_attribute_stats(workloads=["Workload_1", "Workload_2"]),
+  )
+  chances = mix.get_workload_chances()
+  weights = mix.get_attribute_weights(workload="Workload_2", attributes=["wl_2"])
+  mix.record(workload="Workload_2", attribute="wl_2", is_pass=False)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class Mix:
+    """Class definition for deciding how often each workload and attribute is run.
+
+    A workload's weight sets its chance of running in an iteration, relative to
+    the heaviest workload, which runs in every iteration. An attribute's weight
+    sets how often it is picked relative to the other attributes of its workload.
+
+    In adaptive mode, each attribute's weight is scaled by 1 + boost times its
+    smoothed failure rate, (fails + 1) / (runs + 2). Attributes that fail often
+    get up to 1 + boost times their slots, rarely run ones start at 1 + boost / 2,
+    and stable, well-covered ones settle back to their configured weight.
+
+    Attributes:
+        workload_weights: The weight of each workload.
+        attribute_weights: The weight of each attribute, per workload. Missing attributes weigh 1.
+        is_adaptive: Whether attribute weights follow recent failure rates.
+        boost: The largest factor by which failures scale an attribute's weight.
+        stats: The number of runs and failures of each (workload, attribute) pair.
+    """
+
+    def __init__(
+        self,
+        workload_weights: Dict[str, float],
+        attribute_weights: Optional[Dict[str, Dict[str, float]]] = None,
+        is_adaptive: bool = False,
+        boost: float = 4.0,
+        stats: Optional[Dict[Tuple[str, str], Tuple[int, int]]] = None,
+    ):
+        """Initializes an instance from the Mix class.
+
+        Args:
+            workload_weights: The weight of each workload.
+            attribute_weights: The weight of each attribute, per workload.
+            is_adaptive: Whether attribute weights follow recent failure rates.
+            boost: The largest factor by which failures scale an attribute's weight.
+            stats: The number of runs and failures of each (workload, attribute) pair
+                recorded by earlier runs.
+        """
+        self.workload_weights = workload_weights
+        self.attribute_weights = attribute_weights or {}
+        self.is_adaptive = is_adaptive
+        self.boost = boost
+        self.stats = dict(stats or {})
+
+    def record(self, workload: str, attribute: str, is_pass: bool):
+        """Counts a finished task towards its attribute's failure rate.
+
+        Args:
+            workload: The workload that was run.
+            attribute: The workload attribute that was run.
+            is_pass: Whether the task passed.
+        """
+        runs, fails = self.stats.get((workload, attribute), (0, 0))
+        self.stats[(workload, attribute)] = (runs + 1, fails + (not is_pass))
+
+    def get_workload_chances(self) -> Optional[Dict[str, float]]:
+        """Gets the chance of each workload running in an iteration.
+
+        Returns:
+            The chance of each workload, or None if every workload runs in every iteration.
+        """
+        heaviest = max(self.workload_weights.values())
+        if all(w == heaviest for w in self.workload_weights.values()):
+            return None
+        return {wl: w / heaviest for wl, w in self.workload_weights.items()}
+
+    def get_attribute_weights(
+        self, workload: str, attributes: List[str]
+    ) -> Optional[List[float]]:
+        """Gets the weight of each attribute of a workload.
+
+        Args:
+            workload: The workload.
+            attributes: The attributes of the workload, in run configuration order.
+
+        Returns:
+            The weight of each attribute, or None if they are all picked uniformly.
+        """
+        configured = self.attribute_weights.get(workload, {})
+        weights = [configured.get(attribute, 1.0) for attribute in attributes]
+        if self.is_adaptive:
+            for index, attribute in enumerate(attributes):
+                runs, fails = self.stats.get((workload, attribute), (0, 0))
+                weights[index] *= 1 + self.boost * (fails + 1) / (runs + 2)
+        elif all(w == weights[0] for w in weights):
+            return None
+        return weights
@@ -1,46 +1,124 @@
-"""This module contains functions for launching parallel tasks in Workload-Runner. 
+"""This module contains functions for launching parallel tasks in Workload-Runner.
 
 Typical usage example:
 
-  parallel = Parallel()
-  parallel.start_process(
-      func=workloads.workload_1.workload_1.Workload().run(
-          seed=123,
-          bin_path=".../bins/workload_1/wl_1.sh",
-          stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.out",
-          stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.err",
-      )
+  parallel = Parallel(max_workers=4)
+  future = parallel.start_process(
+      workloads.workload_1.workload_1.Workload().run,
+      seed=123,
+      bin_path=".../bins/workload_1/wl_1.sh",
+      stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.out",
+      stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.err",
   )
-  parallel.wait()
+  exit_codes = parallel.wait()
 """
 
-from multiprocessing import Process
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from .usage import ProcessGroups, ResourceUsage
+
+
+class TaskResult(NamedTuple):
+    """The outcome of a single workload task.
+
+    Attributes:
+        is_pass: Whether the task passed.
+        exit_code: The exit code of the workload's executable.
+        duration: The wall-clock runtime of the workload's executable (in seconds).
+        usage: The resources used by the workload's executable.
+        is_timeout: Whether the workload's executable was killed for running past its timeout.
+        is_cutoff: Whether the timeout that killed it was the end of the regression runtime,
+            rather than a timeout configured for the task.
+        log_paths: Where a remote worker kept the task's logs, if the task ran remotely.
+        error: Why a remote worker could not run the task, if it could not.
+    """
+
+    is_pass: bool
+    exit_code: int
+    duration: float = 0.0
+    usage: ResourceUsage = ResourceUsage()
+    is_timeout: bool = False
+    is_cutoff: bool = False
+    log_paths: Optional[Tuple[Optional[str], Optional[str]]] = None
+    error: Optional[str] = None
+
+    @property
+    def verdict(self) -> str:
+        """The verdict recorded for the task ("PASS", "FAIL", "TIMEOUT" or "CUTOFF")."""
+        if self.is_cutoff:
+            return "CUTOFF"
+        if self.is_timeout:
+            return "TIMEOUT"
+        return "PASS" if self.is_pass else "FAIL"
 
 
 class Parallel:
     """Class definition for handling Workload-Runner's parallel tasks.
 
+    Tasks are submitted to a pool of worker threads. The workloads themselves
+    run as child processes, so the threads only wait on them and do not
+    contend for the interpreter. Tasks track their child processes in groups,
+    so they can be killed when the run is interrupted.
+
     Attributes:
-        process_list: A list of process objects running in parallel.
+        max_workers: The maximum number of tasks running at the same time.
+        process_list: A list of futures for the tasks that have not been waited on yet.
+        groups: The process groups of the child processes started by the tasks.
     """
 
-    def __init__(self):
-        """Initializes an instance from the Parallel class."""
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initializes an instance from the Parallel class.
+
+        Args:
+            max_workers: The maximum number of tasks running at the same time.
+                Defaults to the executor's own limit when not set.
+        """
+        self.max_workers = max_workers
         self.process_list = []
-        pass
+        self.groups = ProcessGroups()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def start_process(self, func: Callable, *args, **kwargs) -> Future:
+        """Adds a task to run in parallel.
+
+        Args:
+            func: A function/method to be run in parallel.
+            *args: The positional arguments passed to the function.
+            **kwargs: The keyword arguments passed to the function.
+
+        Returns:
+            The future holding the return value of the function.
+        """
+        future = self.executor.submit(func, *args, **kwargs)
+        self.process_list.append(future)
+        return future
 
-    def start_process(self, func):
-        """Adds a process to run in parallel.
+    def wait(self, futures: Optional[List[Future]] = None) -> List[Any]:
+        """Waits for parallel tasks to finish running.
 
         Args:
-            func: A function/method/process to be run in parallel.
+            futures: The futures to wait on. Defaults to every pending task.
 
+        Returns:
+            The return values of the tasks, in the order they were started.
         """
-        p = Process(target=func)
-        p.start()
-        self.process_list.append(p)
-
-    def wait(self):
-        """Waits for all the parallel processes to finish running."""
-        for p in self.process_list:
-            p.join()
+        if futures is None:
+            futures = self.process_list
+        results = [future.result() for future in futures]
+        waited = set(futures)
+        self.process_list = [f for f in self.process_list if f not in waited]
+        return results
+
+    def shutdown(self, wait: bool = True):
+        """Releases the worker threads.
+
+        Args:
+            wait: Whether to wait for every pending task first. Otherwise queued
+                tasks are cancelled and the child processes of running tasks are
+                killed, as when the run is interrupted.
+        """
+        if not wait:
+            self.groups.kill_all()
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+        self.process_list = []
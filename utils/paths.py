@@ -18,6 +18,7 @@ class Paths:
         wl_path: The absolute path to the workloads directory.
         bins_path: The absolute path to the bins directory.
         dir_path: The absolute path to Workload-Runner's log directory.
+        db_path: The absolute path to Workload-Runner's result database.
     """
 
     def __init__(self):
@@ -35,6 +36,7 @@ class Paths:
             .joinpath("workload_runner")
             .resolve()
         )
+        self.db_path = str(Path(self.dir_path).joinpath("results.db"))
 
     def get_wl_module(self, workload: str) -> str:
         """Creates the string for referencing a workload module.
@@ -0,0 +1,191 @@
+"""This module contains a pure-Python PCG64 bit generator that matches NumPy's default_rng.
+
+Seeding follows numpy.random.SeedSequence, and integers() and random() follow
+numpy.random.Generator, so for the same seed the same numbers are drawn as with
+np.random.default_rng(seed) without importing NumPy.
+
+Typical usage example:
+
+  rng = PCG64(seed=123)
+  number = rng.integers(low=0, high=100)
+  fraction = PCG64(seed=[123, 7]).random()
+"""
+
+from typing import List, Sequence, Union
+
+MASK32 = 0xFFFFFFFF
+MASK64 = 0xFFFFFFFFFFFFFFFF
+MASK128 = (1 << 128) - 1
+
+# SeedSequence hashing constants.
+POOL_SIZE = 4
+INIT_A = 0x43B0D7E5
+MULT_A = 0x931E8875
+INIT_B = 0x8B51F9DD
+MULT_B = 0x58F38DED
+MIX_MULT_L = 0xCA01F9DD
+MIX_MULT_R = 0x4973F715
+XSHIFT = 16
+
+# PCG64 (XSL-RR 128/64) LCG multiplier.
+PCG_MULT = 0x2360ED051FC65DA44385DF649FCCF645
+
+
+def to_words(seed: Union[int, Sequence[int]]) -> List[int]:
+    """Splits a seed into 32-bit words, least significant first, as SeedSequence does.
+
+    Args:
+        seed: A non-negative integer or a sequence of them.
+
+    Returns:
+        The 32-bit words.
+    """
+    if not isinstance(seed, int):
+        return [word for value in seed for word in to_words(int(value))]
+    if seed < 0:
+        raise ValueError("Seeds must be non-negative")
+    words = [seed & MASK32]
+    seed >>= 32
+    while seed:
+        words.append(seed & MASK32)
+        seed >>= 32
+    return words
+
+
+def generate_state(seed: Union[int, Sequence[int]], n_words: int) -> List[int]:
+    """Generates the initial state words of a bit generator from a seed.
+
+    Args:
+        seed: A non-negative integer or a sequence of them.
+        n_words: The number of 32-bit words to generate.
+
+    Returns:
+        The 32-bit state words.
+    """
+    entropy = to_words(seed)
+    hash_const = INIT_A
+
+    def hashmix(value: int) -> int:
+        nonlocal hash_const
+        value = (value ^ hash_const) & MASK32
+        hash_const = (hash_const * MULT_A) & MASK32
+        value = (value * hash_const) & MASK32
+        return value ^ (value >> XSHIFT)
+
+    def mix(x: int, y: int) -> int:
+        result = (MIX_MULT_L * x - MIX_MULT_R * y) & MASK32
+        return result ^ (result >> XSHIFT)
+
+    pool = [hashmix(entropy[i] if i < len(entropy) else 0) for i in range(POOL_SIZE)]
+    for i_src in range(POOL_SIZE):
+        for i_dst in range(POOL_SIZE):
+            if i_src != i_dst:
+                pool[i_dst] = mix(pool[i_dst], hashmix(pool[i_src]))
+    for i_src in range(POOL_SIZE, len(entropy)):
+        for i_dst in range(POOL_SIZE):
+            pool[i_dst] = mix(pool[i_dst], hashmix(entropy[i_src]))
+
+    hash_const = INIT_B
+    state = []
+    for i_dst in range(n_words):
+        value = pool[i_dst % POOL_SIZE] ^ hash_const
+        hash_const = (hash_const * MULT_B) & MASK32
+        value = (value * hash_const) & MASK32
+        state.append(value ^ (value >> XSHIFT))
+    return state
+
+
+class PCG64:
+    """Class definition for a PCG64 bit generator seeded like np.random.default_rng.
+
+    Attributes:
+        state: The 128-bit LCG state.
+        inc: The 128-bit LCG increment.
+        uinteger: The upper half of the last 64-bit output, kept for the next 32-bit draw.
+        has_uint32: Whether uinteger holds an unused 32-bit draw.
+    """
+
+    def __init__(self, seed: Union[int, Sequence[int]]):
+        """Initializes an instance from the PCG64 class.
+
+        Args:
+            seed: A non-negative integer or a sequence of them.
+        """
+        words = generate_state(seed=seed, n_words=8)
+        values = [words[i] | (words[i + 1] << 32) for i in range(0, 8, 2)]
+        init_state = (values[0] << 64) | values[1]
+        init_seq = (values[2] << 64) | values[3]
+        self.state = 0
+        self.inc = ((init_seq << 1) | 1) & MASK128
+        self.step()
+        self.state = (self.state + init_state) & MASK128
+        self.step()
+        self.uinteger = 0
+        self.has_uint32 = False
+
+    def step(self):
+        """Advances the LCG state."""
+        self.state = (self.state * PCG_MULT + self.inc) & MASK128
+
+    def next_uint64(self) -> int:
+        """Draws a 64-bit unsigned integer.
+
+        Returns:
+            The random integer.
+        """
+        self.step()
+        value = ((self.state >> 64) ^ self.state) & MASK64
+        rotation = self.state >> 122
+        return ((value >> rotation) | (value << (-rotation & 63))) & MASK64
+
+    def next_uint32(self) -> int:
+        """Draws a 32-bit unsigned integer, using each 64-bit output twice.
+
+        Returns:
+            The random integer.
+        """
+        if self.has_uint32:
+            self.has_uint32 = False
+            return self.uinteger
+        value = self.next_uint64()
+        self.has_uint32 = True
+        self.uinteger = value >> 32
+        return value & MASK32
+
+    def integers(self, low: int, high: int) -> int:
+        """Draws an integer from a range, as Generator.integers does for a single value.
+
+        Args:
+            low: The lowest integer in the range.
+            high: The highest integer in the range (exclusive). The range may span at most 2**64 values.
+
+        Returns:
+            The random integer.
+        """
+        span = high - low - 1
+        if span < 0 or span > MASK64:
+            raise ValueError("Invalid integer range")
+        if span == 0:
+            return low
+        if span == MASK64:
+            return low + self.next_uint64()
+        # Lemire's bounded draw, on 32-bit outputs when the range fits in them.
+        if span <= MASK32:
+            bits, mask, draw = 32, MASK32, self.next_uint32
+        else:
+            bits, mask, draw = 64, MASK64, self.next_uint64
+        span_excl = span + 1
+        product = draw() * span_excl
+        if product & mask < span_excl:
+            threshold = (mask - span) % span_excl
+            while product & mask < threshold:
+                product = draw() * span_excl
+        return low + (product >> bits)
+
+    def random(self) -> float:
+        """Draws a float in [0, 1), as Generator.random does for a single value.
+
+        Returns:
+            The random float.
+        """
+        return (self.next_uint64() >> 11) * (1.0 / 9007199254740992.0)
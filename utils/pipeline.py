@@ -0,0 +1,631 @@
+"""This module contains functions for launching Workload-Runner's iterations and reporting their results.
+
+Typical usage example:
+
+  pipeline = Pipeline(
+      args=args,
+      wl_module=wl_module,
+      wl_config=wl_config,
+      parallel=Parallel(max_workers=4),
+      ...
+  )
+  iter_count = pipeline.run_iterations(seed=123, iterations=10)
+  pass_count = pipeline.totals["passes"]
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import Future
+import functools
+import time
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .admission import Admission
+from .logger import Logger
+from .metrics import Metrics
+from .mix import Mix
+from .parallel import Parallel, TaskResult
+from .placement import Placement
+from .profiler import Profiler
+from .randomizer import CycleDetector, Randomizer
+from .results import Results
+from .retention import Retention
+from .scheduler import Scheduler
+from .timer import Timer
+from .usage import ResourceUsage
+from .verdict import VerdictScanner
+
+
+class Pipeline:
+    """Class definition for launching Workload-Runner's iterations and reporting their results.
+
+    Seeds are chained deterministically, so later iterations can be launched
+    before earlier ones are reported without changing what any of them run.
+    Up to -depth iterations are kept in flight, and they are always reported
+    in the order they were launched.
+
+    Attributes:
+        args: The parsed command-line arguments.
+        is_iter: Whether the run is set by iterations rather than runtime.
+        wl_module: The Workload object of each selected workload.
+        wl_config: The run configuration of each selected workload.
+        parallel: The execution backend the tasks are started on.
+        pool: The warm pool running in-process workloads, if any.
+        depth: The number of iterations kept in flight.
+        in_flight: The iterations launched and not reported yet, oldest first.
+        cycle_detector: The detector of repeated seeds in the seed chain.
+        totals: The number of tasks, passes, timeouts and cutoffs reported so far,
+            and the resources they used.
+    """
+
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        is_iter: bool,
+        wl_module: Dict,
+        wl_config: Dict[str, ModuleType],
+        parallel: Parallel,
+        logger: Logger,
+        profiler: Profiler,
+        metrics: Metrics,
+        results: Results,
+        run_id: int,
+        retention: Retention,
+        scheduler: Scheduler,
+        mix: Mix,
+        placement: Placement,
+        admission: Admission,
+        randomizer: Randomizer,
+        pool=None,
+    ):
+        """Initializes an instance from the Pipeline class.
+
+        Args:
+            args: The parsed command-line arguments.
+            is_iter: Whether the run is set by iterations rather than runtime.
+            wl_module: The Workload object of each selected workload.
+            wl_config: The run configuration of each selected workload.
+            parallel: The execution backend the tasks are started on.
+            logger: The logger creating the task logs and printing the results.
+            profiler: The profiler timing each phase of the run.
+            metrics: The exporter of the live run metrics.
+            results: The database the task results are recorded in.
+            run_id: The ID of the run in the results database.
+            retention: The retention policy applied to the task logs.
+            scheduler: The scheduler fitting tasks into the runtime.
+            mix: The workload and attribute weights.
+            placement: The placement of the tasks on the host's CPUs.
+            admission: The admission control throttling launches.
+            randomizer: The randomizer the seed chain is drawn from.
+            pool: The warm pool running in-process workloads, if any.
+        """
+        self.args = args
+        self.is_iter = is_iter
+        self.wl_module = wl_module
+        self.wl_config = wl_config
+        self.parallel = parallel
+        self.logger = logger
+        self.profiler = profiler
+        self.metrics = metrics
+        self.results = results
+        self.run_id = run_id
+        self.retention = retention
+        self.scheduler = scheduler
+        self.mix = mix
+        self.placement = placement
+        self.admission = admission
+        self.randomizer = randomizer
+        self.pool = pool
+        self.depth = max(1, args.pipeline_depth)
+        self.in_flight = deque()
+        # A run set by iterations checks a bounded number of seeds, so its first
+        # repeated seed is found exactly.
+        self.cycle_detector = CycleDetector(
+            max_seeds=args.iteration if is_iter else None
+        )
+        self.totals = {
+            "tasks": 0,
+            "passes": 0,
+            "timeouts": 0,
+            "cutoffs": 0,
+            "usage": ResourceUsage(),
+        }
+
+    def get_timeout(
+        self, wl: str, time_left: Optional[float] = None
+    ) -> Tuple[Optional[float], bool]:
+        """Gets the number of seconds after which a workload task is killed.
+
+        Args:
+            wl: The workload to be run.
+            time_left: The time remaining in the run, if running on input runtime.
+
+        Returns:
+            The -timeout option if set, otherwise the workload's run configuration,
+            capped at the time remaining so a hung task cannot overrun the run. Also
+            whether the time remaining is the cap, in which case a task killed when
+            it expires is cut off rather than timed out.
+        """
+        timeout = self.args.timeout
+        if timeout is None:
+            timeout = getattr(self.wl_config[wl], "timeout", None)
+        if time_left is None or (timeout is not None and timeout <= time_left):
+            return timeout, False
+        return max(time_left, 0.0), True
+
+    def check_output(
+        self,
+        exit_code: int,
+        usage: ResourceUsage,
+        is_timeout: bool,
+        wl: str,
+        stdout_path: str,
+        scanner: Optional[VerdictScanner] = None,
+    ) -> TaskResult:
+        """Checks the output of a finished workload task.
+
+        Args:
+            exit_code: The exit code of the workload's executable.
+            usage: The resources used by the workload's executable.
+            is_timeout: Whether the workload's executable was killed for running past its timeout.
+            wl: The workload that was run.
+            stdout_path: The absolute path to the stdout log file.
+            scanner: The scanner that checked the output while it was written, if any.
+
+        Returns:
+            The outcome of the task.
+        """
+        end_ns = time.perf_counter_ns()
+        self.profiler.add_span(
+            name="workload",
+            start_ns=end_ns - int(usage.wall_time * 1e9),
+            end_ns=end_ns,
+            args={"workload": wl},
+        )
+        with self.profiler.span("verdict", workload=wl):
+            try:
+                is_pass = self.wl_module[wl].check_task(
+                    stdout_path=stdout_path,
+                    exit_code=exit_code,
+                    is_timeout=is_timeout,
+                    scanner=scanner,
+                )
+            except FileNotFoundError:
+                self.logger.print_error("Couldn't read output file!")
+                is_pass = False
+        return TaskResult(
+            is_pass=is_pass,
+            exit_code=exit_code,
+            duration=usage.wall_time,
+            usage=usage,
+            is_timeout=is_timeout,
+        )
+
+    def run_task(
+        self,
+        wl: str,
+        seed: int,
+        attribute: str,
+        log_paths: Tuple[str, str],
+        timeout: Optional[float] = None,
+    ) -> TaskResult:
+        """Runs a single workload task and checks its output.
+
+        Args:
+            wl: The workload to be run.
+            seed: The current iteration seed.
+            attribute: The workload attribute selected for this task.
+            log_paths: The absolute paths to the standard output and standard error log files.
+            timeout: The number of seconds after which the task is killed.
+
+        Returns:
+            The outcome of the task.
+        """
+        scanner = self.wl_module[wl].verdict.new_scanner() if self.args.tee else None
+        with self.placement.place(resources=self.wl_module[wl].resources):
+            exit_code, usage, is_timeout = self.wl_module[wl].run_task(
+                seed=seed,
+                bin_path=self.wl_config[wl].bin_path[attribute],
+                stdout_path=log_paths[0],
+                stderr_path=log_paths[1],
+                timeout=timeout,
+                scanner=scanner,
+                groups=self.parallel.groups,
+            )
+        return self.check_output(
+            exit_code=exit_code,
+            usage=usage,
+            is_timeout=is_timeout,
+            wl=wl,
+            stdout_path=log_paths[0],
+            scanner=scanner,
+        )
+
+    def start_task(
+        self,
+        wl: str,
+        seed: int,
+        attribute: str,
+        iter_id: int,
+        log_paths: Optional[Tuple[str, str]],
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Starts a single workload task on the selected execution backend.
+
+        Args:
+            wl: The workload to be run.
+            seed: The current iteration seed.
+            attribute: The workload attribute selected for this task.
+            iter_id: The current iteration ID.
+            log_paths: The absolute paths to the standard output and standard error log files.
+                Not set on the distributed backend, where workers create their own logs.
+            timeout: The number of seconds after which the task is killed.
+
+        Returns:
+            The future holding the outcome of the task.
+        """
+        if self.args.backend == "distributed":
+            return self.parallel.start_task(
+                workload=wl,
+                seed=seed,
+                attribute=attribute,
+                iter_id=iter_id,
+                timeout=timeout,
+                is_tee=self.args.tee,
+            )
+        bin_path = self.wl_config[wl].bin_path[attribute]
+        if self.pool is not None and self.wl_module[wl].is_in_process:
+            return self.pool.start_task(
+                module=type(self.wl_module[wl]).__module__,
+                seed=seed,
+                bin_path=bin_path,
+                stdout_path=log_paths[0],
+                stderr_path=log_paths[1],
+                timeout=timeout,
+                callback=functools.partial(
+                    self.check_output, wl=wl, stdout_path=log_paths[0]
+                ),
+            )
+        if self.args.backend == "asyncio":
+            scanner = (
+                self.wl_module[wl].verdict.new_scanner() if self.args.tee else None
+            )
+            return self.parallel.start_process(
+                argv=self.wl_module[wl].get_command(seed=seed, bin_path=bin_path),
+                stdout_path=log_paths[0],
+                stderr_path=log_paths[1],
+                timeout=timeout,
+                callback=functools.partial(
+                    self.check_output,
+                    wl=wl,
+                    stdout_path=log_paths[0],
+                    scanner=scanner,
+                ),
+                scanner=scanner,
+                env=self.wl_module[wl].spec.env,
+            )
+        return self.parallel.start_process(
+            self.run_task,
+            wl=wl,
+            seed=seed,
+            attribute=attribute,
+            log_paths=log_paths,
+            timeout=timeout,
+        )
+
+    def iterate_plan(self, seed: int, block_size: int) -> Iterator[Tuple[int, Dict]]:
+        """Yields the seed and attribute picks of each iteration, precomputed in blocks.
+
+        Args:
+            seed: The seed of the first iteration.
+            block_size: The number of iterations precomputed at a time.
+
+        Yields:
+            The iteration seed and the index of the attribute picked for each workload
+            running in the iteration.
+        """
+        attribute_counts = {
+            wl: len(self.wl_config[wl].attributes) for wl in self.args.workload
+        }
+        while True:
+            # Weights are read once per block, so adaptive weights follow the
+            # results reported while the previous block was running.
+            attribute_weights = {}
+            for wl in self.args.workload:
+                weights = self.mix.get_attribute_weights(
+                    workload=wl, attributes=self.wl_config[wl].attributes
+                )
+                if weights is not None:
+                    attribute_weights[wl] = weights
+            seeds, picks = self.randomizer.generate_plan(
+                seed=seed,
+                count=block_size,
+                attribute_counts=attribute_counts,
+                attribute_weights=attribute_weights,
+                workload_chances=self.mix.get_workload_chances(),
+            )
+            for index in range(block_size):
+                yield int(seeds[index]), {
+                    wl: int(p[index]) for wl, p in picks.items() if p[index] >= 0
+                }
+            seed = self.randomizer.generate_seed_from_seed(seed=seeds[-1])
+
+    def launch_iteration(
+        self,
+        current_seed: int,
+        iter_id: int,
+        picks: Dict[str, int],
+        time_left: Optional[float] = None,
+        workloads: Optional[List[str]] = None,
+    ):
+        """Launches the workloads of one iteration and adds it to the iterations in flight.
+
+        Args:
+            current_seed: The current iteration seed.
+            iter_id: The current iteration ID.
+            picks: The index of the attribute picked for each workload running in the iteration.
+            time_left: The time remaining when the iteration was launched, if running on input runtime.
+            workloads: The workloads to launch. Defaults to every workload in picks.
+        """
+        iteration = {
+            "seed": current_seed,
+            "iter_id": iter_id,
+            "time_left": time_left,
+            "attributes": {},
+            "log_paths": {},
+            "futures": {},
+            "cutoffs": set(),
+        }
+        with self.profiler.span("launch", iter_id=iter_id):
+            for wl in workloads or picks:
+                attribute = self.wl_config[wl].attributes[picks[wl]]
+                log_paths = None
+                if self.args.backend != "distributed":
+                    _, log_paths = self.logger.run_exec(
+                        seed=current_seed, workload=wl, current_iter=iter_id
+                    )
+                iteration["attributes"][wl] = attribute
+                iteration["log_paths"][wl] = log_paths
+                timeout, is_cutoff = self.get_timeout(wl=wl, time_left=time_left)
+                if is_cutoff:
+                    iteration["cutoffs"].add(wl)
+                self.metrics.task_started(workload=wl)
+                iteration["futures"][wl] = self.start_task(
+                    wl=wl,
+                    seed=current_seed,
+                    attribute=attribute,
+                    iter_id=iter_id,
+                    log_paths=log_paths,
+                    timeout=timeout,
+                )
+        self.in_flight.append(iteration)
+
+    def report_iteration(self):
+        """Waits for the oldest iteration in flight, reports its results and updates the run totals."""
+        iteration = self.in_flight.popleft()
+        if self.is_iter:
+            self.logger.print_iter(
+                current_iter=iteration["iter_id"],
+                total_iter=self.args.iteration,
+                seed=iteration["seed"],
+            )
+        else:
+            self.logger.print_time(
+                time_left=iteration["time_left"],
+                total_time=self.args.time,
+                seed=iteration["seed"],
+            )
+        futures = iteration["futures"]
+        with self.profiler.span("wait", iter_id=iteration["iter_id"]):
+            task_results = self.parallel.wait(futures=list(futures.values()))
+        with self.profiler.span("post_exec", iter_id=iteration["iter_id"]):
+            rows = [
+                self.report_task(iteration=iteration, wl=wl, result=result)
+                for wl, result in zip(futures, task_results)
+            ]
+            self.results.record_iteration(run_id=self.run_id, rows=rows)
+            self.metrics.iteration_finished()
+
+    def report_task(self, iteration: Dict, wl: str, result: TaskResult) -> Dict:
+        """Reports the result of a single task and updates the run totals.
+
+        Args:
+            iteration: The iteration the task ran in.
+            wl: The workload that was run.
+            result: The outcome of the task.
+
+        Returns:
+            The row recorded for the task in the results database.
+        """
+        if result.is_timeout and wl in iteration["cutoffs"]:
+            result = result._replace(is_cutoff=True)
+        if result.error is not None:
+            self.logger.print_error(
+                f"<{iteration['iter_id']}> {wl} could not run: {result.error}"
+            )
+        if result.log_paths is not None:
+            # Remote workers apply their own retention policy.
+            log_paths = result.log_paths
+        else:
+            log_paths = self.retention.retain(
+                is_pass=result.is_pass,
+                seed=iteration["seed"],
+                log_paths=iteration["log_paths"][wl],
+            )
+        self.totals["passes"] += self.logger.run_post_exec(
+            is_pass=result.is_pass,
+            log_paths=log_paths,
+            attribute=iteration["attributes"][wl],
+            iter_id=iteration["iter_id"],
+            is_timeout=result.is_timeout,
+            is_remote=result.log_paths is not None,
+            is_cutoff=result.is_cutoff,
+        )
+        self.totals["tasks"] += 1
+        self.metrics.task_finished(
+            workload=wl, verdict=result.verdict, duration=result.duration
+        )
+        self.totals["usage"] = self.totals["usage"].merge(result.usage)
+        if result.is_cutoff:
+            # The task was cut short by the end of the run, so its
+            # duration and verdict say nothing about the workload.
+            self.totals["cutoffs"] += 1
+        else:
+            self.totals["timeouts"] += result.is_timeout
+            self.scheduler.record(workload=wl, duration=result.duration)
+            self.mix.record(
+                workload=wl,
+                attribute=iteration["attributes"][wl],
+                is_pass=result.is_pass,
+            )
+        return {
+            "iter_id": iteration["iter_id"],
+            "seed": str(iteration["seed"]),
+            "workload": wl,
+            "attribute": iteration["attributes"][wl],
+            "exit_code": result.exit_code,
+            "duration": result.duration,
+            "user_time": result.usage.user_time,
+            "system_time": result.usage.system_time,
+            # Recorded as NULL when it was not measured.
+            "max_rss": result.usage.max_rss or None,
+            "block_in": result.usage.block_in,
+            "block_out": result.usage.block_out,
+            "verdict": result.verdict,
+            "stdout_path": log_paths[0],
+            "stderr_path": log_paths[1],
+        }
+
+    def is_repeat(self, seed: int) -> bool:
+        """Checks whether an iteration seed has already been run and should be skipped.
+
+        Every attribute pick and workload argument is derived from the seed, so a
+        repeated seed repeats every test after it as well. The cycle is reported
+        once, when it is found.
+
+        Args:
+            seed: The iteration seed.
+
+        Returns:
+            Whether the rest of the run should be skipped.
+        """
+        is_found = self.cycle_detector.cycle_length is not None
+        if not self.cycle_detector.is_repeat(seed=seed):
+            return False
+        if not is_found:
+            self.logger.print_repeat(seed=seed, is_skip=self.args.skip_repeats)
+        return self.args.skip_repeats
+
+    def is_throttled(self, task_count: int, time_left: Optional[float] = None) -> bool:
+        """Checks whether launching more tasks would exceed what the host can take now.
+
+        When launches must wait and nothing is in flight, waits one sampling
+        interval before returning, so the host is sampled again on the next check.
+
+        Args:
+            task_count: The number of tasks about to be launched.
+            time_left: The time remaining in the run, if running on input runtime.
+
+        Returns:
+            Whether the launch must wait. The oldest in-flight iteration, if any,
+            should be reported first.
+        """
+        if not self.admission.is_enabled:
+            return False
+        in_flight_count = sum(len(it["futures"]) for it in self.in_flight)
+        is_full = self.admission.is_full(
+            task_count=in_flight_count + task_count, is_idle=not self.in_flight
+        )
+        self.metrics.admission_limit = self.admission.limit
+        if is_full and not self.in_flight:
+            wait_time = self.admission.interval
+            if time_left is not None:
+                wait_time = min(wait_time, max(time_left, 0.0))
+            time.sleep(wait_time)
+        return is_full
+
+    def run_iterations(self, seed: int, iterations: int) -> int:
+        """Runs a number of iterations, or fewer if the seed chain repeats and repeats are skipped.
+
+        Args:
+            seed: The seed of the first iteration.
+            iterations: The number of iterations.
+
+        Returns:
+            The number of iterations run.
+        """
+        iter_id = 0
+        block_size = 64 if self.mix.is_adaptive else 1024
+        plan = self.iterate_plan(seed=seed, block_size=min(iterations, block_size))
+        while iter_id < iterations:
+            if self.is_throttled(task_count=len(self.args.workload)):
+                if self.in_flight:
+                    self.report_iteration()
+                continue
+            with self.profiler.span("seed_advance"):
+                current_seed, picks = next(plan)
+            if self.is_repeat(seed=current_seed):
+                break
+            iter_id += 1
+            self.launch_iteration(current_seed=current_seed, iter_id=iter_id, picks=picks)
+            if len(self.in_flight) >= self.depth:
+                self.report_iteration()
+        while self.in_flight:
+            self.report_iteration()
+        return iter_id
+
+    def run_until(self, seed: int, timer: Timer, start_time: float) -> int:
+        """Runs iterations until the regression runtime is used up.
+
+        Iterations keep launching while any workload is expected to finish in
+        the time left; workloads that no longer fit are dropped one at a time.
+
+        Args:
+            seed: The seed of the first iteration.
+            timer: The timer the time left is read from.
+            start_time: The timer value when the run started.
+
+        Returns:
+            The number of iterations run.
+        """
+        iter_id = 0
+        is_plan_done = False
+        plan = self.iterate_plan(seed=seed, block_size=64)
+        while True:
+            time_left = timer.time_remaining(
+                start_time=start_time, end_time=self.args.time
+            )
+            workloads = []
+            if timer.is_time_remaining and not is_plan_done:
+                workloads = self.scheduler.fit(
+                    workloads=self.args.workload, time_left=time_left
+                )
+            if workloads and self.is_throttled(
+                task_count=len(workloads), time_left=time_left
+            ):
+                if self.in_flight:
+                    self.report_iteration()
+                continue
+            if workloads:
+                with self.profiler.span("seed_advance"):
+                    current_seed, picks = next(plan)
+                if self.is_repeat(seed=current_seed):
+                    is_plan_done = True
+                    continue
+                workloads = [wl for wl in workloads if wl in picks]
+                if not workloads:
+                    continue
+                iter_id += 1
+                self.launch_iteration(
+                    current_seed=current_seed,
+                    iter_id=iter_id,
+                    picks=picks,
+                    time_left=time_left,
+                    workloads=workloads,
+                )
+                if len(self.in_flight) < self.depth:
+                    continue
+            elif not self.in_flight:
+                return iter_id
+            self.report_iteration()
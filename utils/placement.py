@@ -0,0 +1,244 @@
+"""This module contains functions for placing concurrent workload tasks on the machine's CPUs.
+
+Typical usage example:
+
+  placement = Placement(policy="spread")
+  with placement.place(resources={"cpus": 2, "memory_mb": 512}) as lease:
+      exit_code, usage = wl.run(...)
+"""
+
+import contextlib
+import os
+from pathlib import Path
+import threading
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+NODE_PATH = "/sys/devices/system/node"
+DISABLED_PLACEMENT = contextlib.nullcontext()
+
+
+class Lease(NamedTuple):
+    """The resources held by a placed task.
+
+    Attributes:
+        node: The NUMA node the task runs on.
+        cpus: The CPUs the task is pinned to.
+        memory_mb: The memory reserved on the node (in megabytes).
+        is_io_heavy: Whether the task holds one of the IO-heavy slots.
+    """
+
+    node: int
+    cpus: FrozenSet[int]
+    memory_mb: int = 0
+    is_io_heavy: bool = False
+
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """Parses a kernel CPU list such as "0-3,8,10-11".
+
+    Args:
+        cpu_list: The CPU list.
+
+    Returns:
+        The CPU numbers.
+    """
+    cpus = []
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def read_topology(node_path: str = NODE_PATH) -> Dict[int, Tuple[List[int], int]]:
+    """Reads the CPUs and memory of each NUMA node this process may use.
+
+    CPUs outside the process's affinity mask (e.g. those withheld from a
+    container) are left out, as are nodes without any usable CPU. Without NUMA
+    information, every usable CPU and the machine's memory count as node 0.
+
+    Args:
+        node_path: The sysfs directory describing the NUMA nodes.
+
+    Returns:
+        The usable CPUs and the memory (in megabytes) of each node.
+    """
+    allowed = os.sched_getaffinity(0)
+    topology = {}
+    for node_dir in sorted(Path(node_path).glob("node[0-9]*")):
+        try:
+            cpus = parse_cpu_list(node_dir.joinpath("cpulist").read_text())
+            memory_mb = 0
+            for line in node_dir.joinpath("meminfo").read_text().splitlines():
+                if "MemTotal:" in line:
+                    memory_mb = int(line.split()[-2]) // 1024
+        except (OSError, ValueError):
+            continue
+        cpus = [cpu for cpu in cpus if cpu in allowed]
+        if cpus:
+            topology[int(node_dir.name[4:])] = (cpus, memory_mb)
+    if not topology:
+        memory_mb = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") >> 20
+        topology[0] = (sorted(allowed), memory_mb)
+    return topology
+
+
+class Placement:
+    """Class definition for handling Workload-Runner's task placement.
+
+    Each task declares the CPUs, memory and IO it needs in its run
+    configuration's resources. A task waits until one NUMA node has enough
+    free CPUs and memory, so the machine is never oversubscribed. It is then
+    pinned to the lowest-numbered free CPUs of that node, which keeps
+    placement stable from run to run. The "spread" policy picks the node with
+    the most free CPUs, so concurrent tasks are kept apart. The "pack" policy
+    picks the fullest node that fits, so tasks share a node on purpose. Tasks
+    declared IO-heavy also wait for one of a few IO slots.
+
+    The thread launching a task is pinned while the task runs, and the task's
+    processes inherit its CPUs. Memory is not bound, but the kernel allocates
+    it on the node of the CPU that first touches it.
+
+    Attributes:
+        policy: The placement policy ("none", "spread" or "pack").
+        nodes: The usable CPUs and the memory (in megabytes) of each node.
+        free_cpus: The CPUs of each node not held by a task.
+        free_memory: The memory (in megabytes) of each node not reserved by a task.
+        io_slots: The number of IO-heavy tasks that may run at the same time.
+        io_in_use: The number of IO-heavy tasks running.
+        condition: The condition tasks wait on for resources to be released.
+    """
+
+    policies = ["none", "spread", "pack"]
+
+    def __init__(
+        self,
+        policy: str = "none",
+        topology: Optional[Dict[int, Tuple[List[int], int]]] = None,
+        io_slots: int = 1,
+    ):
+        """Initializes an instance from the Placement class.
+
+        Args:
+            policy: The placement policy ("none", "spread" or "pack").
+            topology: The usable CPUs and memory (in megabytes) of each node.
+                Read from the machine when not set.
+            io_slots: The number of IO-heavy tasks that may run at the same time.
+        """
+        self.policy = policy
+        self.nodes = {}
+        if policy != "none":
+            self.nodes = topology if topology is not None else read_topology()
+        self.free_cpus = {node: set(cpus) for node, (cpus, _) in self.nodes.items()}
+        self.free_memory = {node: memory for node, (_, memory) in self.nodes.items()}
+        self.io_slots = io_slots
+        self.io_in_use = 0
+        self.condition = threading.Condition()
+
+    def get_needs(self, resources: Dict) -> Tuple[int, int, bool]:
+        """Gets what a task needs, capped at what the largest node has.
+
+        Args:
+            resources: The resources declared in the workload's run configuration.
+
+        Returns:
+            The number of CPUs, the memory (in megabytes) and whether the task is IO-heavy.
+        """
+        cpus = max(1, int(resources.get("cpus", 1)))
+        memory_mb = int(resources.get("memory_mb", 0))
+        # A task bigger than every node gets a whole node rather than waiting forever.
+        cpus = min(cpus, max(len(c) for c, _ in self.nodes.values()))
+        memory_mb = min(memory_mb, max(m for _, m in self.nodes.values()))
+        return cpus, memory_mb, bool(resources.get("io_heavy", False))
+
+    def find_node(self, cpus: int, memory_mb: int) -> Optional[int]:
+        """Finds the node a task is placed on under the policy.
+
+        Args:
+            cpus: The number of CPUs the task needs.
+            memory_mb: The memory (in megabytes) the task needs.
+
+        Returns:
+            The node, or None if no node has enough free resources.
+        """
+        fits = [
+            node
+            for node in self.nodes
+            if len(self.free_cpus[node]) >= cpus and self.free_memory[node] >= memory_mb
+        ]
+        if not fits:
+            return None
+        if self.policy == "pack":
+            return min(fits, key=lambda node: (len(self.free_cpus[node]), node))
+        return max(fits, key=lambda node: (len(self.free_cpus[node]), -node))
+
+    def acquire(self, resources: Dict) -> Lease:
+        """Waits until a task's resources are free and reserves them.
+
+        Args:
+            resources: The resources declared in the workload's run configuration.
+
+        Returns:
+            The lease on the reserved resources.
+        """
+        cpus, memory_mb, is_io_heavy = self.get_needs(resources=resources)
+        with self.condition:
+            while True:
+                node = self.find_node(cpus=cpus, memory_mb=memory_mb)
+                if node is not None and (
+                    not is_io_heavy or self.io_in_use < self.io_slots
+                ):
+                    break
+                self.condition.wait()
+            picked = frozenset(sorted(self.free_cpus[node])[:cpus])
+            self.free_cpus[node] -= picked
+            self.free_memory[node] -= memory_mb
+            self.io_in_use += is_io_heavy
+        return Lease(
+            node=node, cpus=picked, memory_mb=memory_mb, is_io_heavy=is_io_heavy
+        )
+
+    def release(self, lease: Lease):
+        """Frees the resources of a finished task.
+
+        Args:
+            lease: The lease returned by acquire.
+        """
+        with self.condition:
+            self.free_cpus[lease.node] |= lease.cpus
+            self.free_memory[lease.node] += lease.memory_mb
+            self.io_in_use -= lease.is_io_heavy
+            self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def hold(self, resources: Dict):
+        """Reserves a task's resources and pins the calling thread to its CPUs.
+
+        Args:
+            resources: The resources declared in the workload's run configuration.
+
+        Yields:
+            The lease on the reserved resources.
+        """
+        lease = self.acquire(resources=resources)
+        mask = os.sched_getaffinity(0)
+        try:
+            os.sched_setaffinity(0, lease.cpus)
+            yield lease
+        finally:
+            os.sched_setaffinity(0, mask)
+            self.release(lease=lease)
+
+    def place(self, resources: Dict):
+        """Places a task for the body of a with statement.
+
+        Args:
+            resources: The resources declared in the workload's run configuration.
+
+        Returns:
+            The context manager, which does nothing when placement is disabled.
+        """
+        if self.policy == "none":
+            return DISABLED_PLACEMENT
+        return self.hold(resources=resources)
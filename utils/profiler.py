@@ -0,0 +1,162 @@
+"""This module contains functions for profiling where Workload-Runner spends its time.
+
+Typical usage example:
+
+  profiler = Profiler(is_enabled=True)
+  with profiler.span("launch", iter_id=1):
+      ...
+  profiler.add_span("workload", start_ns=start_ns, end_ns=time.perf_counter_ns())
+  profiler.write_trace(trace_path=".../var/log/workload_runner/run_1_trace.json")
+  logger.print_profile(phases=profiler.get_phases())
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+DISABLED_SPAN = contextlib.nullcontext()
+
+
+class Span:
+    """Class definition for a span timed with a with statement.
+
+    Attributes:
+        profiler: The profiler the span is recorded in.
+        name: The phase the span belongs to.
+        args: Extra details shown with the span in trace viewers.
+        start_ns: The time.perf_counter_ns() value when the span started.
+    """
+
+    __slots__ = ("profiler", "name", "args", "start_ns")
+
+    def __init__(self, profiler: "Profiler", name: str, args: Dict):
+        """Initializes an instance from the Span class.
+
+        Args:
+            profiler: The profiler the span is recorded in.
+            name: The phase the span belongs to.
+            args: Extra details shown with the span in trace viewers.
+        """
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_span(
+            name=self.name,
+            start_ns=self.start_ns,
+            end_ns=time.perf_counter_ns(),
+            args=self.args,
+        )
+
+
+class Profiler:
+    """Class definition for recording the phases of a regression run as timed spans.
+
+    Spans are appended to a list, which is safe from worker threads, and only
+    turned into a trace at the end of the run. When profiling is disabled, span()
+    returns a shared no-op context manager and add_span() returns immediately.
+
+    Attributes:
+        is_enabled: Whether spans are recorded.
+        origin_ns: The time.perf_counter_ns() value trace timestamps are relative to.
+        spans: The recorded spans, as (name, thread ID, start, end, args) tuples.
+    """
+
+    def __init__(self, is_enabled: bool = False):
+        """Initializes an instance from the Profiler class.
+
+        Args:
+            is_enabled: Whether spans are recorded.
+        """
+        self.is_enabled = is_enabled
+        self.origin_ns = time.perf_counter_ns()
+        self.spans = []
+
+    def span(self, name: str, **args):
+        """Times the body of a with statement as a span.
+
+        Args:
+            name: The phase the span belongs to.
+            **args: Extra details shown with the span in trace viewers.
+
+        Returns:
+            The context manager.
+        """
+        if not self.is_enabled:
+            return DISABLED_SPAN
+        return Span(profiler=self, name=name, args=args)
+
+    def add_span(
+        self, name: str, start_ns: int, end_ns: int, args: Optional[Dict] = None
+    ):
+        """Records a span timed by the caller.
+
+        Args:
+            name: The phase the span belongs to.
+            start_ns: The time.perf_counter_ns() value when the span started.
+            end_ns: The time.perf_counter_ns() value when the span ended.
+            args: Extra details shown with the span in trace viewers.
+        """
+        if self.is_enabled:
+            self.spans.append(
+                (name, threading.get_native_id(), start_ns, end_ns, args or {})
+            )
+
+    def get_phases(self) -> Dict[str, Dict[str, float]]:
+        """Aggregates the recorded spans by phase.
+
+        Returns:
+            The number of spans and their total, mean and longest duration
+            (in milliseconds) for each phase, in order of first appearance.
+        """
+        phases = {}
+        for name, _, start_ns, end_ns, _ in self.spans:
+            duration = (end_ns - start_ns) / 1e6
+            phase = phases.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            phase["count"] += 1
+            phase["total"] += duration
+            phase["max"] = max(phase["max"], duration)
+        for phase in phases.values():
+            phase["mean"] = phase["total"] / phase["count"]
+        return phases
+
+    def get_trace_events(self) -> List[Dict]:
+        """Converts the recorded spans to Chrome trace events.
+
+        Returns:
+            One complete ("X") event per span, with timestamps in microseconds.
+        """
+        pid = os.getpid()
+        return [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, tid, start_ns, end_ns, args in self.spans
+        ]
+
+    def write_trace(self, trace_path: str):
+        """Writes the recorded spans as a Chrome trace, which Perfetto can also open.
+
+        Args:
+            trace_path: The absolute path to the trace file.
+        """
+        with open(trace_path, "w") as trace_file:
+            json.dump(
+                {"traceEvents": self.get_trace_events(), "displayTimeUnit": "ms"},
+                trace_file,
+            )
@@ -1,4 +1,4 @@
-"""This module contains functions related to random selections in Workload-Runner. 
+"""This module contains functions related to random selections in Workload-Runner.
 
 Typical usage example:
 
@@ -7,32 +7,86 @@ Typical usage example:
   random_number = randomizer.pick_random_int(
                       low=0, high=len(wl_config[wl].attributes), seed=current_seed
                   )
+  seeds, picks = randomizer.generate_plan(
+      seed=start_seed,
+      count=1000,
+      attribute_counts={"Workload_1": 1, "Workload_2": 2},
+      attribute_weights={"Workload_2": [1.0, 3.0]},
+      workload_chances={"Workload_1": 0.5},
+  )
 """
 
-import numpy as np
+import bisect
+import functools
+import itertools
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import zlib
+
+from .pcg64 import PCG64
+
+
+@functools.lru_cache(maxsize=4096)
+def draw_integer(low: int, high: int, seed: Union[int, Tuple[int, ...]]) -> int:
+    """Draws the first integer from a bit generator seeded with an input seed.
+
+    The draw is the same as np.random.default_rng(seed).integers(low, high), but
+    does not need NumPy. It only depends on its arguments, so repeated seeds
+    reuse the result instead of building a new bit generator.
+
+    Args:
+        low: The lowest integer in the range.
+        high: The highest integer in the range (exclusive).
+        seed: The input seed for the bit generator, or a tuple of them.
+
+    Returns:
+        The random integer.
+    """
+    return PCG64(seed=seed).integers(low=low, high=high)
+
+
+@functools.lru_cache(maxsize=4096)
+def draw_uniform(seed: int, stream: int) -> float:
+    """Draws the first float in [0, 1) from a bit generator seeded with an input seed and stream.
+
+    Different streams give independent draws for the same seed. The draw is the
+    same as np.random.default_rng([seed, stream]).random().
+
+    Args:
+        seed: The input seed for the bit generator.
+        stream: The stream the draw is for.
+
+    Returns:
+        The random float.
+    """
+    return PCG64(seed=[seed, stream]).random()
 
 
 class Randomizer:
     """Class definition for handling Workload-Runner's random selections.
 
+    Seeds are drawn from the full unsigned 64-bit range, so long runs do not
+    cycle through a small set of seeds.
+
     Attributes:
         low: The lowest integer in a range from which to pick a seed.
-        high: The highest integer in a range from which to pick a seed.
+        high: The highest integer in a range from which to pick a seed (exclusive).
     """
 
     def __init__(self):
         """Initializes an instance from the Randomizer class."""
-        self.low = 100
-        self.high = 999
+        self.low = 0
+        self.high = 1 << 64
 
     def generate_seed(self) -> int:
-        """Generates a random seed.
+        """Generates a random seed from the operating system's entropy source.
 
         Returns:
             The seed.
         """
-        seed = np.random.choice(a=range(self.low, self.high), replace=False)
-        return seed
+        return self.low + int.from_bytes(os.urandom(8), "little") % (
+            self.high - self.low
+        )
 
     def generate_seed_from_seed(self, seed: int) -> int:
         """Generates a new seed from an input seed.
@@ -43,11 +97,7 @@ class Randomizer:
         Returns:
             The new seed.
         """
-        # Create a Generator object with default BitGenerator and seed
-        rng = np.random.default_rng(seed=seed)
-        # Generate a random number
-        number = rng.integers(low=self.low, high=self.high, size=1)
-        return number[0]
+        return draw_integer(low=self.low, high=self.high, seed=int(seed))
 
     def pick_random_int(self, low: int, high: int, seed: int) -> int:
         """Picks a random integer from a range of integers.
@@ -60,8 +110,179 @@ class Randomizer:
         Returns:
             The random integer.
         """
-        # Create a Generator object with default BitGenerator and seed
-        rng = np.random.default_rng(seed=seed)
-        # Generate a random number
-        self.number = rng.integers(low=low, high=high, size=1)
-        return self.number[0]
+        return draw_integer(low=low, high=high, seed=int(seed))
+
+    def generate_seed_chain(self, seed: int, count: int) -> List[int]:
+        """Generates the seeds of consecutive iterations starting from an input seed.
+
+        Args:
+            seed: The seed of the first iteration.
+            count: The number of iterations.
+
+        Returns:
+            The seeds, with the input seed first.
+        """
+        seeds = []
+        for _ in range(count):
+            seeds.append(seed)
+            seed = self.generate_seed_from_seed(seed=seed)
+        return seeds
+
+    def pick_random_ints(self, low: int, high: int, seeds: List[int]) -> List[int]:
+        """Picks a random integer from a range of integers for each input seed.
+
+        Gives the same result as calling pick_random_int for each seed. Repeated
+        seeds are drawn once, through draw_integer's cache.
+
+        Args:
+            low: The lowest integer in the range.
+            high: The highest integer in the range.
+            seeds: The input seeds for the bit generator.
+
+        Returns:
+            The random integers.
+        """
+        return [self.pick_random_int(low=low, high=high, seed=s) for s in seeds]
+
+    def draw_uniforms(self, seeds: List[int], stream: int) -> List[float]:
+        """Draws a float in [0, 1) for each input seed.
+
+        Args:
+            seeds: The input seeds for the bit generator.
+            stream: The stream the draws are for.
+
+        Returns:
+            The random floats.
+        """
+        return [draw_uniform(seed=int(s), stream=stream) for s in seeds]
+
+    def pick_weighted_ints(
+        self, weights: Sequence[float], seeds: List[int], stream: int
+    ) -> List[int]:
+        """Picks an index into a list of weights for each input seed, in proportion to the weights.
+
+        Args:
+            weights: The weight of each index.
+            seeds: The input seeds for the bit generator.
+            stream: The stream the picks are for.
+
+        Returns:
+            The picked indices.
+        """
+        bounds = list(itertools.accumulate(float(w) for w in weights))
+        return [
+            min(bisect.bisect_right(bounds, draw * bounds[-1]), len(bounds) - 1)
+            for draw in self.draw_uniforms(seeds=seeds, stream=stream)
+        ]
+
+    def generate_plan(
+        self,
+        seed: int,
+        count: int,
+        attribute_counts: Dict[str, int],
+        attribute_weights: Optional[Dict[str, Sequence[float]]] = None,
+        workload_chances: Optional[Dict[str, float]] = None,
+    ) -> Tuple[List[int], Dict[str, List[int]]]:
+        """Precomputes the seeds and attribute picks of consecutive iterations.
+
+        Workloads without attribute weights pick their attribute uniformly, exactly
+        as pick_random_int would.
+
+        Args:
+            seed: The seed of the first iteration.
+            count: The number of iterations.
+            attribute_counts: The number of attributes of each workload.
+            attribute_weights: The weight of each attribute, for workloads that do not pick uniformly.
+            workload_chances: The chance of each workload running in an iteration. Defaults to always.
+
+        Returns:
+            The iteration seeds and, for each workload, the index of the attribute picked in each
+            iteration, or -1 where the workload does not run.
+        """
+        attribute_weights = attribute_weights or {}
+        workload_chances = workload_chances or {}
+        seeds = self.generate_seed_chain(seed=seed, count=count)
+        picks = {}
+        for wl, n in attribute_counts.items():
+            # Each workload draws from its own streams, so its picks do not
+            # depend on which other workloads were selected.
+            stream = zlib.crc32(wl.encode()) << 1
+            if wl in attribute_weights:
+                picks[wl] = self.pick_weighted_ints(
+                    weights=attribute_weights[wl], seeds=seeds, stream=stream
+                )
+            else:
+                picks[wl] = self.pick_random_ints(low=0, high=n, seeds=seeds)
+            chance = workload_chances.get(wl, 1.0)
+            if chance < 1.0:
+                draws = self.draw_uniforms(seeds=seeds, stream=stream | 1)
+                picks[wl] = [
+                    pick if draw < chance else -1
+                    for pick, draw in zip(picks[wl], draws)
+                ]
+        return seeds, picks
+
+
+class CycleDetector:
+    """Class definition for spotting the seed chain looping back on itself.
+
+    Each seed is derived from the previous one alone, so once a seed repeats,
+    every seed after it repeats too. When the number of seeds is bounded, as
+    in a run set by iterations, every seed is kept and the first repeated seed
+    is found exactly. Otherwise Brent's algorithm runs in constant memory: it
+    compares each new seed with one saved seed, which is moved forward each
+    time the distance from it reaches the next power of two. The cycle is then
+    found within about twice the length of the chain up to its first repeat.
+
+    Attributes:
+        max_seeds: The number of seeds kept to find the first repeat exactly, if bounded.
+        positions: The position in the chain of each seed kept.
+        count: The number of seeds checked.
+        saved: The seed new seeds are compared with.
+        power: The distance at which the saved seed is moved forward.
+        distance: The number of seeds seen since the saved seed.
+        cycle_length: The number of seeds in the cycle, once it is found.
+    """
+
+    def __init__(self, max_seeds: Optional[int] = None):
+        """Initializes an instance from the CycleDetector class.
+
+        Args:
+            max_seeds: The number of seeds kept to find the first repeat exactly.
+                Defaults to none, leaving only Brent's algorithm.
+        """
+        self.max_seeds = max_seeds
+        self.positions = {}
+        self.count = 0
+        self.saved = None
+        self.power = 1
+        self.distance = 0
+        self.cycle_length = None
+
+    def is_repeat(self, seed: int) -> bool:
+        """Checks a seed of the chain, in chain order.
+
+        Args:
+            seed: The next seed of the chain.
+
+        Returns:
+            Whether the chain has been found to cycle, in which case the seed has already run.
+        """
+        if self.cycle_length is not None:
+            return True
+        if seed in self.positions:
+            self.cycle_length = self.count - self.positions[seed]
+            return True
+        if self.max_seeds is not None and len(self.positions) < self.max_seeds:
+            self.positions[seed] = self.count
+        self.count += 1
+        if seed == self.saved:
+            self.cycle_length = self.distance
+            return True
+        if self.saved is None or self.distance == self.power:
+            if self.saved is not None:
+                self.power *= 2
+            self.saved = seed
+            self.distance = 0
+        self.distance += 1
+        return False
@@ -0,0 +1,164 @@
+"""This module contains functions for discovering the workloads available to Workload-Runner.
+
+Typical usage example:
+
+  registry = Registry()
+  names = registry.get_names()
+  wl = registry.load_workload(workload="Workload_1")
+  wl_config = registry.load_config(workload="Workload_1")
+"""
+
+import importlib
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional
+
+from .paths import Paths
+
+
+class Registry:
+    """Class definition for handling Workload-Runner's workload registry.
+
+    A workload is a package under the workloads directory holding a
+    run_config.py and a module named after the package. Discovered workloads
+    are cached in an index file, which is rebuilt when the modification time
+    of the workloads directory or of any directory in it changes, i.e. when a
+    file or directory is added, removed or renamed in either. Workload modules
+    are only imported when they are loaded.
+
+    Attributes:
+        wl_path: The absolute path to the workloads directory.
+        index_path: The absolute path to the index file.
+        package: The package the workload packages belong to.
+        entries: The module references of each workload, read on first use.
+    """
+
+    def __init__(
+        self,
+        wl_path: Optional[str] = None,
+        index_path: Optional[str] = None,
+        package: str = "workloads",
+    ):
+        """Initializes an instance from the Registry class.
+
+        Args:
+            wl_path: The absolute path to the workloads directory. Defaults to the project's.
+            index_path: The absolute path to the index file. Defaults to one in the log directory.
+            package: The package the workload packages belong to.
+        """
+        paths = Paths()
+        self.wl_path = wl_path or paths.wl_path
+        self.index_path = index_path or str(
+            Path(paths.dir_path).joinpath("workload_index.json")
+        )
+        self.package = package
+        self.entries = None
+
+    def discover(self) -> Dict[str, Dict[str, str]]:
+        """Scans the workloads directory for workload packages.
+
+        Returns:
+            The module references of each workload, keyed by workload name.
+        """
+        entries = {}
+        with os.scandir(self.wl_path) as dir_entries:
+            for dir_entry in sorted(dir_entries, key=lambda e: e.name):
+                if not dir_entry.is_dir() or dir_entry.name.startswith(("_", ".")):
+                    continue
+                wl_dir = Path(dir_entry.path)
+                if not (
+                    wl_dir.joinpath("run_config.py").is_file()
+                    and wl_dir.joinpath(f"{dir_entry.name}.py").is_file()
+                ):
+                    continue
+                name = dir_entry.name[:1].upper() + dir_entry.name[1:]
+                entries[name] = {
+                    "module": f"{self.package}.{dir_entry.name}.{dir_entry.name}",
+                    "config": f"{self.package}.{dir_entry.name}.run_config",
+                }
+        return entries
+
+    def get_mtimes(self) -> Dict[str, int]:
+        """Gets the modification times the index is checked against.
+
+        Adding, removing or renaming a file changes the modification time of
+        the directory holding it, so the workloads directory and the package
+        directories in it cover everything discovery depends on.
+
+        Returns:
+            The modification time (in nanoseconds) of the workloads directory,
+            keyed by ".", and of each directory in it, keyed by its name.
+        """
+        mtimes = {".": os.stat(self.wl_path).st_mtime_ns}
+        with os.scandir(self.wl_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir() and not dir_entry.name.startswith(("_", ".")):
+                    mtimes[dir_entry.name] = dir_entry.stat().st_mtime_ns
+        return mtimes
+
+    def get_entries(self) -> Dict[str, Dict[str, str]]:
+        """Gets the module references of each workload, from the index file if it is current.
+
+        Returns:
+            The module references of each workload, keyed by workload name.
+        """
+        if self.entries is not None:
+            return self.entries
+        mtimes = self.get_mtimes()
+        try:
+            with open(self.index_path) as index_file:
+                index = json.load(index_file)
+            if index["wl_path"] == self.wl_path and index["mtimes"] == mtimes:
+                self.entries = index["workloads"]
+                return self.entries
+        except (OSError, ValueError, KeyError):
+            pass
+        self.entries = self.discover()
+        index = {
+            "wl_path": self.wl_path,
+            "mtimes": mtimes,
+            "workloads": self.entries,
+        }
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w") as index_file:
+                json.dump(index, index_file, indent=2)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            # The index is only a cache; discovery still works without it.
+            pass
+        return self.entries
+
+    def get_names(self) -> List[str]:
+        """Gets the names of the available workloads.
+
+        Returns:
+            The workload names, sorted.
+        """
+        return sorted(self.get_entries())
+
+    def load_workload(self, workload: str):
+        """Imports a workload module and creates its Workload object.
+
+        Args:
+            workload: The workload name.
+
+        Returns:
+            The Workload object.
+        """
+        return importlib.import_module(
+            self.get_entries()[workload]["module"]
+        ).Workload()
+
+    def load_config(self, workload: str) -> ModuleType:
+        """Imports a workload's run configuration module.
+
+        Args:
+            workload: The workload name.
+
+        Returns:
+            The run configuration module.
+        """
+        return importlib.import_module(self.get_entries()[workload]["config"])
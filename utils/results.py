@@ -0,0 +1,242 @@
+"""This module contains functions for recording regression results in a SQLite database.
+
+Typical usage example:
+
+  results = Results(db_path=".../var/log/workload_runner/results.db")
+  run_id = results.start_run(start_seed=123, workloads=["Workload_1"])
+  results.record_iteration(run_id=run_id, rows=[...])
+  results.finish_run(run_id=run_id)
+  failures = results.get_failures(attribute="wl_2", since=time.time() - 7 * 86400)
+  estimates = results.get_mean_durations(workloads=["Workload_1"])
+  stats = results.get_attribute_stats(workloads=["Workload_1"])
+"""
+
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class Results:
+    """Class definition for handling Workload-Runner's result database.
+
+    The database runs in WAL mode so queries from other processes do not block
+    a regression that is writing to it. Seeds are stored as text because they
+    can exceed SQLite's signed 64-bit integers.
+
+    Attributes:
+        db_path: The path to the database file.
+        connection: The open database connection.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY,
+            start_seed TEXT NOT NULL,
+            workloads TEXT NOT NULL,
+            started_at REAL NOT NULL,
+            finished_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            run_id INTEGER NOT NULL REFERENCES runs (run_id),
+            iter_id INTEGER NOT NULL,
+            seed TEXT NOT NULL,
+            workload TEXT NOT NULL,
+            attribute TEXT NOT NULL,
+            exit_code INTEGER,
+            duration REAL,
+            user_time REAL,
+            system_time REAL,
+            max_rss INTEGER,
+            block_in INTEGER,
+            block_out INTEGER,
+            verdict TEXT NOT NULL,
+            stdout_path TEXT,
+            stderr_path TEXT,
+            finished_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS tasks_seed ON tasks (seed);
+        CREATE INDEX IF NOT EXISTS tasks_workload ON tasks (workload, finished_at);
+        CREATE INDEX IF NOT EXISTS tasks_attribute ON tasks (attribute, finished_at);
+        CREATE INDEX IF NOT EXISTS tasks_verdict ON tasks (verdict, finished_at);
+    """
+
+    columns = (
+        "iter_id",
+        "seed",
+        "workload",
+        "attribute",
+        "exit_code",
+        "duration",
+        "user_time",
+        "system_time",
+        "max_rss",
+        "block_in",
+        "block_out",
+        "verdict",
+        "stdout_path",
+        "stderr_path",
+    )
+
+    def __init__(self, db_path: str):
+        """Initializes an instance from the Results class.
+
+        Args:
+            db_path: The path to the database file. It is created if missing.
+        """
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.schema)
+        self.add_missing_columns()
+
+    def add_missing_columns(self):
+        """Adds columns introduced after a database was first created."""
+        types = {"max_rss": "INTEGER", "block_in": "INTEGER", "block_out": "INTEGER"}
+        existing = {
+            row[1] for row in self.connection.execute("PRAGMA table_info(tasks)")
+        }
+        with self.connection:
+            for column in self.columns:
+                if column not in existing:
+                    self.connection.execute(
+                        f"ALTER TABLE tasks ADD COLUMN {column} "
+                        f"{types.get(column, 'REAL')}"
+                    )
+
+    def start_run(self, start_seed: int, workloads: List[str]) -> int:
+        """Records the start of a regression run.
+
+        Args:
+            start_seed: The seed of the first iteration.
+            workloads: The workloads selected for the regression run.
+
+        Returns:
+            The ID of the run.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (start_seed, workloads, started_at) VALUES (?, ?, ?)",
+                (str(start_seed), ",".join(workloads), time.time()),
+            )
+        return cursor.lastrowid
+
+    def record_iteration(self, run_id: int, rows: List[Dict]):
+        """Records the tasks of one iteration in a single transaction.
+
+        Args:
+            run_id: The ID of the run.
+            rows: One dictionary per task, keyed by the names in Results.columns.
+        """
+        finished_at = time.time()
+        values = [
+            (run_id, *(row[c] for c in self.columns), finished_at) for row in rows
+        ]
+        placeholders = ", ".join("?" * (len(self.columns) + 2))
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO tasks (run_id, {', '.join(self.columns)}, finished_at) "
+                f"VALUES ({placeholders})",
+                values,
+            )
+
+    def finish_run(self, run_id: int):
+        """Records the end of a regression run.
+
+        Args:
+            run_id: The ID of the run.
+        """
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET finished_at = ? WHERE run_id = ?",
+                (time.time(), run_id),
+            )
+
+    def get_mean_durations(
+        self, workloads: List[str], limit: int = 100
+    ) -> Dict[str, float]:
+        """Gets the mean duration of the most recent tasks of each workload.
+
+        Tasks that timed out are left out, since they were cut short.
+
+        Args:
+            workloads: The workloads to look up.
+            limit: The number of most recent tasks averaged per workload.
+
+        Returns:
+            The mean duration of each workload that has recorded tasks (in seconds).
+        """
+        durations = {}
+        for workload in workloads:
+            (mean,) = self.connection.execute(
+                "SELECT AVG(duration) FROM (SELECT duration FROM tasks "
+                "WHERE workload = ? AND verdict NOT IN ('TIMEOUT', 'CUTOFF') "
+                "AND duration IS NOT NULL "
+                "ORDER BY finished_at DESC LIMIT ?)",
+                (workload, limit),
+            ).fetchone()
+            if mean is not None:
+                durations[workload] = mean
+        return durations
+
+    def get_attribute_stats(
+        self, workloads: List[str], limit: int = 1000
+    ) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Counts the runs and failures of each attribute over the most recent tasks.
+
+        Args:
+            workloads: The workloads to look up.
+            limit: The number of most recent tasks counted per workload.
+
+        Returns:
+            The number of runs and failures of each (workload, attribute) pair.
+        """
+        stats = {}
+        for workload in workloads:
+            rows = self.connection.execute(
+                "SELECT attribute, COUNT(*), SUM(verdict != 'PASS') FROM (SELECT "
+                "attribute, verdict FROM tasks WHERE workload = ? AND verdict != 'CUTOFF' "
+                "ORDER BY finished_at DESC LIMIT ?) GROUP BY attribute",
+                (workload, limit),
+            )
+            for attribute, runs, fails in rows:
+                stats[(workload, attribute)] = (runs, fails)
+        return stats
+
+    def get_failures(
+        self,
+        workload: Optional[str] = None,
+        attribute: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[sqlite3.Row]:
+        """Gets the tasks that failed or timed out, leaving out tasks cut off at the end of a run.
+
+        Args:
+            workload: Only return tasks of this workload.
+            attribute: Only return tasks of this workload attribute.
+            since: Only return tasks that finished after this time (in seconds since the epoch).
+
+        Returns:
+            The matching tasks, most recent first.
+        """
+        query = "SELECT * FROM tasks WHERE verdict NOT IN ('PASS', 'CUTOFF')"
+        params = []
+        if workload is not None:
+            query += " AND workload = ?"
+            params.append(workload)
+        if attribute is not None:
+            query += " AND attribute = ?"
+            params.append(attribute)
+        if since is not None:
+            query += " AND finished_at >= ?"
+            params.append(since)
+        query += " ORDER BY finished_at DESC"
+        self.connection.row_factory = sqlite3.Row
+        try:
+            return self.connection.execute(query, params).fetchall()
+        finally:
+            self.connection.row_factory = None
+
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
@@ -0,0 +1,107 @@
+"""This module contains functions for deciding which regression logs to keep.
+
+Typical usage example:
+
+  retention = Retention(
+      policy="archive",
+      logger=logger,
+      archive_path=".../var/log/workload_runner/run_1_passed.zip",
+  )
+  logger.spool_path = retention.spool_path
+  log_paths = retention.retain(is_pass=True, seed=123, log_paths=log_paths)
+  retention.close()
+"""
+
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Optional, Tuple
+import zipfile
+
+from .logger import Logger
+
+
+class Retention:
+    """Class definition for handling Workload-Runner's log retention policy.
+
+    With the "all" policy, every log is written to the log directory as before.
+    Otherwise logs are first written to a local spool directory. Logs of failed
+    tasks are then moved to the log directory uncompressed. Logs of passed tasks
+    are deleted ("failures") or added to one compressed archive per run
+    ("archive").
+
+    Attributes:
+        policy: The retention policy ("all", "failures" or "archive").
+        logger: The logger whose log directory failed tasks are moved to.
+        archive_path: The path to the archive of passed logs.
+        spool_path: The directory holding logs until their task is checked.
+        archive: The open archive, created when the first passed log is added.
+    """
+
+    policies = ["all", "failures", "archive"]
+
+    def __init__(self, policy: str, logger: Logger, archive_path: str):
+        """Initializes an instance from the Retention class.
+
+        Args:
+            policy: The retention policy ("all", "failures" or "archive").
+            logger: The logger whose log directory failed tasks are moved to.
+            archive_path: The path to the archive of passed logs.
+        """
+        self.policy = policy
+        self.logger = logger
+        self.archive_path = archive_path
+        self.spool_path = None
+        if policy != "all":
+            self.spool_path = tempfile.mkdtemp(prefix="workload_runner_")
+        self.archive = None
+
+    def retain(
+        self, is_pass: bool, seed: int, log_paths: Tuple[str, str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Keeps, archives or deletes the logs of a finished task.
+
+        Args:
+            is_pass: Whether the task passed.
+            seed: The iteration seed.
+            log_paths: The absolute paths to the standard output and standard error log files.
+
+        Returns:
+            Where the logs ended up: a path in the log directory, an "<archive>:<member>"
+            reference, or None if they were deleted.
+        """
+        if self.policy == "all":
+            return log_paths
+        kept_paths = []
+        for path in log_paths:
+            if not is_pass:
+                subdir_path = self.logger.make_log_subdir(seed=seed)
+                kept_paths.append(
+                    shutil.move(path, str(Path(subdir_path, Path(path).name)))
+                )
+                continue
+            if self.policy == "archive":
+                if self.archive is None:
+                    self.archive = zipfile.ZipFile(
+                        self.archive_path, "a", compression=zipfile.ZIP_DEFLATED
+                    )
+                member = os.path.relpath(path, self.spool_path)
+                self.archive.write(path, arcname=member)
+                kept_paths.append(f"{self.archive_path}:{member}")
+            else:
+                kept_paths.append(None)
+            os.remove(path)
+        try:
+            os.rmdir(Path(log_paths[0]).parent)
+        except OSError:
+            # Other tasks of the same seed still have logs in the spool.
+            pass
+        return tuple(kept_paths)
+
+    def close(self):
+        """Closes the archive and removes the spool directory."""
+        if self.archive is not None:
+            self.archive.close()
+        if self.spool_path is not None:
+            shutil.rmtree(self.spool_path, ignore_errors=True)
@@ -0,0 +1,63 @@
+"""This module contains functions for fitting workload tasks into a regression runtime.
+
+Typical usage example:
+
+  scheduler = Scheduler(estimates=results.get_mean_durations(workloads=["Workload_1"]))
+  workloads = scheduler.fit(workloads=["Workload_1"], time_left=12.5)
+  scheduler.record(workload="Workload_1", duration=0.8)
+"""
+
+from typing import Dict, List, Optional
+
+
+class Scheduler:
+    """Class definition for deciding which workload tasks still fit in the time left.
+
+    Each workload keeps an estimate of its task duration. It starts from the
+    durations recorded by earlier runs, if any, and follows the durations of the
+    current run as an exponentially weighted moving average. A workload with no
+    estimate yet is assumed to fit.
+
+    Attributes:
+        estimates: The estimated task duration of each workload (in seconds).
+        alpha: The weight given to the latest duration when updating an estimate.
+    """
+
+    def __init__(
+        self, estimates: Optional[Dict[str, float]] = None, alpha: float = 0.2
+    ):
+        """Initializes an instance from the Scheduler class.
+
+        Args:
+            estimates: The estimated task duration of each workload (in seconds).
+            alpha: The weight given to the latest duration when updating an estimate.
+        """
+        self.estimates = dict(estimates or {})
+        self.alpha = alpha
+
+    def record(self, workload: str, duration: float):
+        """Updates the estimate of a workload with the duration of a finished task.
+
+        Args:
+            workload: The workload that was run.
+            duration: The wall-clock runtime of the task (in seconds).
+        """
+        estimate = self.estimates.get(workload)
+        if estimate is None:
+            self.estimates[workload] = duration
+        else:
+            self.estimates[workload] = estimate + self.alpha * (duration - estimate)
+
+    def fit(self, workloads: List[str], time_left: float) -> List[str]:
+        """Selects the workloads whose next task is expected to finish in time.
+
+        Args:
+            workloads: The workloads selected for the regression run.
+            time_left: The time remaining in the regression run (in seconds).
+
+        Returns:
+            The workloads that fit, in their original order.
+        """
+        if time_left <= 0:
+            return []
+        return [wl for wl in workloads if self.estimates.get(wl, 0.0) < time_left]
@@ -0,0 +1,123 @@
+"""This module contains functions for launching workload executables with little overhead.
+
+Typical usage example:
+
+  process = spawn_process(
+      argv=["/usr/bin/sh", ".../bins/workload_1/wl_1.sh", "-n", "42"],
+      stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.out",
+      stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.err",
+      env=environment,
+  )
+  exit_code, usage = wait_with_usage(process=process, timeout=30)
+"""
+
+import os
+import shutil
+import signal
+import subprocess
+from typing import Dict, List, Optional
+
+LOG_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+# The signals Python ignores at startup, which subprocess.Popen restores to their
+# default disposition in the child (restore_signals=True).
+RESTORED_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ") if hasattr(signal, name)
+)
+# Whether os.posix_spawn can start a child in its own session on this platform.
+# Cleared the first time the platform turns out not to support it.
+use_posix_spawn = hasattr(os, "posix_spawn")
+
+
+class SpawnedProcess:
+    """Class definition for a child process started with os.posix_spawn.
+
+    It has the pid, args and returncode attributes of subprocess.Popen that
+    wait_with_usage and kill_group use, without Popen's bookkeeping.
+
+    Attributes:
+        pid: The process ID of the child.
+        args: The command-line of the child.
+        returncode: The exit code of the child, once it has been reaped.
+    """
+
+    __slots__ = ("pid", "args", "returncode")
+
+    def __init__(self, pid: int, args: List[str]):
+        """Initializes an instance from the SpawnedProcess class.
+
+        Args:
+            pid: The process ID of the child.
+            args: The command-line of the child.
+        """
+        self.pid = pid
+        self.args = args
+        self.returncode = None
+
+
+def resolve_executable(name: str) -> str:
+    """Resolves an executable name to an absolute path, searching PATH once.
+
+    Args:
+        name: The executable name or path.
+
+    Returns:
+        The absolute path, or the name as given if it is not found on PATH.
+    """
+    if os.path.dirname(name):
+        return name
+    return shutil.which(name) or name
+
+
+def spawn_process(
+    argv: List[str],
+    stdout_path: str,
+    stderr_path: str,
+    env: Optional[Dict[str, str]] = None,
+):
+    """Starts an executable in its own session with its output appended to log files.
+
+    The log files are opened by the child, so the parent opens and closes no
+    files. os.posix_spawn lets the C library use vfork or clone, which avoids
+    copying the parent's page tables and is much cheaper than fork for a large
+    parent. Descriptors opened by Python are not inheritable, so none leak into
+    the child. The signals Python ignores are reset to their default
+    disposition, as subprocess.Popen does, so e.g. a workload writing to a
+    closed pipe is killed by SIGPIPE. Falls back to subprocess.Popen where
+    os.posix_spawn cannot start a new session.
+
+    Args:
+        argv: The command-line of the executable. argv[0] must be a path, as PATH is not searched.
+        stdout_path: The absolute path to the stdout log file.
+        stderr_path: The absolute path to the stderr log file.
+        env: The environment of the executable. Defaults to the runner's environment.
+
+    Returns:
+        The child process, which leads its own process group.
+    """
+    global use_posix_spawn
+    if env is None:
+        env = os.environ
+    if use_posix_spawn:
+        try:
+            pid = os.posix_spawn(
+                argv[0],
+                argv,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, stdout_path, LOG_FLAGS, 0o644),
+                    (os.POSIX_SPAWN_OPEN, 2, stderr_path, LOG_FLAGS, 0o644),
+                ],
+                setsid=True,
+                setsigdef=RESTORED_SIGNALS,
+            )
+            return SpawnedProcess(pid=pid, args=argv)
+        except NotImplementedError:
+            use_posix_spawn = False
+    with open(stdout_path, "a") as stdout_file, open(stderr_path, "a") as stderr_file:
+        return subprocess.Popen(
+            argv,
+            stdout=stdout_file,
+            stderr=stderr_file,
+            env=env,
+            start_new_session=True,
+        )
@@ -0,0 +1,99 @@
+"""This module contains functions for checking a workload's output while it is being written.
+
+Typical usage example:
+
+  scanner = Verdict(pass_patterns=["The number picked is :"]).new_scanner()
+  exit_code, usage = Tee(scanner=scanner).run(
+      argv=["sh", ".../bins/workload_1/wl_1.sh", "-n", "42"],
+      stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.out",
+      stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_1_1_04102025_141638.err",
+  )
+  is_pass = scanner.result()
+"""
+
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .usage import Deadline, ProcessGroups, ResourceUsage, kill_group, wait_with_usage
+from .verdict import VerdictScanner
+
+
+class Tee:
+    """Class definition for piping a workload's stdout through Workload-Runner.
+
+    Every chunk is appended to the stdout log and handed to a verdict scanner
+    in the same pass, so the log never has to be read back. The workload's
+    process group is killed as soon as a fail marker shows up.
+
+    Attributes:
+        scanner: The scanner checking the workload's output.
+        chunk_size: The largest number of bytes read from the pipe at a time.
+    """
+
+    def __init__(self, scanner: VerdictScanner, chunk_size: int = 1 << 16):
+        """Initializes an instance from the Tee class.
+
+        Args:
+            scanner: The scanner checking the workload's output.
+            chunk_size: The largest number of bytes read from the pipe at a time.
+        """
+        self.scanner = scanner
+        self.chunk_size = chunk_size
+
+    def run(
+        self,
+        argv: List[str],
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None,
+        groups: Optional[ProcessGroups] = None,
+    ) -> Tuple[int, ResourceUsage]:
+        """Runs an executable, copying and checking its stdout until it exits.
+
+        Args:
+            argv: The command-line of the executable.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the executable is killed.
+            env: The environment of the executable. Defaults to the runner's environment.
+            groups: The process groups the executable is tracked in until it is reaped, if any.
+
+        Returns:
+            The exit code and resource usage of the executable.
+
+        Raises:
+            TaskTimeout: If the executable was killed for running past its timeout.
+        """
+        with open(stdout_path, "ab") as stdout_file, open(
+            stderr_path, "a"
+        ) as stderr_file:
+            start_time = time.perf_counter()
+            process = subprocess.Popen(
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                env=env,
+                start_new_session=True,
+            )
+            if groups is not None:
+                groups.add(process)
+            deadline = Deadline(process=process, timeout=timeout)
+            try:
+                while True:
+                    chunk = process.stdout.read1(self.chunk_size)
+                    if not chunk:
+                        break
+                    stdout_file.write(chunk)
+                    if self.scanner.feed(chunk) and self.scanner.is_fail_seen:
+                        kill_group(process)
+                return wait_with_usage(
+                    process=process,
+                    start_time=start_time,
+                    deadline=deadline,
+                    groups=groups,
+                )
+            finally:
+                deadline.cancel()
+                process.stdout.close()
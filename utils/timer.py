@@ -14,6 +14,9 @@ import time
 class Timer:
     """Class definition for handling Workload-Runner's time-keeping.
 
+    Times are read from a monotonic clock, so changes to the system clock
+    during a run do not shorten or extend it.
+
     Attributes:
         is_time_remaining: Whether there is time left in the regression test.
     """
@@ -26,9 +29,9 @@ class Timer:
         """Records the current time.
 
         Returns:
-            The current time in seconds.
+            The current time in seconds, relative to an arbitrary reference point.
         """
-        return time.time()
+        return time.monotonic()
 
     def time_remaining(self, start_time: float, end_time: float) -> float:
         """Calculates how much time is remaining from a start time and an end time.
@@ -40,7 +43,7 @@ class Timer:
         Returns:
             The time remaining in seconds.
         """
-        time_elapsed = time.time() - start_time
+        time_elapsed = time.monotonic() - start_time
         if end_time - time_elapsed <= 0:
             self.is_time_remaining = False
         return end_time - time_elapsed
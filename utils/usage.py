@@ -0,0 +1,287 @@
+"""This module contains functions for measuring the resources used by workload executables.
+
+Typical usage example:
+
+  process = subprocess.Popen(
+      ["sh", ".../bins/workload_1/wl_1.sh", "-n", "42"], start_new_session=True
+  )
+  try:
+      exit_code, usage = wait_with_usage(process=process, timeout=30)
+  except TaskTimeout as error:
+      exit_code, usage = error.exit_code, error.usage
+  total_usage = ResourceUsage().merge(usage)
+"""
+
+import os
+import resource
+import signal
+import subprocess
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class ResourceUsage(NamedTuple):
+    """The resources used by one or more workload executables.
+
+    Attributes:
+        wall_time: The wall-clock runtime (in seconds).
+        user_time: The CPU time spent in user mode (in seconds).
+        system_time: The CPU time spent in kernel mode (in seconds).
+        max_rss: The peak resident set size (in kilobytes), or 0 if it could not be
+            told apart from the memory of the process the task was started from.
+        block_in: The number of blocks read from the filesystem.
+        block_out: The number of blocks written to the filesystem.
+    """
+
+    wall_time: float = 0.0
+    user_time: float = 0.0
+    system_time: float = 0.0
+    max_rss: int = 0
+    block_in: int = 0
+    block_out: int = 0
+
+    @classmethod
+    def from_rusage(
+        cls, rusage: resource.struct_rusage, wall_time: float
+    ) -> "ResourceUsage":
+        """Creates an instance from the rusage of a reaped child process.
+
+        A child's peak RSS counts the memory of the runner it was started from,
+        which stays mapped until the child execs, so it never reads below the
+        runner's own peak. A peak above the runner's can only be the workload's
+        own, so it is kept. Anything else is recorded as 0, as not measured.
+
+        Args:
+            rusage: The rusage returned by os.wait4.
+            wall_time: The wall-clock runtime (in seconds).
+
+        Returns:
+            The resource usage.
+        """
+        # Read after the child was reaped, so it is at least the runner's peak
+        # when the child was started.
+        runner_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return cls(
+            wall_time=wall_time,
+            user_time=rusage.ru_utime,
+            system_time=rusage.ru_stime,
+            max_rss=rusage.ru_maxrss if rusage.ru_maxrss > runner_rss else 0,
+            block_in=rusage.ru_inblock,
+            block_out=rusage.ru_oublock,
+        )
+
+    def merge(self, other: "ResourceUsage") -> "ResourceUsage":
+        """Adds up the usage of two sets of tasks.
+
+        Args:
+            other: The usage to add.
+
+        Returns:
+            The combined usage, with the larger of the two peak RSS values. A
+            peak that was not measured counts as 0.
+        """
+        return ResourceUsage(
+            wall_time=self.wall_time + other.wall_time,
+            user_time=self.user_time + other.user_time,
+            system_time=self.system_time + other.system_time,
+            max_rss=max(self.max_rss, other.max_rss),
+            block_in=self.block_in + other.block_in,
+            block_out=self.block_out + other.block_out,
+        )
+
+
+class TaskTimeout(subprocess.TimeoutExpired):
+    """Raised when a child process was killed for running past its timeout.
+
+    Attributes:
+        exit_code: The exit code of the killed child process.
+        usage: The resources used by the child process before it was killed.
+    """
+
+    def __init__(
+        self, cmd: List[str], timeout: float, exit_code: int, usage: ResourceUsage
+    ):
+        """Initializes an instance from the TaskTimeout class.
+
+        Args:
+            cmd: The command-line of the child process.
+            timeout: The timeout that expired (in seconds).
+            exit_code: The exit code of the killed child process.
+            usage: The resources used by the child process before it was killed.
+        """
+        super().__init__(cmd=cmd, timeout=timeout)
+        self.exit_code = exit_code
+        self.usage = usage
+
+
+def kill_group(process: subprocess.Popen):
+    """Kills a child process and everything it started.
+
+    The child must have been started with start_new_session=True, so that it
+    leads its own process group.
+
+    Args:
+        process: The child process.
+    """
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class ProcessGroups:
+    """Class definition for the process groups of the running workload executables.
+
+    Executables are started in their own session, so a Ctrl-C in the terminal
+    does not reach them. Each one is tracked from the time it is started until
+    it is reaped, so an interrupted run can kill them all.
+
+    Attributes:
+        lock: The lock guarding the tracked executables.
+        processes: The executables started and not reaped yet.
+        is_killed: Whether the groups have been killed, so executables started from now on are killed at once.
+    """
+
+    def __init__(self):
+        """Initializes an instance from the ProcessGroups class."""
+        self.lock = threading.Lock()
+        self.processes = set()
+        self.is_killed = False
+
+    def add(self, process: subprocess.Popen):
+        """Tracks an executable until it is reaped.
+
+        Args:
+            process: The child process, which leads its own process group.
+        """
+        with self.lock:
+            self.processes.add(process)
+            if self.is_killed:
+                kill_group(process)
+
+    def discard(self, process: subprocess.Popen):
+        """Stops tracking an executable once it has been reaped.
+
+        Args:
+            process: The child process.
+        """
+        with self.lock:
+            self.processes.discard(process)
+
+    def kill_all(self):
+        """Kills the process group of every executable that has not been reaped, and of every one started later."""
+        with self.lock:
+            self.is_killed = True
+            for process in self.processes:
+                kill_group(process)
+
+
+class Deadline:
+    """Class definition for killing a child process group once its timeout expires.
+
+    Attributes:
+        process: The child process.
+        timeout: The number of seconds after which the child process is killed.
+        is_expired: Whether the child process was killed for running too long.
+        lock: The lock shared by the timer and the reaper, so the child process
+            group is only killed while the child has not exited.
+    """
+
+    def __init__(self, process: subprocess.Popen, timeout: Optional[float]):
+        """Initializes an instance from the Deadline class and starts its timer.
+
+        Args:
+            process: The child process.
+            timeout: The number of seconds after which the child process is killed.
+                No timer is started when not set.
+        """
+        self.process = process
+        self.timeout = timeout
+        self.is_expired = False
+        self.lock = threading.Lock()
+        self.timer = None
+        if timeout is not None:
+            self.timer = threading.Timer(timeout, self.expire)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def expire(self):
+        """Kills the child process group, unless the child has already exited.
+
+        A child that exits just as its timer fires has finished its task, so it
+        is neither killed nor reported as timed out, even if it has not been
+        reaped yet.
+        """
+        with self.lock:
+            if self.process.returncode is not None:
+                return
+            try:
+                if os.waitid(
+                    os.P_PID, self.process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT
+                ):
+                    return
+            except ChildProcessError:
+                # Reaped, but the reaper has not taken the lock yet.
+                return
+            self.is_expired = True
+            kill_group(self.process)
+
+    def cancel(self):
+        """Stops the timer once the child process has exited."""
+        if self.timer is not None:
+            self.timer.cancel()
+
+
+def wait_with_usage(
+    process: subprocess.Popen,
+    timeout: Optional[float] = None,
+    start_time: Optional[float] = None,
+    deadline: Optional[Deadline] = None,
+    groups: Optional[ProcessGroups] = None,
+) -> Tuple[int, ResourceUsage]:
+    """Waits for a child process to exit and collects its resource usage.
+
+    Args:
+        process: The child process.
+        timeout: The number of seconds after which the child process group is killed.
+        start_time: The time.perf_counter() value when the child was started.
+            Defaults to now.
+        deadline: A deadline already running for the child process, used instead of timeout.
+        groups: The process groups the child process is tracked in until it is reaped, if any.
+
+    Returns:
+        The exit code and resource usage of the child process.
+
+    Raises:
+        TaskTimeout: If the child process was killed for running past its timeout.
+    """
+    if start_time is None:
+        start_time = time.perf_counter()
+    if deadline is None:
+        deadline = Deadline(process=process, timeout=timeout)
+    if groups is not None:
+        groups.add(process)
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    finally:
+        deadline.cancel()
+    with deadline.lock:
+        # The child has been reaped here, so let Popen know it must not wait on
+        # it, and the deadline that it must not kill its process group.
+        process.returncode = os.waitstatus_to_exitcode(status)
+    if groups is not None:
+        groups.discard(process)
+    usage = ResourceUsage.from_rusage(
+        rusage=rusage, wall_time=time.perf_counter() - start_time
+    )
+    if deadline.is_expired:
+        raise TaskTimeout(
+            cmd=process.args,
+            timeout=deadline.timeout,
+            exit_code=process.returncode,
+            usage=usage,
+        )
+    return process.returncode, usage
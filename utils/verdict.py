@@ -0,0 +1,136 @@
+"""This module contains functions for deciding whether a workload task passed from its output.
+
+Typical usage example:
+
+  verdict = Verdict(
+      pass_patterns=["The number picked is :"], fail_patterns=["Invalid option"]
+  )
+  is_pass = verdict.scan_file(stdout_path=".../workload_1_1_04102025_141638.out")
+"""
+
+from typing import List, Optional
+
+
+class Verdict:
+    """Class definition for the pass/fail markers of a workload.
+
+    A task passes when any pass marker appears in its output and no fail
+    marker does. A fail marker settles the verdict as soon as it is seen.
+    Without fail markers, the first pass marker settles it instead. Without
+    any markers, the output does not decide the verdict and is not read.
+
+    Attributes:
+        pass_patterns: The markers that make a task pass.
+        fail_patterns: The markers that make a task fail.
+        chunk_size: The number of bytes read from a log file at a time.
+        overlap: The number of bytes carried between chunks so markers split across them are found.
+        is_empty: Whether no markers are declared, e.g. for a workload judged by its exit code only.
+    """
+
+    def __init__(
+        self,
+        pass_patterns: List[str],
+        fail_patterns: Optional[List[str]] = None,
+        chunk_size: int = 1 << 16,
+    ):
+        """Initializes an instance from the Verdict class.
+
+        Args:
+            pass_patterns: The markers that make a task pass.
+            fail_patterns: The markers that make a task fail.
+            chunk_size: The number of bytes read from a log file at a time.
+        """
+        self.pass_patterns = [p.encode("utf-8") for p in pass_patterns]
+        self.fail_patterns = [p.encode("utf-8") for p in fail_patterns or []]
+        self.chunk_size = chunk_size
+        self.overlap = max(map(len, self.pass_patterns + self.fail_patterns), default=1) - 1
+        self.is_empty = not self.pass_patterns and not self.fail_patterns
+
+    def new_scanner(self) -> "VerdictScanner":
+        """Creates a scanner for checking one task's output.
+
+        Returns:
+            The scanner.
+        """
+        return VerdictScanner(verdict=self)
+
+    def scan_file(self, stdout_path: str) -> bool:
+        """Checks a log file, reading it only until the verdict is settled.
+
+        Args:
+            stdout_path: The absolute path to the stdout log file.
+
+        Returns:
+            Whether the test passed or failed. Always passes when no markers are declared.
+        """
+        if self.is_empty:
+            return True
+        scanner = self.new_scanner()
+        with open(stdout_path, "rb") as stdout_file:
+            while True:
+                chunk = stdout_file.read(self.chunk_size)
+                if not chunk or scanner.feed(chunk):
+                    break
+        return scanner.result()
+
+
+class VerdictScanner:
+    """Class definition for checking one task's output as it is read.
+
+    Attributes:
+        verdict: The pass/fail markers being looked for.
+        tail: The end of the previous chunk.
+        is_pass_seen: Whether a pass marker has been seen.
+        is_fail_seen: Whether a fail marker has been seen.
+    """
+
+    def __init__(self, verdict: Verdict):
+        """Initializes an instance from the VerdictScanner class.
+
+        Args:
+            verdict: The pass/fail markers being looked for.
+        """
+        self.verdict = verdict
+        self.tail = b""
+        self.is_pass_seen = False
+        self.is_fail_seen = False
+
+    def is_decided(self) -> bool:
+        """Checks whether more output could still change the verdict.
+
+        Returns:
+            Whether the verdict is settled.
+        """
+        if self.is_fail_seen or self.verdict.is_empty:
+            return True
+        return self.is_pass_seen and not self.verdict.fail_patterns
+
+    def feed(self, chunk: bytes) -> bool:
+        """Checks the next chunk of output.
+
+        Args:
+            chunk: The output bytes following the previous chunk.
+
+        Returns:
+            Whether the verdict is settled.
+        """
+        if self.is_decided():
+            return True
+        window = self.tail + chunk
+        if any(p in window for p in self.verdict.fail_patterns):
+            self.is_fail_seen = True
+        elif not self.is_pass_seen:
+            self.is_pass_seen = any(p in window for p in self.verdict.pass_patterns)
+        if self.verdict.overlap:
+            self.tail = window[-self.verdict.overlap :]
+        return self.is_decided()
+
+    def result(self) -> bool:
+        """Gets the verdict for the output checked so far.
+
+        Returns:
+            Whether the test passed or failed. Always passes when no markers are declared.
+        """
+        if self.verdict.is_empty:
+            return True
+        return self.is_pass_seen and not self.is_fail_seen
@@ -0,0 +1,405 @@
+"""This module contains functions for running in-process Python workloads in warm workers.
+
+Run as a script, it runs one task of an in-process workload in a fresh
+interpreter instead, which is how such workloads run outside a warm pool.
+
+Typical usage example:
+
+  pool = WarmPool(modules=["workloads.workload_3.workload_3"], size=4)
+  future = pool.start_task(
+      module="workloads.workload_3.workload_3",
+      seed=123,
+      bin_path="sort",
+      stdout_path=".../var/log/workload_runner/302cca50069bbc56/workload_3_1_04102025_141638.out",
+      stderr_path=".../var/log/workload_runner/302cca50069bbc56/workload_3_1_04102025_141638.err",
+      timeout=30,
+  )
+  task_results = pool.wait()
+  pool.shutdown()
+
+  python3 -m utils.warm_pool workloads.workload_3.workload_3 123 sort
+"""
+
+from collections import deque
+from concurrent.futures import Future
+import importlib
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+from .usage import ResourceUsage
+
+
+def execute_task(wl, seed: int, bin_path: str) -> int:
+    """Runs an in-process workload's routine, turning exceptions into an exit code.
+
+    Args:
+        wl: The Workload object.
+        seed: The input seed for the bit generator.
+        bin_path: The name of the routine to run.
+
+    Returns:
+        The exit code of the task.
+    """
+    try:
+        exit_code = wl.execute(seed=seed, bin_path=bin_path)
+    except SystemExit as error:
+        exit_code = error.code if isinstance(error.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return exit_code or 0
+
+
+def serve_tasks(conn, modules: List[str]):
+    """Runs the tasks sent by a warm pool until the pool shuts down.
+
+    Workload modules are imported and their Workload objects created once, when
+    the worker starts. File descriptors 1 and 2 are pointed at each task's logs
+    while it runs, so output written by C extensions is captured as well.
+
+    Args:
+        conn: The worker's end of the pipe to the pool.
+        modules: The workload modules to load.
+    """
+    workloads = {m: importlib.import_module(m).Workload() for m in modules}
+    log_flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        task_id, module, seed, bin_path, stdout_path, stderr_path = task
+        stdout_fd = os.open(stdout_path, log_flags, 0o644)
+        stderr_fd = os.open(stderr_path, log_flags, 0o644)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+        before = resource.getrusage(resource.RUSAGE_SELF)
+        start_time = time.perf_counter()
+        exit_code = execute_task(wl=workloads[module], seed=seed, bin_path=bin_path)
+        wall_time = time.perf_counter() - start_time
+        after = resource.getrusage(resource.RUSAGE_SELF)
+        usage = ResourceUsage(
+            wall_time=wall_time,
+            user_time=after.ru_utime - before.ru_utime,
+            system_time=after.ru_stime - before.ru_stime,
+            # The worker's peak covers earlier tasks and the interpreter it
+            # was started from, so it is only this task's if the task raised it.
+            max_rss=after.ru_maxrss if after.ru_maxrss > before.ru_maxrss else 0,
+            block_in=after.ru_inblock - before.ru_inblock,
+            block_out=after.ru_oublock - before.ru_oublock,
+        )
+        conn.send((task_id, exit_code, tuple(usage)))
+
+
+class WarmPool:
+    """Class definition for handling Workload-Runner's warm worker processes.
+
+    Workers are started once with the spawn method, import the workload
+    modules and keep their Workload objects for the whole run. Each task goes
+    to an idle worker over its own pipe. A worker running past a task's timeout
+    is killed and replaced, as a routine cannot be interrupted reliably from
+    inside the process. A task's peak RSS is the worker's, and is only
+    recorded when the task raised it.
+
+    Attributes:
+        modules: The workload modules the workers load.
+        context: The multiprocessing context the workers are started from.
+        lock: The lock guarding the task queue and the workers.
+        workers: The process, pipe and current task of each worker.
+        idle: The workers waiting for a task.
+        pending: The tasks waiting for an idle worker.
+        next_id: The ID given to the next task.
+        is_closing: Whether the pool is shutting down, so dead workers are not replaced.
+        unfinished: The futures of the tasks that have not finished yet, in the order they were started.
+    """
+
+    def __init__(self, modules: List[str], size: int):
+        """Initializes an instance from the WarmPool class and starts its workers.
+
+        Args:
+            modules: The workload modules the workers load.
+            size: The number of workers.
+        """
+        self.modules = modules
+        self.context = multiprocessing.get_context("spawn")
+        self.lock = threading.Lock()
+        self.workers = []
+        self.idle = deque()
+        self.pending = deque()
+        self.next_id = 0
+        self.is_closing = False
+        self.unfinished = {}
+        for _ in range(size):
+            self.start_worker()
+
+    def start_worker(self):
+        """Starts a worker and the thread reading its results, then hands it queued tasks.
+
+        Starting a process takes a while, so it is done without holding the lock.
+        """
+        conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=serve_tasks, args=(child_conn, self.modules), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = {"process": process, "conn": conn, "task": None, "timer": None}
+        with self.lock:
+            if self.is_closing:
+                process.kill()
+                process.join()
+                conn.close()
+                return
+            self.workers.append(worker)
+            self.idle.append(worker)
+            self.dispatch()
+        threading.Thread(target=self.read_results, args=(worker,), daemon=True).start()
+
+    def start_task(
+        self,
+        module: str,
+        seed: int,
+        bin_path: str,
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[int, ResourceUsage, bool], Any]] = None,
+    ) -> Future:
+        """Queues a task to run on the next idle worker.
+
+        Args:
+            module: The module of the in-process workload.
+            seed: The input seed for the bit generator.
+            bin_path: The name of the routine to run.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the worker running the task is killed.
+            callback: A function called with the exit code, the resource usage and whether
+                the timeout expired once the task finishes.
+
+        Returns:
+            The future holding the return value of the callback, or the exit code.
+        """
+        future = Future()
+        with self.lock:
+            task = {
+                "message": (
+                    self.next_id,
+                    module,
+                    seed,
+                    bin_path,
+                    stdout_path,
+                    stderr_path,
+                ),
+                "timeout": timeout,
+                "callback": callback,
+                "future": future,
+                "start_time": None,
+                "is_expired": False,
+            }
+            self.next_id += 1
+            self.unfinished[future] = None
+            self.pending.append(task)
+            self.dispatch()
+        return future
+
+    def dispatch(self):
+        """Sends queued tasks to idle workers. Must be called with the lock held."""
+        while self.pending and self.idle:
+            worker = self.idle.popleft()
+            task = self.pending.popleft()
+            worker["task"] = task
+            task["start_time"] = time.perf_counter()
+            if task["timeout"] is not None:
+                worker["timer"] = threading.Timer(
+                    task["timeout"], self.expire, args=(worker, task)
+                )
+                worker["timer"].daemon = True
+                worker["timer"].start()
+            try:
+                worker["conn"].send(task["message"])
+            except OSError:
+                # The worker's reader replaces it and fails the task.
+                pass
+
+    def expire(self, worker: Dict, task: Dict):
+        """Kills a worker whose task ran past its timeout.
+
+        Nothing is done once the task's result has arrived, even if it has not
+        been read yet, so a task finishing just as its timer fires is neither
+        reported as timed out nor costs the pool a worker.
+
+        Args:
+            worker: The worker.
+            task: The task the timer was started for.
+        """
+        with self.lock:
+            if worker["task"] is task and not worker["conn"].poll():
+                task["is_expired"] = True
+                worker["process"].kill()
+
+    def read_results(self, worker: Dict):
+        """Reads a worker's results until it exits, then replaces it if it died mid-run.
+
+        Args:
+            worker: The worker.
+        """
+        while True:
+            try:
+                # Waits for a result or the worker's exit without reading it yet.
+                worker["conn"].poll(None)
+            except (EOFError, OSError):
+                pass
+            task = self.take_task(worker=worker)
+            try:
+                task_id, exit_code, usage = worker["conn"].recv()
+            except (EOFError, OSError):
+                exit_code = self.replace_worker(worker=worker)
+                if task is not None:
+                    self.finish_task(
+                        task=task,
+                        exit_code=exit_code,
+                        usage=ResourceUsage(
+                            wall_time=time.perf_counter() - task["start_time"]
+                        ),
+                        is_timeout=task["is_expired"],
+                    )
+                worker["conn"].close()
+                return
+            with self.lock:
+                self.idle.append(worker)
+                self.dispatch()
+            if task is not None:
+                self.finish_task(
+                    task=task,
+                    exit_code=exit_code,
+                    usage=ResourceUsage(*usage),
+                    is_timeout=False,
+                )
+
+    def take_task(self, worker: Dict) -> Optional[Dict]:
+        """Detaches a worker's current task and stops its timer.
+
+        From here on the task is resolved by the worker's reader, so the timer
+        cannot mark it as expired.
+
+        Args:
+            worker: The worker.
+
+        Returns:
+            The task the worker was running, if any.
+        """
+        with self.lock:
+            task = worker["task"]
+            worker["task"] = None
+            if worker["timer"] is not None:
+                worker["timer"].cancel()
+                worker["timer"] = None
+        return task
+
+    def replace_worker(self, worker: Dict) -> int:
+        """Removes a worker that has exited and starts another in its place.
+
+        No worker is started once the pool is shutting down.
+
+        Args:
+            worker: The worker.
+
+        Returns:
+            The exit code of the worker.
+        """
+        worker["process"].join()
+        with self.lock:
+            self.workers.remove(worker)
+            is_replaced = not self.is_closing
+            self.dispatch()
+        if is_replaced:
+            self.start_worker()
+        return worker["process"].exitcode
+
+    def finish_task(
+        self, task: Dict, exit_code: int, usage: ResourceUsage, is_timeout: bool
+    ):
+        """Resolves the future of a finished task.
+
+        Args:
+            task: The task.
+            exit_code: The exit code of the task.
+            usage: The resources used by the task.
+            is_timeout: Whether the task ran past its timeout.
+        """
+        with self.lock:
+            del self.unfinished[task["future"]]
+        try:
+            if task["callback"] is not None:
+                result = task["callback"](exit_code, usage, is_timeout)
+            else:
+                result = exit_code
+        except Exception as error:
+            task["future"].set_exception(error)
+        else:
+            task["future"].set_result(result)
+
+    def wait(self, futures: Optional[List[Future]] = None) -> List[Any]:
+        """Waits for warm tasks to finish running.
+
+        The pool forgets each task as soon as it finishes, so callers holding
+        their own futures do not need to wait on them here.
+
+        Args:
+            futures: The futures to wait on. Defaults to every unfinished task.
+
+        Returns:
+            The return values of the tasks, in the order they were started.
+        """
+        if futures is None:
+            with self.lock:
+                futures = list(self.unfinished)
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True):
+        """Stops the workers.
+
+        Args:
+            wait: Whether to wait for every pending task first. Otherwise the
+                workers are killed at once, as when the run is interrupted.
+        """
+        if wait:
+            self.wait()
+        with self.lock:
+            self.is_closing = True
+            workers = list(self.workers)
+        for worker in workers:
+            if not wait:
+                worker["process"].kill()
+                continue
+            try:
+                worker["conn"].send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker["process"].join()
+
+
+def main():
+    """Runs one task of an in-process workload, with output going to the inherited descriptors."""
+    module, seed, bin_path = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+    wl = importlib.import_module(module).Workload()
+    sys.exit(execute_task(wl=wl, seed=seed, bin_path=bin_path))
+
+
+if __name__ == "__main__":
+    main()
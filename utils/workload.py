@@ -0,0 +1,434 @@
+"""This module contains the functions shared by every Workload-Runner workload.
+
+A workload's run_config.py declares how its executable is launched and checked:
+an argv template, the generators of the template's parameters, pass/fail
+markers, a timeout and resource hints. The template is compiled into a launch
+spec once, when the workload module is imported, so building a task's command
+is only a matter of drawing its parameters and filling the template.
+
+Typical usage example:
+
+  # workloads/workload_1/run_config.py
+  command = ["sh", "{bin_path}", "-n", "{num}"]
+  parameters = {"num": Integer(low=0, high=100)}
+
+  # workloads/workload_1/workload_1.py
+  class Workload(BaseWorkload):
+      spec = LaunchSpec.compile(run_config)
+
+  wl = Workload()
+  argv = wl.get_command(seed=123, bin_path=".../bins/workload_1/wl_1.sh")
+"""
+
+import abc
+import os
+from pathlib import Path
+import string
+import sys
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .randomizer import draw_integer
+from .spawn import resolve_executable, spawn_process
+from .tee import Tee
+from .usage import ProcessGroups, ResourceUsage, TaskTimeout, wait_with_usage
+from .verdict import Verdict, VerdictScanner
+
+PROJECT_ROOT = str(Path(__file__).parent.parent.resolve())
+
+
+class Integer:
+    """Class definition for a parameter drawn from a range of integers.
+
+    Attributes:
+        low: The lowest integer in the range.
+        high: The highest integer in the range (exclusive).
+    """
+
+    def __init__(self, low: int, high: int):
+        """Initializes an instance from the Integer class.
+
+        Args:
+            low: The lowest integer in the range.
+            high: The highest integer in the range (exclusive).
+        """
+        self.low = low
+        self.high = high
+
+    def draw(self, seed: int, index: int = 0) -> int:
+        """Draws the parameter's value for a task.
+
+        The first parameter of a workload is drawn from the seed itself, as
+        workloads always have been, so recorded seeds still reproduce their
+        tasks. Later parameters are drawn from their own stream of the seed.
+
+        Args:
+            seed: The iteration seed.
+            index: The position of the parameter in the run configuration.
+
+        Returns:
+            The value.
+        """
+        # Positional arguments keep draw_integer's cache lookups cheap.
+        return draw_integer(self.low, self.high, seed if index == 0 else (seed, index))
+
+
+class Choice:
+    """Class definition for a parameter drawn from a list of values.
+
+    Attributes:
+        values: The values, each equally likely.
+    """
+
+    def __init__(self, values: Sequence):
+        """Initializes an instance from the Choice class.
+
+        Args:
+            values: The values, each equally likely.
+        """
+        self.values = tuple(values)
+        self.index = Integer(low=0, high=len(self.values))
+
+    def draw(self, seed: int, index: int = 0):
+        """Draws the parameter's value for a task.
+
+        Args:
+            seed: The iteration seed.
+            index: The position of the parameter in the run configuration.
+
+        Returns:
+            The value.
+        """
+        return self.values[self.index.draw(seed, index)]
+
+
+class LaunchSpec:
+    """Class definition for a workload's argv template, compiled once per workload.
+
+    Template tokens are plain strings with {name} fields, where name is
+    bin_path, seed or one of the declared parameters. Tokens without fields are
+    copied from a prebuilt argv, tokens made of a single field are replaced by
+    its value, and only tokens mixing text and fields are formatted for each task.
+
+    The executable in the first token is resolved on PATH once, and the
+    environment is built once, so neither is repeated for every task.
+
+    Attributes:
+        parameters: The name, draw method and position of each parameter, in declaration order.
+        argv: The command-line with the tokens holding fields left empty.
+        slots: The position and field of each token made of a single field.
+        formats: The position and text of each token mixing text and fields.
+        env: The environment of the executable: the runner's, plus the declared variables.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        parameters: Optional[Dict] = None,
+        environment: Optional[Dict[str, str]] = None,
+    ):
+        """Initializes an instance from the LaunchSpec class.
+
+        Args:
+            command: The argv template.
+            parameters: The generator of each parameter, by name.
+            environment: The variables added to the runner's environment.
+
+        Raises:
+            ValueError: If the template refers to an undeclared parameter.
+        """
+        self.parameters = [
+            (name, generator.draw, index)
+            for index, (name, generator) in enumerate((parameters or {}).items())
+        ]
+        names = {"bin_path", "seed"} | {name for name, _, _ in self.parameters}
+        self.argv = []
+        self.slots = []
+        self.formats = []
+        for position, token in enumerate(command):
+            fields = [f for _, f, _, _ in string.Formatter().parse(token) if f]
+            for field in fields:
+                if field not in names:
+                    raise ValueError(f"Unknown parameter {field!r} in {token!r}")
+            if not fields:
+                self.argv.append(
+                    resolve_executable(name=token) if position == 0 else token
+                )
+                continue
+            self.argv.append(None)
+            if token == "{" + fields[0] + "}":
+                self.slots.append((position, fields[0]))
+            else:
+                self.formats.append((position, token))
+        self.env = dict(os.environ, **(environment or {}))
+
+    @classmethod
+    def compile(cls, run_config: ModuleType) -> "LaunchSpec":
+        """Compiles the argv template declared in a workload's run configuration.
+
+        Args:
+            run_config: The run configuration module.
+
+        Returns:
+            The launch spec.
+        """
+        return cls(
+            command=run_config.command,
+            parameters=getattr(run_config, "parameters", None),
+            environment=getattr(run_config, "environment", None),
+        )
+
+    def fill(self, seed: int, bin_path: str) -> List[str]:
+        """Fills the template for a task.
+
+        Args:
+            seed: The iteration seed.
+            bin_path: The absolute path to the workload's executable.
+
+        Returns:
+            The command-line arguments.
+        """
+        values = {"bin_path": bin_path, "seed": seed}
+        for name, draw, index in self.parameters:
+            values[name] = draw(seed, index)
+        argv = self.argv.copy()
+        for position, field in self.slots:
+            argv[position] = str(values[field])
+        for position, token in self.formats:
+            argv[position] = token.format_map(values)
+        return argv
+
+
+class Workload:
+    """Class definition for the functions shared by every workload.
+
+    A workload module subclasses Workload and sets spec to the launch spec
+    compiled from its run configuration. Subclasses only need to override a
+    method when their launch or verdict cannot be declared.
+
+    Attributes:
+        spec: The launch spec compiled from the run configuration.
+        run_config: The run configuration module.
+        verdict: The pass/fail markers declared in the run configuration.
+        resources: The resource hints declared in the run configuration.
+        is_in_process: Whether the workload is a Python routine that can run in a warm worker.
+    """
+
+    spec: LaunchSpec = None
+    run_config: ModuleType = None
+    is_in_process = False
+
+    def __init__(self):
+        """Initializes an instance from the Workload class."""
+        self.verdict = Verdict(
+            pass_patterns=self.run_config.pass_patterns,
+            fail_patterns=self.run_config.fail_patterns,
+        )
+        self.resources = getattr(self.run_config, "resources", {})
+
+    def generate_random(self, low: int, high: int, seed: int) -> int:
+        """Picks a random integer from a range of integers.
+
+        Args:
+            low: The lowest integer in the range.
+            high: The highest integer in the range.
+            seed: The input seed for the bit generator.
+
+        Returns:
+            The random integer.
+        """
+        return draw_integer(low=low, high=high, seed=seed)
+
+    def get_command(self, seed: int, bin_path: str) -> List[str]:
+        """Builds the command-line for running the workload's executable.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The absolute path to the workload's executable.
+
+        Returns:
+            The command-line arguments.
+        """
+        return self.spec.fill(seed=seed, bin_path=bin_path)
+
+    def run(
+        self,
+        seed: int,
+        bin_path: str,
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float] = None,
+        scanner: Optional[VerdictScanner] = None,
+        groups: Optional[ProcessGroups] = None,
+    ) -> Tuple[int, ResourceUsage]:
+        """Runs the workload.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The absolute path to the workload's executable.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the executable's process group is killed.
+            scanner: If set, stdout is piped through this scanner on its way to the log.
+            groups: The process groups the executable is tracked in until it is reaped, if any.
+
+        Returns:
+            The exit code and resource usage of the workload's executable.
+
+        Raises:
+            TaskTimeout: If the executable was killed for running past its timeout.
+        """
+        argv = self.get_command(seed=seed, bin_path=bin_path)
+        if scanner is not None:
+            return Tee(scanner=scanner).run(
+                argv=argv,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+                timeout=timeout,
+                env=self.spec.env,
+                groups=groups,
+            )
+        process = spawn_process(
+            argv=argv,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+            env=self.spec.env,
+        )
+        return wait_with_usage(process=process, timeout=timeout, groups=groups)
+
+    def run_task(
+        self,
+        seed: int,
+        bin_path: str,
+        stdout_path: str,
+        stderr_path: str,
+        timeout: Optional[float] = None,
+        scanner: Optional[VerdictScanner] = None,
+        groups: Optional[ProcessGroups] = None,
+    ) -> Tuple[int, ResourceUsage, bool]:
+        """Runs a task of the workload, reporting a timeout instead of raising it.
+
+        Every backend that runs tasks in the runner's own host goes through
+        this method and check_task(), so tasks are judged the same everywhere.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The absolute path to the workload's executable.
+            stdout_path: The absolute path to the stdout log file.
+            stderr_path: The absolute path to the stderr log file.
+            timeout: The number of seconds after which the executable's process group is killed.
+            scanner: If set, stdout is piped through this scanner on its way to the log.
+            groups: The process groups the executable is tracked in until it is reaped, if any.
+
+        Returns:
+            The exit code and resource usage of the workload's executable, and whether
+            it was killed for running past its timeout.
+        """
+        try:
+            exit_code, usage = self.run(
+                seed=seed,
+                bin_path=bin_path,
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+                timeout=timeout,
+                scanner=scanner,
+                groups=groups,
+            )
+        except TaskTimeout as error:
+            return error.exit_code, error.usage, True
+        return exit_code, usage, False
+
+    def check_task(
+        self,
+        stdout_path: str,
+        exit_code: int = 0,
+        is_timeout: bool = False,
+        scanner: Optional[VerdictScanner] = None,
+    ) -> bool:
+        """Decides whether a finished task passed.
+
+        A workload that declares no pass or fail markers fails on a non-zero exit code,
+        as its output is not checked unless it overrides process_output().
+
+        Args:
+            stdout_path: The absolute path to the stdout log file.
+            exit_code: The exit code of the workload's executable.
+            is_timeout: Whether the task was killed for running past its timeout, which fails it.
+            scanner: The scanner that checked the output while it was written, if any.
+                Otherwise the stdout log is read back.
+
+        Returns:
+            Whether the task passed.
+
+        Raises:
+            FileNotFoundError: If the stdout log had to be read back and is missing.
+        """
+        if is_timeout:
+            return False
+        if self.verdict.is_empty and exit_code != 0:
+            return False
+        if scanner is not None:
+            return scanner.result()
+        return self.process_output(stdout_path=stdout_path)
+
+    def process_output(self, stdout_path: str) -> bool:
+        """Processes the test output to determine whether the test passed or failed.
+
+        Args:
+            stdout_path: The absolute path to the stdout log file.
+
+        Returns:
+            Whether the test passed or failed.
+        """
+        return self.verdict.scan_file(stdout_path=stdout_path)
+
+
+class InProcessWorkload(Workload, abc.ABC):
+    """Class definition for a workload that is a Python routine rather than an executable.
+
+    A subclass must implement execute(), or it cannot be instantiated. In a
+    warm pool, execute() runs inside a long-lived worker process that has
+    already created the Workload object. Otherwise each task starts a fresh
+    interpreter through utils.warm_pool, which creates the Workload object and
+    calls execute() once. Either way, the routine's standard output and
+    standard error go to the task's logs. The run configuration's bin_path
+    names the routine each attribute runs.
+
+    Attributes:
+        spec: The launch spec of the fresh interpreter started for each task outside a warm pool.
+    """
+
+    spec = LaunchSpec(
+        command=[sys.executable, "-m", "utils.warm_pool"],
+        # The fresh interpreter finds utils and workloads from any directory.
+        environment={
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")])
+            )
+        },
+    )
+    is_in_process = True
+
+    def get_command(self, seed: int, bin_path: str) -> List[str]:
+        """Builds the command-line for running the routine in a fresh interpreter.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The name of the routine to run.
+
+        Returns:
+            The command-line arguments.
+        """
+        return self.spec.argv + [type(self).__module__, str(seed), bin_path]
+
+    @abc.abstractmethod
+    def execute(self, seed: int, bin_path: str) -> Optional[int]:
+        """Runs the routine once.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The name of the routine to run.
+
+        Returns:
+            The exit code of the task. None counts as 0.
+        """
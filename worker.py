@@ -0,0 +1,27 @@
+"""This is the script which launches a Workload-Runner worker for a distributed run.
+
+Please see the README.md file for example command-lines.
+"""
+
+from utils.args import Args
+from utils.distributed import Worker
+
+
+def main():
+    args_parser = Args()
+    args = args_parser.get_worker_parser().parse_args()
+    host, port = args_parser.split_address(address=args.connect)
+    worker = Worker(
+        host=host,
+        port=port,
+        slots=args.slots,
+        token=args.token,
+        retention=args.retention,
+        placement=args.placement,
+        log_path=args.log_dir,
+    )
+    worker.serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,18 @@ Typical usage example:
 
 from pathlib import Path
 
+from utils.workload import Integer
+
 
 attributes = ["wl_1"]
+command = ["sh", "{bin_path}", "-n", "{num}"]
+parameters = {"num": Integer(low=0, high=100)}
+pass_patterns = ["The number picked is :"]
+fail_patterns = []
+timeout = None
+resources = {"cpus": 1}
+weight = 1.0
+attribute_weights = {"wl_1": 1.0}
 bin_path = {
     "wl_1": str(
         Path(__file__)
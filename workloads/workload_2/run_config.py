@@ -6,9 +6,22 @@ Typical usage example:
 """
 
 from pathlib import Path
+import string
+
+from utils.workload import Choice
 
 
 attributes = ["wl_2"]
+command = ["sh", "{bin_path}", "-n", "{letter}"]
+# Letters are drawn from a to y, as they always have been, so recorded seeds
+# still pick the same letter.
+parameters = {"letter": Choice(string.ascii_lowercase[:25])}
+pass_patterns = ["The letter picked is :"]
+fail_patterns = []
+timeout = None
+resources = {"cpus": 1}
+weight = 1.0
+attribute_weights = {"wl_2": 1.0}
 bin_path = {
     "wl_2": str(
         Path(__file__)
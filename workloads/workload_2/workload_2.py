@@ -11,69 +11,16 @@ Typical usage example:
   )
 """
 
-import numpy as np
-import string
-import subprocess
+from utils.workload import LaunchSpec, Workload as BaseWorkload
+from . import run_config
 
 
-class Workload:
-    """Class definition for handling the workload's functions."""
+class Workload(BaseWorkload):
+    """Class definition for handling the workload's functions.
 
-    def __init__(self):
-        """Initializes an instance from the Workload class."""
-        pass
+    The command-line, parameters and pass/fail markers are declared in the
+    run configuration.
+    """
 
-    def generate_random(self, low: int, high: int, seed: int) -> int:
-        """Picks a random integer from a range of integers.
-
-        Args:
-            low: The lowest integer in the range.
-            high: The highest integer in the range.
-            seed: The input seed for the bit generator.
-
-        Returns:
-            The random integer.
-        """
-        rng = np.random.default_rng(seed=seed)
-        self.number = rng.integers(low=low, high=high, size=1)
-        return self.number[0]
-
-    def run(self, seed: int, bin_path: str, stdout_path: str, stderr_path: str):
-        """Runs the workload.
-
-        Args:
-            seed: The input seed for the bit generator.
-            bin_path: The absolute path to the workload's executable.
-            stdout_path: The absolute path to the stdout log file.
-            stderr_path: The absolute path to the stderr log file.
-
-        Returns:
-            The random letter.
-        """
-        self.letters = string.ascii_lowercase
-        self.index = self.generate_random(low=0, high=25, seed=seed)
-        self.letter = self.letters[self.index]
-        with open(stdout_path, "a") as stdout_file, open(
-            stderr_path, "a"
-        ) as stderr_file:
-            subprocess.run(
-                ["sh", bin_path, "-n", self.letter],
-                stdout=stdout_file,
-                stderr=stderr_file,
-            )
-
-    def process_output(self, stdout_path: str) -> bool:
-        """Processes the test output to determine whether the test passed or failed.
-
-        Args:
-            stdout_path: The absolute path to the stdout log file.
-
-        Returns:
-            Whether the test passed or failed.
-        """
-        regex_pattern = "The letter picked is :"
-        with open(stdout_path, "r") as stdout_file:
-            content = stdout_file.read()
-        if regex_pattern not in content:
-            return False
-        return True
+    run_config = run_config
+    spec = LaunchSpec.compile(run_config)
@@ -0,0 +1,16 @@
+"""This module contains the run configurations for Workload_3.
+
+Typical usage example:
+
+  wl_3_routine = bin_path["wl_3_sort"]
+"""
+
+attributes = ["wl_3_sort", "wl_3_hash"]
+pass_patterns = ["The checksum is :"]
+fail_patterns = ["check failed"]
+timeout = None
+resources = {"cpus": 1}
+weight = 1.0
+attribute_weights = {"wl_3_sort": 1.0, "wl_3_hash": 1.0}
+# Workload_3 runs in-process, so bin_path names the routine of each attribute.
+bin_path = {"wl_3_sort": "sort", "wl_3_hash": "hash"}
@@ -0,0 +1,57 @@
+"""This module contains functions for Workload_3.
+
+Typical usage example:
+
+  wl = Workload()
+  exit_code = wl.execute(seed=123, bin_path="sort")
+"""
+
+import hashlib
+import random
+
+from utils.workload import InProcessWorkload
+from . import run_config
+
+
+class Workload(InProcessWorkload):
+    """Class definition for handling the workload's functions.
+
+    Attributes:
+        block: The data block hashed by the hash routine, built once per process.
+        count: The number of integers sorted by the sort routine.
+        rounds: The number of digests chained by the hash routine.
+    """
+
+    run_config = run_config
+
+    def __init__(self):
+        """Initializes an instance from the Workload class."""
+        super().__init__()
+        self.block = random.Random(0).randbytes(1 << 20)
+        self.count = 20000
+        self.rounds = 16
+
+    def execute(self, seed: int, bin_path: str) -> int:
+        """Runs the sort or hash routine once.
+
+        Args:
+            seed: The input seed for the bit generator.
+            bin_path: The routine to run ("sort" or "hash").
+
+        Returns:
+            The exit code of the task.
+        """
+        rng = random.Random(seed)
+        if bin_path == "sort":
+            data = sorted(rng.getrandbits(32) for _ in range(self.count))
+            if any(a > b for a, b in zip(data, data[1:])):
+                print("Sort check failed")
+                return 1
+            checksum = sum(data[::97]) & 0xFFFFFFFF
+        else:
+            digest = rng.randbytes(32)
+            for _ in range(self.rounds):
+                digest = hashlib.sha256(digest + self.block).digest()
+            checksum = int.from_bytes(digest[:4], "big")
+        print(f"The checksum is : {checksum}")
+        return 0